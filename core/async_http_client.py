@@ -0,0 +1,235 @@
+"""
+asyncio 기반 HTTP 클라이언트
+하나의 이벤트 루프 스레드에서 수많은 요청을 동시에 처리
+"""
+import asyncio
+import time
+from typing import Dict, List, Optional, Set
+import aiohttp
+from models.request_model import RequestModel
+from models.response_model import ResponseModel
+from models.environment import EnvironmentManager
+from core.http_client import HttpClient
+
+
+class AsyncHttpClient:
+    """
+    비동기 HTTP 클라이언트
+
+    HttpClient 와 같은 send_request(RequestModel) -> ResponseModel 계약을 가지며,
+    하나의 aiohttp.ClientSession 을 통해 연결을 재사용한다.
+    """
+
+    DEFAULT_TIMEOUT = HttpClient.DEFAULT_TIMEOUT  # 기본 타임아웃 (초)
+    DEFAULT_LIMIT = 100  # 전체 동시 연결 수
+    DEFAULT_LIMIT_PER_HOST = 0  # 호스트별 동시 연결 수 (0 = 무제한)
+
+    def __init__(self, env_manager: EnvironmentManager, limit: int = DEFAULT_LIMIT,
+                 limit_per_host: int = DEFAULT_LIMIT_PER_HOST):
+        self.env_manager = env_manager
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        # 변수 치환/인증/Body 처리는 동기 클라이언트와 공유
+        self._preparer = HttpClient(env_manager)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def __aenter__(self) -> 'AsyncHttpClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """ClientSession 가져오기 (실행 중인 이벤트 루프에서 지연 생성)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host)
+            self._session = aiohttp.ClientSession(connector=connector, trace_configs=[self._create_trace_config()])
+        return self._session
+
+    @staticmethod
+    def _create_trace_config() -> aiohttp.TraceConfig:
+        """연결 단계 시각을 요청별 trace_request_ctx(dict) 에 기록하는 TraceConfig"""
+        def mark(name):
+            async def on_event(session, context, params):
+                if isinstance(context.trace_request_ctx, dict):
+                    context.trace_request_ctx[name] = time.perf_counter()
+            return on_event
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_dns_resolvehost_start.append(mark('dns_start'))
+        trace_config.on_dns_resolvehost_end.append(mark('dns_end'))
+        trace_config.on_connection_create_start.append(mark('connect_start'))
+        trace_config.on_connection_create_end.append(mark('connect_end'))
+        return trace_config
+
+    @staticmethod
+    def _build_timings(marks: Dict[str, float], started_at: float, headers_at: float,
+                       finished_at: float) -> Dict[str, float]:
+        """
+        단계별 소요 시간 (ms) 계산
+
+        aiohttp 는 TLS 핸드셰이크를 연결 생성에 포함하므로 connect 에 TLS 시간이 포함된다.
+        """
+        timings = {}
+        dns_ms = 0.0
+        if 'dns_start' in marks and 'dns_end' in marks:
+            dns_ms = (marks['dns_end'] - marks['dns_start']) * 1000
+            timings['dns'] = dns_ms
+        if 'connect_start' in marks and 'connect_end' in marks:
+            timings['connect'] = (marks['connect_end'] - marks['connect_start']) * 1000 - dns_ms
+        timings['wait'] = (headers_at - marks.get('connect_end', started_at)) * 1000
+        timings['download'] = (finished_at - headers_at) * 1000
+        timings['total'] = (finished_at - started_at) * 1000
+        return timings
+
+    async def send_request(self, request: RequestModel, runtime_data: Dict = None,
+                           runtime_files: Dict = None, timeout: float = None) -> ResponseModel:
+        """
+        HTTP 요청 전송
+
+        Args:
+            request: 요청 모델
+            timeout: 요청별 전체 타임아웃 (초, None이면 기본값)
+
+        Returns:
+            응답 모델
+
+        Raises:
+            asyncio.CancelledError: 요청이 취소된 경우 (send_many 는 에러 응답으로 변환)
+        """
+        task = asyncio.current_task()
+        if task is not None:
+            self._tasks.add(task)
+
+        response_model = ResponseModel()
+
+        try:
+            prepared = self._preparer.prepare_request(request, runtime_data, runtime_files)
+            auth = prepared['auth']
+
+            # 단계별 시간은 단조 시계로 기록
+            marks: Dict[str, float] = {}
+            start_time = time.perf_counter()
+
+            async with self._get_session().request(
+                method=prepared['method'],
+                url=prepared['url'],
+                headers=prepared['headers'],
+                params=prepared['params'],
+                data=self._build_body(prepared['data'], prepared['files']),
+                auth=aiohttp.BasicAuth(auth.username, auth.password) if auth else None,
+                timeout=aiohttp.ClientTimeout(total=timeout or self.DEFAULT_TIMEOUT),
+                allow_redirects=True,
+                trace_request_ctx=marks,
+            ) as response:
+                headers_at = time.perf_counter()
+                body_bytes = await response.read()
+                finished_at = time.perf_counter()
+
+                # 응답 처리
+                response_model.status_code = response.status
+                response_model.status_text = response.reason or ''
+                response_model.headers = dict(response.headers)
+                response_model.timings = self._build_timings(marks, start_time, headers_at, finished_at)
+                response_model.elapsed_ms = response_model.timings['total']
+                response_model.size_bytes = len(body_bytes)
+                response_model.content_type = response.headers.get('Content-Type', '')
+
+                # Body 처리 - 텍스트는 접근 시점에 디코딩
+                try:
+                    response_model.encoding = response.get_encoding()
+                except Exception:
+                    response_model.encoding = 'utf-8'
+                response_model.body_bytes = body_bytes
+
+        except asyncio.CancelledError:
+            response_model.error = "Request cancelled"
+            raise
+        except asyncio.TimeoutError:
+            response_model.error = "Request timeout"
+        except aiohttp.ClientConnectionError as e:
+            response_model.error = f"Connection error: {str(e)}"
+        except aiohttp.ClientError as e:
+            response_model.error = f"Request error: {str(e)}"
+        except Exception as e:
+            response_model.error = f"Unexpected error: {str(e)}"
+        finally:
+            if task is not None:
+                self._tasks.discard(task)
+
+        return response_model
+
+    async def send_many(self, requests: List[RequestModel], concurrency: int = None,
+                        timeout: float = None) -> List[ResponseModel]:
+        """
+        여러 요청을 동시에 전송
+
+        Args:
+            requests: 요청 모델 목록
+            concurrency: 최대 동시 요청 수 (None이면 연결 제한만 적용)
+            timeout: 요청별 타임아웃 (초)
+
+        Returns:
+            요청 순서와 같은 순서의 응답 모델 목록
+        """
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+        async def send_one(req: RequestModel) -> ResponseModel:
+            if semaphore is None:
+                return await self.send_request(req, timeout=timeout)
+            async with semaphore:
+                return await self.send_request(req, timeout=timeout)
+
+        tasks = [asyncio.ensure_future(send_one(req)) for req in requests]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        responses = []
+        for result in results:
+            if isinstance(result, BaseException):
+                response_model = ResponseModel()
+                if isinstance(result, asyncio.CancelledError):
+                    response_model.error = "Request cancelled"
+                else:
+                    response_model.error = f"Unexpected error: {str(result)}"
+                responses.append(response_model)
+            else:
+                responses.append(result)
+        return responses
+
+    def cancel_all(self) -> int:
+        """
+        진행 중인 모든 요청 취소
+
+        Returns:
+            취소 요청된 작업 수
+        """
+        tasks = [task for task in self._tasks if not task.done()]
+        for task in tasks:
+            task.cancel()
+        return len(tasks)
+
+    async def close(self):
+        """세션 종료"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._preparer.close()
+
+    @staticmethod
+    def _build_body(data, files):
+        """requests 형식의 data/files 를 aiohttp 형식으로 변환"""
+        if not files:
+            return data
+
+        form = aiohttp.FormData()
+        if isinstance(data, dict):
+            for key, value in data.items():
+                form.add_field(key, value)
+        for key, value in files.items():
+            filename, content = value[0], value[1]
+            content_type = value[2] if len(value) > 2 else None
+            if filename is None:
+                form.add_field(key, content)
+            else:
+                form.add_field(key, content, filename=filename, content_type=content_type)
+        return form
@@ -0,0 +1,215 @@
+"""
+폴더(컬렉션) 단위로 요청을 동시에 실행하는 러너
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable
+from urllib.parse import urlsplit
+from models.request_model import RequestModel, RetryPolicy
+from models.response_model import ResponseModel
+from core.http_client import HttpClient
+from utils.variable_resolver import VariableResolver
+
+
+class RunResult:
+    """단일 요청 실행 결과"""
+
+    def __init__(self, request: RequestModel, response: ResponseModel, host: str):
+        self.request = request
+        self.response = response
+        self.host = host
+
+    @property
+    def passed(self) -> bool:
+        """에러 없이 4xx/5xx 가 아닌 응답을 받았는지 여부"""
+        return not self.response.is_error() and 0 < self.response.status_code < 400
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환 (응답 본문 제외)"""
+        return {
+            'request_id': self.request.id,
+            'name': self.request.name,
+            'method': self.request.method.value,
+            'host': self.host,
+            'passed': self.passed,
+            'status_code': self.response.status_code,
+            'status_text': self.response.status_text,
+            'elapsed_ms': self.response.elapsed_ms,
+            'timings': self.response.timings,
+            'attempts': len(self.response.attempts) or 1,
+            'size_bytes': self.response.size_bytes,
+            'error': self.response.error,
+        }
+
+
+class CollectionRunReport:
+    """컬렉션 실행 결과 집계"""
+
+    def __init__(self):
+        self.started_at = datetime.now()
+        self.elapsed_ms: float = 0.0
+        self.results: List[RunResult] = []
+
+    @property
+    def total(self) -> int:
+        return len(self.results)
+
+    @property
+    def passed(self) -> int:
+        return sum(1 for result in self.results if result.passed)
+
+    @property
+    def failed(self) -> int:
+        return self.total - self.passed
+
+    def is_success(self) -> bool:
+        """모든 요청이 통과했는지 확인"""
+        return self.failed == 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        status_counts: Dict[str, int] = {}
+        hosts: Dict[str, Dict[str, int]] = {}
+        for result in self.results:
+            key = str(result.response.status_code) if not result.response.is_error() else 'error'
+            status_counts[key] = status_counts.get(key, 0) + 1
+
+            host_stats = hosts.setdefault(result.host, {'total': 0, 'failed': 0})
+            host_stats['total'] += 1
+            if not result.passed:
+                host_stats['failed'] += 1
+
+        latencies = sorted(r.response.elapsed_ms for r in self.results if not r.response.is_error())
+
+        return {
+            'started_at': self.started_at.isoformat(),
+            'elapsed_ms': self.elapsed_ms,
+            'total': self.total,
+            'passed': self.passed,
+            'failed': self.failed,
+            'success': self.is_success(),
+            'status_counts': status_counts,
+            'hosts': hosts,
+            'avg_ms': sum(latencies) / len(latencies) if latencies else 0.0,
+            'max_ms': latencies[-1] if latencies else 0.0,
+            'results': [result.to_dict() for result in self.results],
+        }
+
+
+class CollectionRunner:
+    """
+    요청 목록을 제한된 스레드 풀에서 동시에 실행
+
+    호스트별 동시 실행 수는 per_host_limit 으로 제한되며,
+    결과는 원래 요청 순서대로 리포트에 담긴다.
+    retry_policy_for 를 주면 요청별 재시도 정책(폴더 정책 포함)을 적용한다 (run 만 해당).
+    """
+
+    DEFAULT_MAX_WORKERS = 8
+    DEFAULT_PER_HOST_LIMIT = 4
+
+    def __init__(self, http_client: HttpClient, max_workers: int = DEFAULT_MAX_WORKERS,
+                 per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+                 retry_policy_for: Optional[Callable[[RequestModel], Optional[RetryPolicy]]] = None):
+        self.http_client = http_client
+        self.retry_policy_for = retry_policy_for
+        self.max_workers = max(1, max_workers)
+        self.per_host_limit = max(1, per_host_limit)
+        self._host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def run(self, requests: List[RequestModel],
+            on_result: Optional[Callable[[RunResult], None]] = None) -> CollectionRunReport:
+        """
+        요청들을 동시에 실행
+
+        Args:
+            requests: 실행할 요청 목록 (ProjectManager.get_all_requests 결과 등)
+            on_result: 요청이 끝날 때마다 호출되는 콜백 (완료 순서)
+
+        Returns:
+            실행 결과 리포트
+        """
+        report = CollectionRunReport()
+        start_time = time.time()
+
+        variables = self.http_client.get_variables()
+        results: List[Optional[RunResult]] = [None] * len(requests)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='lumina-runner') as executor:
+            futures = {
+                executor.submit(self._execute, request, variables): index
+                for index, request in enumerate(requests)
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                results[futures[future]] = result
+                if on_result:
+                    on_result(result)
+
+        report.results = [result for result in results if result is not None]
+        report.elapsed_ms = (time.time() - start_time) * 1000
+        return report
+
+    def run_async(self, requests: List[RequestModel]) -> CollectionRunReport:
+        """
+        요청들을 하나의 asyncio 이벤트 루프에서 동시에 실행 (AsyncHttpClient 사용)
+
+        스레드를 요청 수만큼 점유하지 않으므로 max_workers 를 크게 잡을 수 있다.
+        동기 HttpClient 의 쿠키는 공유되지 않는다.
+
+        Args:
+            requests: 실행할 요청 목록
+
+        Returns:
+            실행 결과 리포트
+        """
+        from core.async_http_client import AsyncHttpClient
+
+        report = CollectionRunReport()
+        start_time = time.time()
+        variables = self.http_client.get_variables()
+
+        async def run_all():
+            async with AsyncHttpClient(self.http_client.env_manager, limit=self.max_workers,
+                                       limit_per_host=self.per_host_limit) as client:
+                return await client.send_many(requests, concurrency=self.max_workers)
+
+        responses = asyncio.run(run_all())
+
+        report.results = [
+            RunResult(request, response, self._get_host(request, variables))
+            for request, response in zip(requests, responses)
+        ]
+        report.elapsed_ms = (time.time() - start_time) * 1000
+        return report
+
+    def _execute(self, request: RequestModel, variables: Dict[str, str]) -> RunResult:
+        """호스트별 제한을 지키며 단일 요청 실행"""
+        host = self._get_host(request, variables)
+        semaphore = self._get_host_semaphore(host)
+
+        retry_policy = self.retry_policy_for(request) if self.retry_policy_for else None
+        # 재시도 대기 중에도 호스트 슬롯을 유지 (불안정한 호스트에 요청이 몰리지 않도록)
+        with semaphore:
+            response = self.http_client.send_request(request, retry_policy=retry_policy)
+
+        return RunResult(request, response, host)
+
+    def _get_host_semaphore(self, host: str) -> threading.BoundedSemaphore:
+        """호스트별 세마포어 가져오기 (없으면 생성)"""
+        with self._lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._host_semaphores[host]
+
+    @staticmethod
+    def _get_host(request: RequestModel, variables: Dict[str, str]) -> str:
+        """변수 치환 후 URL 에서 호스트 추출"""
+        url = VariableResolver.resolve(request.url, variables) or ''
+        if '://' not in url:
+            url = 'http://' + url
+        return urlsplit(url).netloc.lower()
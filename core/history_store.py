@@ -0,0 +1,183 @@
+"""
+요청 실행 히스토리 저장소
+세션/프로젝트별 실행 기록을 SQLite 에 보관하고 조건별로 조회한다.
+"""
+import json
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from utils.sqlite_utils import ThreadLocalConnections
+
+
+class HistoryStore:
+    """
+    SQLite 히스토리 저장소 (WAL 모드, 추가 위주)
+
+    항목 하나가 한 행이며, 목록/필터에 쓰는 값(요청 ID, 시간, 상태 코드, 메서드)은
+    인덱스가 걸린 열에 두고 나머지는 HistoryEntry.to_dict() 결과를 JSON 으로 저장한다.
+    여러 워커 프로세스가 같은 DB 파일을 공유할 수 있다.
+    """
+
+    BUSY_TIMEOUT_MS = 5000
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT NOT NULL,
+            project_id TEXT NOT NULL,
+            request_id TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            method TEXT,
+            status_code INTEGER,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_history_request
+            ON history (session_id, project_id, request_id, created_at);
+        CREATE INDEX IF NOT EXISTS idx_history_created
+            ON history (session_id, project_id, created_at);
+        CREATE INDEX IF NOT EXISTS idx_history_status
+            ON history (session_id, project_id, status_code, created_at);
+        CREATE INDEX IF NOT EXISTS idx_history_age ON history (created_at);
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = str(db_path)
+        self._connections = ThreadLocalConnections(self.db_path, self.BUSY_TIMEOUT_MS)
+
+        conn = self._connections.get()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript(self.SCHEMA)
+
+    def add(self, session_id: str, project_id: str, request_id: str, created_at: float,
+            entry: Dict[str, Any]) -> int:
+        """
+        히스토리 항목 추가
+
+        Args:
+            session_id: 세션 ID
+            project_id: 프로젝트 ID
+            request_id: 요청 ID
+            created_at: 실행 시각 (epoch 초)
+            entry: HistoryEntry.to_dict() 결과
+
+        Returns:
+            항목 ID
+        """
+        data = json.dumps(entry, ensure_ascii=False)
+        cursor = self._connections.get().execute(
+            """
+            INSERT INTO history (session_id, project_id, request_id, created_at, method, status_code, data)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (session_id, project_id, request_id, created_at,
+             entry['request'].get('method'), entry['response'].get('status_code'), data)
+        )
+        return cursor.lastrowid
+
+    def query(self, session_id: str, project_id: str, request_id: Optional[str] = None,
+              status_range: Optional[Tuple[int, int]] = None, method: Optional[str] = None,
+              since: Optional[float] = None, until: Optional[float] = None,
+              limit: int = 50, offset: int = 0) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        조건에 맞는 항목 조회 (최신순)
+
+        Args:
+            session_id: 세션 ID
+            project_id: 프로젝트 ID
+            request_id: 요청 ID (None이면 프로젝트 전체)
+            status_range: 상태 코드 범위 (최소, 최대) - 양 끝 포함
+            method: HTTP 메서드
+            since: 이 시각 이후 (epoch 초, 포함)
+            until: 이 시각 이전 (epoch 초, 미포함)
+            limit: 최대 개수
+            offset: 건너뛸 개수
+
+        Returns:
+            (조건에 맞는 전체 개수, 항목 목록)
+        """
+        where = ['session_id = ?', 'project_id = ?']
+        params: List[Any] = [session_id, project_id]
+        if request_id is not None:
+            where.append('request_id = ?')
+            params.append(request_id)
+        if status_range is not None:
+            where.append('status_code BETWEEN ? AND ?')
+            params.extend(status_range)
+        if method:
+            where.append('method = ?')
+            params.append(method.upper())
+        if since is not None:
+            where.append('created_at >= ?')
+            params.append(since)
+        if until is not None:
+            where.append('created_at < ?')
+            params.append(until)
+        where_sql = ' AND '.join(where)
+
+        conn = self._connections.get()
+        # 개수와 페이지를 같은 스냅샷에서 읽음
+        conn.execute('BEGIN')
+        try:
+            total = conn.execute(f'SELECT COUNT(*) FROM history WHERE {where_sql}', params).fetchone()[0]
+            rows = conn.execute(
+                f'SELECT id, request_id, data FROM history WHERE {where_sql} '
+                f'ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?',
+                (*params, limit, offset)
+            ).fetchall()
+        finally:
+            conn.execute('COMMIT')
+
+        entries = []
+        for entry_id, entry_request_id, data in rows:
+            entry = json.loads(data)
+            entry['id'] = entry_id
+            entry['request_id'] = entry_request_id
+            entries.append(entry)
+        return total, entries
+
+    def list_request_ids(self, session_id: str, project_id: str) -> List[str]:
+        """히스토리가 있는 요청 ID 목록"""
+        rows = self._connections.get().execute(
+            'SELECT DISTINCT request_id FROM history WHERE session_id = ? AND project_id = ?',
+            (session_id, project_id)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def clear(self, session_id: str, project_id: Optional[str] = None, request_id: Optional[str] = None) -> int:
+        """
+        히스토리 삭제
+
+        Args:
+            session_id: 세션 ID
+            project_id: 프로젝트 ID (None이면 세션 전체)
+            request_id: 요청 ID (None이면 프로젝트 전체)
+
+        Returns:
+            삭제한 항목 수
+        """
+        where = ['session_id = ?']
+        params: List[Any] = [session_id]
+        if project_id is not None:
+            where.append('project_id = ?')
+            params.append(project_id)
+            if request_id is not None:
+                where.append('request_id = ?')
+                params.append(request_id)
+        cursor = self._connections.get().execute(f'DELETE FROM history WHERE {" AND ".join(where)}', params)
+        return cursor.rowcount
+
+    def prune(self, older_than: float) -> int:
+        """
+        오래된 항목 삭제
+
+        Args:
+            older_than: 이 시각(epoch 초) 이전 항목을 삭제
+
+        Returns:
+            삭제한 항목 수
+        """
+        cursor = self._connections.get().execute('DELETE FROM history WHERE created_at < ?', (older_than,))
+        return cursor.rowcount
+
+    def close(self):
+        """저장소 닫기"""
+        self._connections.close_all()
@@ -1,14 +1,21 @@
 """
 HTTP 요청을 처리하는 클라이언트
 """
-import requests
-from typing import Dict
+import copy
+import os
+import tempfile
 import time
+import requests
+from urllib3 import exceptions as urllib3_exceptions
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 import json
-from models.request_model import RequestModel, HttpMethod, BodyType
+from models.request_model import RequestModel, RetryPolicy, HttpMethod, BodyType
 from models.response_model import ResponseModel
 from models.environment import EnvironmentManager
 from core.auth_manager import AuthManager
+from core.load_tester import LoadTester, LoadTestResult
+from core.request_trace import RequestTrace, TraceCallback, TracingHTTPAdapter
 from utils.variable_resolver import VariableResolver
 
 
@@ -16,122 +23,416 @@ class HttpClient:
     """HTTP 클라이언트"""
 
     DEFAULT_TIMEOUT = 30  # 기본 타임아웃 (초)
-
-    def __init__(self, env_manager: EnvironmentManager):
+    MAX_IN_MEMORY_BYTES = 10 * 1024 * 1024  # 스트리밍 시 메모리에 유지할 최대 본문 크기
+    CHUNK_SIZE = 64 * 1024  # 스트리밍 읽기 단위
+    DEFAULT_POOL_CONNECTIONS = 10  # 연결 풀을 유지할 호스트 수
+    DEFAULT_POOL_MAXSIZE = 32  # 호스트별로 유지할 최대 연결 수 (컬렉션 병렬 실행 수에 맞춤)
+
+    def __init__(self, env_manager: EnvironmentManager, max_in_memory_bytes: int = MAX_IN_MEMORY_BYTES,
+                 pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 pool_block: bool = False, keep_alive: bool = True,
+                 adapter: Optional[TracingHTTPAdapter] = None):
+        """
+        Args:
+            env_manager: 환경 변수 관리자
+            max_in_memory_bytes: 스트리밍 시 메모리에 유지할 최대 본문 크기
+            pool_connections: 연결 풀을 유지할 호스트 수
+            pool_maxsize: 호스트별로 유지할 최대 연결 수
+            pool_block: True 이면 호스트별 연결이 pool_maxsize 에 도달했을 때 새로 열지 않고 대기
+            keep_alive: False 이면 요청마다 연결을 닫음 (Connection: close)
+            adapter: 다른 클라이언트와 공유할 어댑터 (create_adapter 로 생성).
+                     연결 풀만 공유하고 쿠키 등 세션 상태는 클라이언트별로 유지되며,
+                     close() 에서 공유 어댑터는 닫지 않는다.
+        """
         self.env_manager = env_manager
+        self.max_in_memory_bytes = max_in_memory_bytes
         self.session = requests.Session()
 
-    def send_request(self, request: RequestModel, runtime_data: Dict = None, runtime_files: Dict = None) -> ResponseModel:
+        # 연결 단계(DNS/연결/TLS/첫 바이트) 기록용 어댑터
+        self._owns_adapter = adapter is None
+        if adapter is None:
+            adapter = self.create_adapter(pool_connections, pool_maxsize, pool_block)
+        self.adapter = adapter
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
+
+        # 이 클라이언트가 요청한 (scheme, host, port) - 공유 풀 통계를 거를 때 사용
+        self._origins = set()
+
+    @classmethod
+    def create_adapter(cls, pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                       pool_maxsize: int = DEFAULT_POOL_MAXSIZE, pool_block: bool = False) -> TracingHTTPAdapter:
+        """
+        연결 풀 어댑터 생성 (여러 HttpClient 가 공유할 수 있음)
+
+        Args:
+            pool_connections: 연결 풀을 유지할 호스트 수
+            pool_maxsize: 호스트별로 유지할 최대 연결 수
+            pool_block: 호스트별 연결이 pool_maxsize 에 도달하면 대기
+
+        Returns:
+            어댑터
+        """
+        return TracingHTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                  pool_block=pool_block)
+
+    def get_pool_stats(self) -> List[Dict[str, Any]]:
+        """
+        호스트별 연결 풀 상태 (열린 연결 = idle + in_use)
+
+        공유 어댑터를 쓰는 경우 이 클라이언트가 요청한 호스트만 포함한다.
+        """
+        stats = self.adapter.get_pool_stats()
+        if not self._owns_adapter:
+            stats = [item for item in stats if (item['scheme'], item['host'], item['port']) in self._origins]
+        return stats
+
+    def send_request(self, request: RequestModel, runtime_data: Dict = None, runtime_files: Dict = None,
+                     stream: bool = False, on_event: Optional[TraceCallback] = None,
+                     retry_policy: Optional[RetryPolicy] = None) -> ResponseModel:
         """
         HTTP 요청 전송
 
         Args:
             request: 요청 모델
+            runtime_data: 런타임 폼 데이터 (웹 UI 업로드)
+            runtime_files: 런타임 파일 (웹 UI 업로드)
+            stream: True 이면 본문을 청크 단위로 읽고, max_in_memory_bytes 를 넘으면 임시 파일로 옮김
+            on_event: 진행 이벤트 콜백 (event, data) - start, dns, connect, tls, sent, headers,
+                      chunk (stream 모드에서 본문 청크마다, data['data'] 는 bytes),
+                      retry (재시도 전 대기 시작 시)
+            retry_policy: 재시도 정책 (None이면 request.retry_policy).
+                          폴더 정책까지 적용하려면 ProjectManager.get_retry_policy 결과를 전달
 
         Returns:
-            응답 모델
+            응답 모델 (마지막 시도의 결과, 재시도 정책이 있으면 attempts 에 시도별 기록)
+        """
+        policy = retry_policy or request.retry_policy
+        max_attempts = policy.max_attempts if policy else 1
+        attempts = []
+
+        for attempt in range(1, max_attempts + 1):
+            retry_status = policy.retry_on_status if policy and attempt < max_attempts else ()
+            response_model, error_kind = self._send_once(
+                request, runtime_data, runtime_files, stream, on_event, retry_status
+            )
+            record = {
+                'attempt': attempt,
+                'status_code': response_model.status_code,
+                'error': response_model.error,
+                'elapsed_ms': response_model.timings.get('total', 0.0),
+                'timings': response_model.timings,
+            }
+            attempts.append(record)
+
+            if attempt == max_attempts:
+                break
+            if response_model.error:
+                if not policy.should_retry_error(error_kind):
+                    break
+                reason = error_kind
+                delay_ms = policy.get_delay_ms(attempt)
+            elif policy.should_retry_status(response_model.status_code):
+                reason = str(response_model.status_code)
+                delay_ms = policy.get_delay_ms(attempt, response_model.headers.get('Retry-After'))
+            else:
+                break
+
+            record['retry_delay_ms'] = delay_ms
+            if on_event is not None:
+                try:
+                    on_event('retry', {'attempt': attempt, 'max_attempts': max_attempts,
+                                       'reason': reason, 'delay_ms': delay_ms})
+                except Exception:
+                    # 콜백이 중단을 요청하면 (클라이언트 연결 끊김 등) 마지막 결과 반환
+                    break
+            time.sleep(delay_ms / 1000)
+            self._rewind_files(runtime_files)
+
+        if policy:
+            response_model.attempts = attempts
+        return response_model
+
+    def _send_once(self, request: RequestModel, runtime_data: Optional[Dict], runtime_files: Optional[Dict],
+                   stream: bool, on_event: Optional[TraceCallback],
+                   retry_status=()) -> Tuple[ResponseModel, Optional[str]]:
+        """
+        요청 한 번 전송
+
+        Args:
+            retry_status: 재시도할 상태 코드 - stream 모드에서 이 코드를 받으면 본문을 읽지 않음
+
+        Returns:
+            (응답 모델, 오류 종류) - 오류 종류는 재시도 가능한 경우에만 'timeout' / 'connection'
         """
         response_model = ResponseModel()
+        trace = None
+        error_kind = None
 
         try:
-            # 환경 변수로 치환
-            resolved_request = self._resolve_variables(request)
-
-            # 요청 파라미터 준비
-            method = resolved_request.method.value
-            url = resolved_request.url
-
-            # 헤더와 파라미터 복사
-            headers = dict(resolved_request.headers)
-            params = dict(resolved_request.params)
-
-            # 인증 적용
-            auth = AuthManager.apply_auth(resolved_request, headers, params)
-
-            # Body 준비
-            body_data = None
-            files = None
-
-            if resolved_request.body_type == BodyType.RAW:
-                body_data = resolved_request.body_raw
-                # Content-Type이 없으면 자동 설정
-                if body_data and 'Content-Type' not in headers:
-                    try:
-                        json.loads(body_data)  # JSON인지 확인
-                        headers['Content-Type'] = 'application/json'
-                    except:
-                        headers['Content-Type'] = 'text/plain'
-
-            elif resolved_request.body_type == BodyType.FORM_URLENCODED:
-                if runtime_files or runtime_data:
-                     # Switch to multipart if runtime files are provided, even if saved type was form-urlencoded (unlikely but safe)
-                     resolved_request.body_type = BodyType.FORM_DATA
-                else:
-                    body_data = resolved_request.body_form
-                    headers['Content-Type'] = 'application/x-www-form-urlencoded'
-
-            if resolved_request.body_type == BodyType.NONE:
-                # If body type is NONE but we have runtime files, it implies multipart
-                if runtime_files or runtime_data:
-                    resolved_request.body_type = BodyType.FORM_DATA
-
-            if resolved_request.body_type == BodyType.FORM_DATA:
-                # multipart/form-data
-                # 런타임 파일/데이터가 있으면 그것을 사용 (웹 UI 업로드)
-                if runtime_files or runtime_data:
-                    files = runtime_files
-                    # 텍스트 필드는 body_data 로 전달 (requests가 files와 data를 함께 처리함)
-                    body_data = runtime_data
-                else:
-                    # 저장된 설정 사용 (텍스트 필드만 가능)
-                    # requests의 files 파라미터를 사용하여 multipart로 강제
-                    # 튜플 형식: (filename, fileobj, content_type) -> filename이 None이면 텍스트 필드
-                    files = {key: (None, value) for key, value in resolved_request.body_form.items()}
-
-            # 요청 전송
-            start_time = time.time()
-
-            response = self.session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                params=params,
-                data=body_data, # files와 함께 사용되면 폼 필드로 처리됨
-                files=files,
-                auth=auth,
-                timeout=self.DEFAULT_TIMEOUT,
-                allow_redirects=True,
-                verify=True,  # SSL 검증
-            )
-
-            elapsed_time = time.time() - start_time
+            prepared = self.prepare_request(request, runtime_data, runtime_files)
+            self._remember_origin(prepared['url'])
+
+            # 요청 전송 - 단계별 시간은 단조 시계로 기록 (RequestTrace)
+            trace = RequestTrace(on_event)
+            trace.emit('start', method=prepared['method'], url=prepared['url'])
+
+            with trace.activate():
+                response = self.session.request(
+                    method=prepared['method'],
+                    url=prepared['url'],
+                    headers=prepared['headers'],
+                    params=prepared['params'],
+                    data=prepared['data'], # files와 함께 사용되면 폼 필드로 처리됨
+                    files=prepared['files'],
+                    auth=prepared['auth'],
+                    timeout=self.DEFAULT_TIMEOUT,
+                    allow_redirects=True,
+                    verify=True,  # SSL 검증
+                    stream=stream,
+                )
 
             # 응답 처리
             response_model.status_code = response.status_code
             response_model.status_text = response.reason
             response_model.headers = dict(response.headers)
-            response_model.elapsed_ms = elapsed_time * 1000
-            response_model.size_bytes = len(response.content)
             response_model.content_type = response.headers.get('Content-Type', '')
 
-            # Body 처리
-            try:
-                response_model.body = response.text
-                response_model.body_bytes = response.content
-            except Exception as e:
-                response_model.body = f"[Error decoding response: {str(e)}]"
+            # Body 처리 - 바이트만 보관하고 텍스트는 접근 시점에 디코딩
+            if stream and response.status_code in retry_status:
+                # 다시 보낼 응답이므로 본문은 받지 않음
+                response.close()
+            elif stream:
+                response_model.encoding = response.encoding or 'utf-8'
+                trace.emit('headers', status_code=response.status_code, status_text=response.reason,
+                           headers=response_model.headers, encoding=response_model.encoding)
+                try:
+                    self._read_streamed_body(response, response_model, trace)
+                finally:
+                    response.close()
+            else:
+                response_model.encoding = response.encoding or response.apparent_encoding or 'utf-8'
                 response_model.body_bytes = response.content
+                response_model.size_bytes = len(response.content)
+
+            response_model.timings = trace.get_timings()
+            response_model.elapsed_ms = response_model.timings['total']
 
         except requests.exceptions.Timeout:
             response_model.error = "Request timeout"
+            error_kind = 'timeout'
         except requests.exceptions.ConnectionError as e:
             response_model.error = f"Connection error: {str(e)}"
+            error_kind = 'connection'
         except requests.exceptions.RequestException as e:
             response_model.error = f"Request error: {str(e)}"
         except Exception as e:
             response_model.error = f"Unexpected error: {str(e)}"
 
-        return response_model
+        if response_model.error and trace is not None:
+            # 실패한 요청도 어느 단계까지 걸린 시간인지 남김
+            response_model.timings = trace.get_timings()
+            # 본문 일부를 이미 전달한 스트리밍 응답은 다시 보내지 않음
+            if stream and trace.headers_received_at is not None:
+                error_kind = None
+
+        return response_model, error_kind
+
+    @staticmethod
+    def _rewind_files(files: Optional[Dict]):
+        """재시도 전에 업로드 파일 스트림을 처음으로 되돌림"""
+        for value in (files or {}).values():
+            fileobj = value[1] if isinstance(value, tuple) and len(value) > 1 else value
+            if hasattr(fileobj, 'seek'):
+                try:
+                    fileobj.seek(0)
+                except (OSError, ValueError):
+                    pass
+
+    def run_load_test(self, request: RequestModel, rps: float, duration_s: float,
+                      ramp_from_rps: float = None,
+                      max_concurrency: int = LoadTester.DEFAULT_MAX_CONCURRENCY) -> LoadTestResult:
+        """
+        단일 요청에 대한 부하 테스트 실행 (저장된 인증/헤더/변수 그대로 사용)
+
+        Args:
+            request: 대상 요청
+            rps: 목표 RPS (램프 사용 시 종료 시점의 RPS)
+            duration_s: 실행 시간 (초)
+            ramp_from_rps: 시작 RPS (지정하면 rps 까지 선형 증가)
+            max_concurrency: 최대 동시 요청 수
+
+        Returns:
+            부하 테스트 결과
+        """
+        return LoadTester(self, max_concurrency).run(request, rps, duration_s, ramp_from_rps)
+
+    def _read_streamed_body(self, response: requests.Response, response_model: ResponseModel,
+                            trace: RequestTrace):
+        """
+        스트리밍 응답 본문을 청크 단위로 읽기
+
+        max_in_memory_bytes 까지는 메모리에 모으고, 넘어서면 지금까지 읽은 내용과
+        나머지를 임시 파일에 기록한다. 청크마다 trace 에 chunk 이벤트를 전달한다.
+        """
+        buffer = bytearray()
+        spill_file = None
+        size = 0
+
+        try:
+            for chunk in self._iter_body_chunks(response):
+                if not chunk:
+                    continue
+                size += len(chunk)
+                trace.emit('chunk', data=chunk, received=size)
+                if spill_file is not None:
+                    spill_file.write(chunk)
+                    continue
+
+                buffer.extend(chunk)
+                if len(buffer) > self.max_in_memory_bytes:
+                    spill_file = tempfile.NamedTemporaryFile(prefix='lumina_resp_', delete=False)
+                    spill_file.write(buffer)
+                    buffer = bytearray()
+        except Exception:
+            if spill_file is not None:
+                spill_file.close()
+                os.remove(spill_file.name)
+            raise
+
+        response_model.size_bytes = size
+        if spill_file is not None:
+            spill_file.close()
+            response_model.set_body_file(spill_file.name)
+        else:
+            response_model.body_bytes = bytes(buffer)
+
+    def _remember_origin(self, url: str):
+        """요청 대상 (scheme, host, port) 기록"""
+        try:
+            parts = urlsplit(url)
+            scheme = parts.scheme.lower()
+            port = parts.port or {'http': 80, 'https': 443}.get(scheme)
+        except ValueError:
+            return
+        if parts.hostname:
+            self._origins.add((scheme, parts.hostname, port))
+
+    def _iter_body_chunks(self, response: requests.Response):
+        """
+        응답 본문을 도착하는 대로 청크 단위로 순회
+
+        iter_content 는 Content-Length 응답에서 CHUNK_SIZE 가 찰 때까지 기다리므로,
+        urllib3 가 read1 을 지원하면 도착한 만큼 바로 반환한다.
+        (chunked 응답은 iter_content 도 HTTP 청크마다 반환)
+        """
+        raw = response.raw
+        if getattr(raw, 'chunked', False) or not hasattr(raw, 'read1'):
+            yield from response.iter_content(chunk_size=self.CHUNK_SIZE)
+            return
+
+        try:
+            while True:
+                chunk = raw.read1(self.CHUNK_SIZE, decode_content=True)
+                if not chunk:
+                    break
+                yield chunk
+        except urllib3_exceptions.ProtocolError as e:
+            raise requests.exceptions.ChunkedEncodingError(e)
+        except urllib3_exceptions.ReadTimeoutError as e:
+            raise requests.exceptions.ConnectionError(e)
+
+    def prepare_request(self, request: RequestModel, runtime_data: Dict = None, runtime_files: Dict = None) -> Dict:
+        """
+        변수 치환과 인증/Body 처리를 마친 전송 파라미터 생성
+
+        Args:
+            request: 요청 모델
+            runtime_data: 런타임 폼 데이터 (웹 UI 업로드)
+            runtime_files: 런타임 파일 (웹 UI 업로드)
+
+        Returns:
+            method, url, headers, params, data, files, auth 키를 가진 딕셔너리
+        """
+        # 환경 변수로 치환
+        resolved_request = self._resolve_variables(request)
+
+        # 요청 파라미터 준비
+        method = resolved_request.method.value
+        url = resolved_request.url
+
+        # 헤더와 파라미터 복사
+        headers = dict(resolved_request.headers)
+        params = dict(resolved_request.params)
+
+        # 인증 적용
+        auth = AuthManager.apply_auth(resolved_request, headers, params)
+
+        # Body 준비
+        body_data = None
+        files = None
+
+        if resolved_request.body_type == BodyType.RAW:
+            body_data = resolved_request.body_raw
+            # Content-Type이 없으면 자동 설정
+            if body_data and 'Content-Type' not in headers:
+                try:
+                    json.loads(body_data)  # JSON인지 확인
+                    headers['Content-Type'] = 'application/json'
+                except:
+                    headers['Content-Type'] = 'text/plain'
+
+        elif resolved_request.body_type == BodyType.FORM_URLENCODED:
+            if runtime_files or runtime_data:
+                 # Switch to multipart if runtime files are provided, even if saved type was form-urlencoded (unlikely but safe)
+                 resolved_request.body_type = BodyType.FORM_DATA
+            else:
+                body_data = resolved_request.body_form
+                headers['Content-Type'] = 'application/x-www-form-urlencoded'
+
+        if resolved_request.body_type == BodyType.NONE:
+            # If body type is NONE but we have runtime files, it implies multipart
+            if runtime_files or runtime_data:
+                resolved_request.body_type = BodyType.FORM_DATA
+
+        if resolved_request.body_type == BodyType.FORM_DATA:
+            # multipart/form-data
+            # 런타임 파일/데이터가 있으면 그것을 사용 (웹 UI 업로드)
+            if runtime_files or runtime_data:
+                files = runtime_files
+                # 텍스트 필드는 body_data 로 전달 (requests가 files와 data를 함께 처리함)
+                body_data = runtime_data
+            else:
+                # 저장된 설정 사용 (텍스트 필드만 가능)
+                # requests의 files 파라미터를 사용하여 multipart로 강제
+                # 튜플 형식: (filename, fileobj, content_type) -> filename이 None이면 텍스트 필드
+                files = {key: (None, value) for key, value in resolved_request.body_form.items()}
+
+        return {
+            'method': method,
+            'url': url,
+            'headers': headers,
+            'params': params,
+            'data': body_data,
+            'files': files,
+            'auth': auth,
+        }
+
+    def get_variables(self) -> Dict[str, str]:
+        """
+        치환에 사용할 변수 딕셔너리 생성 (활성 환경 + 글로벌 환경)
+
+        Returns:
+            변수 딕셔너리
+        """
+        variables = {}
+        if self.env_manager.active_environment:
+            variables.update(self.env_manager.active_environment.variables)
+        variables.update(self.env_manager.global_environment.variables)
+        return variables
 
     def _resolve_variables(self, request: RequestModel) -> RequestModel:
         """
@@ -143,14 +444,11 @@ class HttpClient:
         Returns:
             치환된 요청 모델 (새 인스턴스)
         """
-        # 복제본 생성
-        resolved = RequestModel.from_dict(request.to_dict())
+        # 복제본 생성 (얕은 복사 - 치환 대상 필드는 아래에서 새 값으로 교체됨)
+        resolved = copy.copy(request)
 
         # 환경 변수 딕셔너리 생성
-        variables = {}
-        if self.env_manager.active_environment:
-            variables.update(self.env_manager.active_environment.variables)
-        variables.update(self.env_manager.global_environment.variables)
+        variables = self.get_variables()
 
         # URL 치환
         resolved.url = VariableResolver.resolve(request.url, variables)
@@ -176,5 +474,11 @@ class HttpClient:
         return resolved
 
     def close(self):
-        """세션 종료"""
-        self.session.close()
+        """
+        연결 풀 종료
+
+        닫은 뒤에도 요청을 보낼 수 있다 (필요하면 연결을 새로 연다).
+        공유 어댑터를 쓰는 경우 다른 클라이언트가 사용 중이므로 닫지 않는다.
+        """
+        if self._owns_adapter:
+            self.session.close()
@@ -0,0 +1,147 @@
+"""
+HTTP 클라이언트 레지스트리
+(세션, 프로젝트) 별 HttpClient 를 개수 제한과 유휴 시간 기준으로 관리한다.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List
+
+from core.http_client import HttpClient
+
+
+class HttpClientRegistry:
+    """
+    개수 제한이 있는 HttpClient 저장소 (LRU)
+
+    최대 개수를 넘으면 가장 오래 사용되지 않은 클라이언트부터, evict_idle() 호출 시
+    idle_timeout_s 동안 사용되지 않은 클라이언트를 닫고 제거한다.
+    제거된 클라이언트의 쿠키는 사라지며 다음 접근 시 새 클라이언트가 만들어진다.
+    닫힌 클라이언트로 진행 중인 요청은 그대로 완료된다.
+
+    키는 (session_id, project_id) 튜플이다.
+    """
+
+    def __init__(self, max_clients: int, idle_timeout_s: float):
+        """
+        Args:
+            max_clients: 유지할 최대 클라이언트 수
+            idle_timeout_s: 이 시간(초) 동안 사용되지 않으면 evict_idle() 에서 제거
+        """
+        self.max_clients = max_clients
+        self.idle_timeout_s = idle_timeout_s
+        # key -> [HttpClient, 마지막 사용 시각(monotonic)] (마지막이 가장 최근)
+        self._clients: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.created = 0
+        self.evicted_lru = 0
+        self.evicted_idle = 0
+
+    def get(self, key: Hashable, factory: Callable[[], HttpClient]) -> HttpClient:
+        """
+        클라이언트 가져오기 (없으면 factory 로 생성)
+
+        Args:
+            key: (session_id, project_id)
+            factory: 클라이언트 생성 함수
+
+        Returns:
+            HttpClient
+        """
+        evicted = []
+        with self._lock:
+            item = self._clients.get(key)
+            if item is not None:
+                item[1] = time.monotonic()
+                self._clients.move_to_end(key)
+                return item[0]
+
+            client = factory()
+            self._clients[key] = [client, time.monotonic()]
+            self.created += 1
+            while len(self._clients) > self.max_clients:
+                _, (old_client, _) = self._clients.popitem(last=False)
+                evicted.append(old_client)
+                self.evicted_lru += 1
+
+        self._close_clients(evicted)
+        return client
+
+    def remove(self, key: Hashable):
+        """클라이언트 닫고 제거"""
+        with self._lock:
+            item = self._clients.pop(key, None)
+        if item is not None:
+            self._close_clients([item[0]])
+
+    def remove_session(self, session_id: str):
+        """세션의 모든 클라이언트 닫고 제거"""
+        with self._lock:
+            keys = [key for key in self._clients if key[0] == session_id]
+            clients = [self._clients.pop(key)[0] for key in keys]
+        self._close_clients(clients)
+
+    def evict_idle(self) -> int:
+        """
+        유휴 클라이언트 제거
+
+        Returns:
+            제거한 클라이언트 수
+        """
+        cutoff = time.monotonic() - self.idle_timeout_s
+        evicted = []
+        with self._lock:
+            # LRU 순서이므로 앞에서부터 기준 시각을 넘는 항목이 나오면 중단
+            while self._clients:
+                key, (client, last_used) = next(iter(self._clients.items()))
+                if last_used >= cutoff:
+                    break
+                del self._clients[key]
+                evicted.append(client)
+            self.evicted_idle += len(evicted)
+
+        self._close_clients(evicted)
+        return len(evicted)
+
+    def close_all(self):
+        """모든 클라이언트 닫기"""
+        with self._lock:
+            clients = [item[0] for item in self._clients.values()]
+            self._clients.clear()
+        self._close_clients(clients)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        레지스트리 상태
+
+        Returns:
+            active (현재 클라이언트 수), sessions (클라이언트가 있는 세션 수),
+            max_clients, idle_timeout_s, oldest_idle_s (가장 오래 사용되지 않은 시간),
+            created, evicted_lru, evicted_idle (누적)
+        """
+        now = time.monotonic()
+        with self._lock:
+            oldest = next(iter(self._clients.values()), None)
+            return {
+                'active': len(self._clients),
+                'sessions': len({key[0] for key in self._clients}),
+                'max_clients': self.max_clients,
+                'idle_timeout_s': self.idle_timeout_s,
+                'oldest_idle_s': round(now - oldest[1], 3) if oldest else None,
+                'created': self.created,
+                'evicted_lru': self.evicted_lru,
+                'evicted_idle': self.evicted_idle,
+            }
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    @staticmethod
+    def _close_clients(clients: List[HttpClient]):
+        """클라이언트 닫기 (잠금 밖에서 호출)"""
+        for client in clients:
+            try:
+                client.close()
+            except Exception:
+                pass
@@ -0,0 +1,129 @@
+"""
+가져오기 작업 상태 저장소
+백그라운드 가져오기 작업의 상태를 SQLite 에 기록해 다른 워커 프로세스에서도
+진행 상황 조회와 취소 요청을 할 수 있게 한다.
+"""
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from utils.sqlite_utils import ThreadLocalConnections
+
+
+class ImportJobStore:
+    """
+    SQLite 가져오기 작업 저장소 (WAL 모드)
+
+    작업 하나가 한 행이며, 작업을 실행하는 워커가 상태가 바뀔 때마다
+    ImportJob.to_dict() 결과를 덮어쓴다. 다른 워커는 이 행을 읽어 상태를 응답하고,
+    취소 요청은 cancel_requested 열에 남겨 실행 중인 워커가 다음 진행 보고 때 확인한다.
+    """
+
+    BUSY_TIMEOUT_MS = 5000
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS import_jobs (
+            id TEXT PRIMARY KEY,
+            session_id TEXT,
+            finished INTEGER NOT NULL DEFAULT 0,
+            cancel_requested INTEGER NOT NULL DEFAULT 0,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_import_jobs_session ON import_jobs (session_id, created_at);
+        CREATE INDEX IF NOT EXISTS idx_import_jobs_updated ON import_jobs (updated_at);
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = str(db_path)
+        self._connections = ThreadLocalConnections(self.db_path, self.BUSY_TIMEOUT_MS)
+
+        conn = self._connections.get()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript(self.SCHEMA)
+
+    def save(self, session_id: Optional[str], finished: bool, job: Dict[str, Any]) -> bool:
+        """
+        작업 상태 기록 (실행 중인 워커가 호출)
+
+        Args:
+            session_id: 작업을 만든 세션 ID
+            finished: 작업이 끝났는지
+            job: ImportJob.to_dict() 결과
+
+        Returns:
+            다른 워커에서 취소가 요청되었는지
+        """
+        conn = self._connections.get()
+        conn.execute(
+            """
+            INSERT INTO import_jobs (id, session_id, finished, created_at, updated_at, data)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (id) DO UPDATE SET
+                finished = excluded.finished, updated_at = excluded.updated_at, data = excluded.data
+            """,
+            (job['id'], session_id, int(finished), job['created_at'], time.time(),
+             json.dumps(job, ensure_ascii=False))
+        )
+        row = conn.execute('SELECT cancel_requested FROM import_jobs WHERE id = ?', (job['id'],)).fetchone()
+        return bool(row and row[0])
+
+    def load(self, job_id: str) -> Optional[Tuple[Optional[str], Dict[str, Any], bool, float]]:
+        """
+        작업 조회
+
+        Returns:
+            (세션 ID, ImportJob.to_dict() 결과, 취소 요청 여부, 마지막 기록 시각).
+            없으면 None
+        """
+        row = self._connections.get().execute(
+            'SELECT session_id, data, cancel_requested, updated_at FROM import_jobs WHERE id = ?', (job_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1]), bool(row[2]), row[3]
+
+    def list_jobs(self, session_id: Optional[str]) -> List[Tuple[Dict[str, Any], bool, float]]:
+        """
+        세션의 작업 목록 (최근 것부터)
+
+        Returns:
+            (ImportJob.to_dict() 결과, 취소 요청 여부, 마지막 기록 시각) 목록
+        """
+        rows = self._connections.get().execute(
+            'SELECT data, cancel_requested, updated_at FROM import_jobs '
+            'WHERE session_id IS ? ORDER BY created_at DESC',
+            (session_id,)
+        ).fetchall()
+        return [(json.loads(data), bool(cancel_requested), updated_at)
+                for data, cancel_requested, updated_at in rows]
+
+    def request_cancel(self, job_id: str) -> bool:
+        """
+        취소 요청 기록
+
+        Returns:
+            기록했는지 (없거나 이미 끝난 작업이면 False)
+        """
+        cursor = self._connections.get().execute(
+            'UPDATE import_jobs SET cancel_requested = 1 WHERE id = ? AND finished = 0', (job_id,)
+        )
+        return cursor.rowcount > 0
+
+    def prune(self, older_than: float) -> int:
+        """
+        오래된 작업 삭제 (끝났거나, 실행하던 워커가 멈춰 갱신이 끊긴 작업)
+
+        Args:
+            older_than: 마지막 기록이 이 시각(epoch 초) 이전인 작업을 삭제
+
+        Returns:
+            삭제한 작업 수
+        """
+        cursor = self._connections.get().execute('DELETE FROM import_jobs WHERE updated_at < ?', (older_than,))
+        return cursor.rowcount
+
+    def close(self):
+        """저장소 닫기"""
+        self._connections.close_all()
@@ -0,0 +1,362 @@
+"""
+가져오기 작업 관리
+Insomnia/Postman/OpenAPI 가져오기를 작업 스레드 풀에서 실행하고,
+진행 상황 조회와 취소를 제공한다.
+ImportJobStore 를 주면 작업 상태를 공유해 다른 워커 프로세스에서도 조회/취소할 수 있다.
+"""
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+from core.import_job_store import ImportJobStore
+
+
+class ImportCancelled(Exception):
+    """가져오기 작업이 취소됨"""
+
+
+class ImportQueueFull(Exception):
+    """세션의 진행 중인 가져오기 작업이 너무 많음"""
+
+
+class ImportJob:
+    """
+    가져오기 작업 하나
+
+    상태는 queued -> running -> completed / failed / cancelled 로 바뀐다.
+    변환기는 progress() 를 진행 콜백으로 받아 변환한 요청 수(operations)와
+    만든 폴더 수(folders)를 갱신하며, 취소가 요청되면 progress() 가
+    ImportCancelled 를 던져 변환을 중단시킨다.
+    프로젝트에 결과를 넣기 직전에 check_cancelled() 로 마지막 확인을 하고,
+    그 이후에는 취소되지 않는다.
+
+    공유 저장소가 있으면 상태가 바뀔 때 (진행 보고는 PUBLISH_INTERVAL_S 간격으로)
+    저장소에 기록하고, 그때 다른 워커에서 들어온 취소 요청도 확인한다.
+    """
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+    FINISHED = frozenset([COMPLETED, FAILED, CANCELLED])
+
+    PUBLISH_INTERVAL_S = 0.5
+
+    def __init__(self, session_id: Optional[str], kind: str, cleanup: Optional[Callable[[], None]] = None):
+        """
+        Args:
+            session_id: 작업을 만든 세션 ID
+            kind: 가져오기 종류 ('insomnia', 'postman', 'openapi')
+            cleanup: 작업이 끝나면 (실패/취소 포함) 한 번 호출할 정리 함수
+        """
+        self.id = str(uuid.uuid4())
+        self.session_id = session_id
+        self.kind = kind
+        self.status = self.QUEUED
+        self.stage: Optional[str] = None  # 실행 중 단계 (fetching, converting, applying)
+        self.operations = 0
+        self.folders = 0
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._cancel_event = threading.Event()
+        self._future: Optional[Future] = None
+        self._cleanup = cleanup
+        self._store: Optional[ImportJobStore] = None
+        self._published_at = 0.0
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in self.FINISHED
+
+    def set_stage(self, stage: str):
+        """실행 단계 변경 (취소 요청 확인 포함)"""
+        self.check_cancelled()
+        self.stage = stage
+        self.publish(force=True)
+        self.check_cancelled()
+
+    def progress(self, operations: int, folders: int):
+        """변환기 진행 콜백"""
+        self.operations = operations
+        self.folders = folders
+        self.publish()
+        self.check_cancelled()
+
+    def check_cancelled(self):
+        """취소가 요청되었으면 ImportCancelled"""
+        if self._cancel_event.is_set():
+            raise ImportCancelled()
+
+    def cancel(self) -> bool:
+        """
+        취소 요청
+
+        대기 중인 작업은 바로 취소되고, 실행 중인 작업은 다음 진행 보고 시점에 중단된다.
+
+        Returns:
+            취소 요청이 받아들여졌는지 (이미 끝난 작업이면 False)
+        """
+        if self.is_finished:
+            return False
+        self._cancel_event.set()
+        if self._store is not None:
+            try:
+                self._store.request_cancel(self.id)
+            except Exception as e:
+                print(f"Failed to record import job cancel: {e}")
+        if self._future is not None and self._future.cancel():
+            self._finish(self.CANCELLED)
+        return True
+
+    def _finish(self, status: str, error: Optional[str] = None):
+        self.status = status
+        self.error = error
+        self.stage = None
+        self.finished_at = time.time()
+        cleanup, self._cleanup = self._cleanup, None
+        if cleanup is not None:
+            try:
+                cleanup()
+            except Exception:
+                pass
+        self.publish(force=True)
+
+    def publish(self, force: bool = False):
+        """
+        공유 저장소에 상태 기록 (저장소가 없으면 아무것도 하지 않음)
+
+        다른 워커에서 취소가 요청되었으면 취소 이벤트를 설정한다.
+
+        Args:
+            force: PUBLISH_INTERVAL_S 가 지나지 않았어도 기록
+        """
+        if self._store is None:
+            return
+        now = time.time()
+        if not force and now - self._published_at < self.PUBLISH_INTERVAL_S:
+            return
+        self._published_at = now
+        try:
+            if self._store.save(self.session_id, self.is_finished, self.to_dict()):
+                self._cancel_event.set()
+        except Exception as e:
+            print(f"Failed to publish import job {self.id}: {e}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """상태 조회 응답"""
+        end = self.finished_at if self.finished_at is not None else time.time()
+        return {
+            'id': self.id,
+            'kind': self.kind,
+            'status': self.status,
+            'stage': self.stage,
+            'progress': {
+                'operations': self.operations,
+                'folders': self.folders,
+            },
+            'cancel_requested': self._cancel_event.is_set(),
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'elapsed_ms': (end - self.started_at) * 1000 if self.started_at is not None else None,
+        }
+
+
+class StoredImportJob:
+    """
+    다른 워커 프로세스가 실행하는 작업 (공유 저장소에 기록된 마지막 상태)
+
+    실행하던 워커가 STALE_AFTER_S 동안 상태를 갱신하지 않았으면
+    (프로세스 종료 등) 실패한 작업으로 보여준다.
+    """
+
+    STALE_AFTER_S = 120
+
+    def __init__(self, store: ImportJobStore, data: Dict[str, Any], cancel_requested: bool, updated_at: float):
+        """
+        Args:
+            store: 공유 저장소
+            data: 기록된 ImportJob.to_dict() 결과
+            cancel_requested: 취소 요청 여부
+            updated_at: 마지막 기록 시각
+        """
+        self._store = store
+        self._data = dict(data)
+        self.id = data['id']
+        self._data['cancel_requested'] = bool(data.get('cancel_requested')) or cancel_requested
+        if data['status'] not in ImportJob.FINISHED and time.time() - updated_at > self.STALE_AFTER_S:
+            self._data.update(status=ImportJob.FAILED, stage=None,
+                              error='Import worker stopped before the job finished')
+
+    @property
+    def status(self) -> str:
+        return self._data['status']
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in ImportJob.FINISHED
+
+    def cancel(self) -> bool:
+        """
+        취소 요청 (실행 중인 워커가 다음 진행 보고 때 중단)
+
+        Returns:
+            취소 요청이 기록되었는지 (이미 끝난 작업이면 False)
+        """
+        if self.is_finished or not self._store.request_cancel(self.id):
+            return False
+        self._data['cancel_requested'] = True
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        """상태 조회 응답"""
+        return dict(self._data)
+
+
+class ImportJobManager:
+    """
+    가져오기 작업 큐
+
+    작업은 max_workers 개의 스레드에서 순서대로 실행되고, 끝난 작업은
+    retention_s 동안 조회할 수 있다 (prune() 호출 시 정리).
+    작업은 이 프로세스에서 실행되고, store 가 없으면 상태도 이 프로세스의 메모리에만 있다.
+    store 가 있으면 다른 워커가 실행하는 작업도 저장소를 통해 조회/취소할 수 있다.
+    """
+
+    def __init__(self, max_workers: int, max_jobs_per_session: int, retention_s: float,
+                 store: Optional[ImportJobStore] = None):
+        """
+        Args:
+            max_workers: 동시에 실행할 가져오기 작업 수
+            max_jobs_per_session: 세션별로 끝나지 않은 작업의 최대 수 (이 프로세스 기준)
+            retention_s: 끝난 작업을 보관할 시간 (초)
+            store: 워커 간 공유할 작업 상태 저장소 (멀티 프로세스 배포용)
+        """
+        self.max_jobs_per_session = max_jobs_per_session
+        self.retention_s = retention_s
+        self.store = store
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='lumina-import')
+        # job_id -> ImportJob (생성 순서)
+        self._jobs: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, session_id: Optional[str], kind: str, task: Callable[[ImportJob], Dict[str, Any]],
+               cleanup: Optional[Callable[[], None]] = None) -> ImportJob:
+        """
+        작업 제출
+
+        Args:
+            session_id: 세션 ID
+            kind: 가져오기 종류
+            task: 작업 스레드에서 실행할 함수 (작업을 받아 결과 dict 반환)
+            cleanup: 작업이 끝나면 (실패/취소 포함) 호출할 정리 함수
+
+        Returns:
+            대기 중인 작업
+
+        Raises:
+            ImportQueueFull: 세션의 끝나지 않은 작업이 max_jobs_per_session 개 이상
+        """
+        job = ImportJob(session_id, kind, cleanup)
+        job._store = self.store
+        with self._lock:
+            pending = sum(1 for other in self._jobs.values()
+                          if other.session_id == session_id and not other.is_finished)
+            if pending >= self.max_jobs_per_session:
+                raise ImportQueueFull(
+                    f"Too many import jobs in progress (max {self.max_jobs_per_session})"
+                )
+            self._jobs[job.id] = job
+            job.publish(force=True)
+            job._future = self._executor.submit(self._run, job, task)
+        return job
+
+    def get(self, job_id: str, session_id: Optional[str]):
+        """
+        세션의 작업 조회
+
+        이 프로세스에 없는 작업은 공유 저장소에서 찾는다.
+
+        Returns:
+            ImportJob 또는 StoredImportJob (없거나 다른 세션의 작업이면 None)
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            return job if job.session_id == session_id else None
+        if self.store is None:
+            return None
+        stored = self.store.load(job_id)
+        if stored is None or stored[0] != session_id:
+            return None
+        return StoredImportJob(self.store, *stored[1:])
+
+    def list_jobs(self, session_id: Optional[str]) -> List[Any]:
+        """세션의 작업 목록 (최근 것부터, 공유 저장소가 있으면 모든 워커의 작업)"""
+        with self._lock:
+            local = [job for job in reversed(self._jobs.values()) if job.session_id == session_id]
+        if self.store is None:
+            return local
+        by_id = {job.id: job for job in local}
+        return [by_id.get(data['id']) or StoredImportJob(self.store, data, cancel_requested, updated_at)
+                for data, cancel_requested, updated_at in self.store.list_jobs(session_id)]
+
+    def prune(self) -> int:
+        """
+        보관 시간이 지난 끝난 작업 정리
+
+        공유 저장소가 있으면 끝나지 않은 작업의 상태를 다시 기록해
+        (진행 보고가 없는 대기/적용 중에도) 다른 워커가 멈춘 작업으로 보지 않게 한다.
+
+        Returns:
+            정리한 작업 수
+        """
+        cutoff = time.time() - self.retention_s
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items()
+                       if job.is_finished and job.finished_at < cutoff]
+            for job_id in expired:
+                del self._jobs[job_id]
+            pending = [job for job in self._jobs.values() if not job.is_finished]
+        if self.store is not None:
+            for job in pending:
+                job.publish(force=True)
+            try:
+                self.store.prune(cutoff)
+            except Exception as e:
+                print(f"Failed to prune import jobs: {e}")
+        return len(expired)
+
+    def shutdown(self):
+        """모든 작업 취소 후 작업 스레드 종료 (실행 중인 작업은 기다리지 않음)"""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            job.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _run(job: ImportJob, task: Callable[[ImportJob], Dict[str, Any]]):
+        """작업 스레드에서 작업 실행"""
+        if job.is_finished:
+            return
+        job.status = ImportJob.RUNNING
+        job.started_at = time.time()
+        job.publish(force=True)
+        try:
+            job.check_cancelled()
+            job.result = task(job)
+        except ImportCancelled:
+            job._finish(ImportJob.CANCELLED)
+        except Exception as e:
+            job._finish(ImportJob.FAILED, str(e))
+        else:
+            job._finish(ImportJob.COMPLETED)
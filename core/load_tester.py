@@ -0,0 +1,215 @@
+"""
+단일 요청에 대한 부하 테스트
+목표 RPS (고정 또는 램프) 로 일정 시간 동안 요청을 발생시키고 지연 시간 분포를 수집
+"""
+import bisect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+from models.request_model import RequestModel, RetryPolicy
+from models.response_model import ResponseModel
+
+
+class LatencyHistogram:
+    """지연 시간 히스토그램 (ms)"""
+
+    # 버킷 상한 (ms) - 마지막 버킷은 그 이상 전부
+    BUCKETS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000]
+
+    def __init__(self):
+        # 기록 순서대로 추가하고, 조회할 때 한 번만 정렬
+        self.samples: List[float] = []
+        self.counts = [0] * (len(self.BUCKETS) + 1)
+        self._sorted = True
+        self._lock = threading.Lock()
+
+    def record(self, latency_ms: float):
+        """지연 시간 기록 (O(1))"""
+        with self._lock:
+            self.samples.append(latency_ms)
+            self._sorted = False
+            self.counts[bisect.bisect_left(self.BUCKETS, latency_ms)] += 1
+
+    def _sorted_samples(self) -> List[float]:
+        """정렬된 샘플 (잠금 안에서 호출)"""
+        if not self._sorted:
+            self.samples.sort()
+            self._sorted = True
+        return self.samples
+
+    def percentile(self, percent: float) -> float:
+        """백분위 지연 시간 (nearest-rank)"""
+        with self._lock:
+            return self._percentile(self._sorted_samples(), percent)
+
+    @staticmethod
+    def _percentile(samples: List[float], percent: float) -> float:
+        if not samples:
+            return 0.0
+        rank = max(1, int(round(percent / 100.0 * len(samples))))
+        return samples[min(rank, len(samples)) - 1]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        buckets = []
+        lower = 0
+        for upper, count in zip(self.BUCKETS + [None], self.counts):
+            buckets.append({'le_ms': upper, 'gt_ms': lower, 'count': count})
+            lower = upper
+        with self._lock:
+            samples = list(self._sorted_samples())
+        return {
+            'count': len(samples),
+            'min_ms': samples[0] if samples else 0.0,
+            'mean_ms': sum(samples) / len(samples) if samples else 0.0,
+            'p50_ms': self._percentile(samples, 50),
+            'p90_ms': self._percentile(samples, 90),
+            'p99_ms': self._percentile(samples, 99),
+            'max_ms': samples[-1] if samples else 0.0,
+            'buckets': buckets,
+        }
+
+
+class LoadTestResult:
+    """부하 테스트 결과"""
+
+    def __init__(self, request: RequestModel, target_rps: float, duration_s: float,
+                 ramp_from_rps: Optional[float]):
+        self.request = request
+        self.target_rps = target_rps
+        self.duration_s = duration_s
+        self.ramp_from_rps = ramp_from_rps
+        self.started_at = datetime.now()
+        self.elapsed_s: float = 0.0
+        self.sent = 0
+        self.dropped = 0  # 대기열이 가득 차 보내지 못한 요청 수
+        self.completed = 0
+        self.errors = 0
+        self.status_counts: Dict[str, int] = {}
+        self.error_messages: Dict[str, int] = {}
+        self.histogram = LatencyHistogram()
+        self._lock = threading.Lock()
+
+    def record(self, response: ResponseModel):
+        """응답 하나 기록"""
+        with self._lock:
+            self.completed += 1
+            if response.is_error():
+                self.errors += 1
+                key = 'error'
+                self.error_messages[response.error] = self.error_messages.get(response.error, 0) + 1
+            else:
+                key = str(response.status_code)
+                if response.status_code >= 400:
+                    self.errors += 1
+            self.status_counts[key] = self.status_counts.get(key, 0) + 1
+
+        if not response.is_error():
+            self.histogram.record(response.elapsed_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return {
+            'request_id': self.request.id,
+            'name': self.request.name,
+            'started_at': self.started_at.isoformat(),
+            'target_rps': self.target_rps,
+            'ramp_from_rps': self.ramp_from_rps,
+            'duration_s': self.duration_s,
+            'elapsed_s': self.elapsed_s,
+            'sent': self.sent,
+            'dropped': self.dropped,
+            'completed': self.completed,
+            'errors': self.errors,
+            'throughput_rps': self.completed / self.elapsed_s if self.elapsed_s else 0.0,
+            'status_counts': self.status_counts,
+            'error_messages': self.error_messages,
+            'latency': self.histogram.to_dict(),
+        }
+
+
+class LoadTester:
+    """
+    개방형(open-loop) 부하 발생기
+
+    응답을 기다리지 않고 예정된 시각에 요청을 발생시키며,
+    동시 실행 수가 max_concurrency 에 도달하면 max_concurrency 개까지 대기열에 쌓인다.
+    대기열도 가득 차면 (대상이 목표 RPS 를 감당하지 못하면) 그 요청은 보내지 않고
+    dropped 로 센다 - 일정을 늦추지 않으므로 개방형 부하가 유지된다.
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 50
+
+    def __init__(self, http_client, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        self.http_client = http_client
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_pending = self.max_concurrency * 2  # 실행 중 + 대기 중
+
+    def run(self, request: RequestModel, rps: float, duration_s: float,
+            ramp_from_rps: Optional[float] = None) -> LoadTestResult:
+        """
+        부하 테스트 실행
+
+        Args:
+            request: 대상 요청
+            rps: 목표 RPS (램프 사용 시 종료 시점의 RPS)
+            duration_s: 실행 시간 (초)
+            ramp_from_rps: 시작 RPS (지정하면 rps 까지 선형 증가)
+
+        Returns:
+            부하 테스트 결과
+        """
+        if rps <= 0 or duration_s <= 0:
+            raise ValueError("rps and duration must be positive")
+
+        result = LoadTestResult(request, rps, duration_s, ramp_from_rps)
+        start_rps = max(ramp_from_rps, 0.0) if ramp_from_rps is not None else rps
+
+        # 재시도는 지연 시간/오류율을 왜곡하므로 요청의 재시도 정책을 쓰지 않음
+        no_retry = RetryPolicy(max_attempts=1)
+
+        pending = threading.BoundedSemaphore(self.max_pending)
+
+        def fire():
+            try:
+                result.record(self.http_client.send_request(request, retry_policy=no_retry))
+            finally:
+                pending.release()
+
+        start_time = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='lumina-load') as executor:
+            while True:
+                offset = self._schedule_offset(result.sent + result.dropped, start_rps, rps, duration_s)
+                if offset >= duration_s:
+                    break
+                delay = start_time + offset - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                if pending.acquire(blocking=False):
+                    executor.submit(fire)
+                    result.sent += 1
+                else:
+                    result.dropped += 1
+
+        result.elapsed_s = time.monotonic() - start_time
+        return result
+
+    @staticmethod
+    def _schedule_offset(index: int, start_rps: float, end_rps: float, duration_s: float) -> float:
+        """
+        index 번째 요청의 발생 시각 (시작 기준 초)
+
+        RPS 가 start_rps 에서 end_rps 로 선형 증가할 때 누적 요청 수
+        N(t) = a*t + b*t^2/2 를 t 에 대해 푼 값
+        """
+        a = start_rps
+        b = (end_rps - start_rps) / duration_s
+        if abs(b) < 1e-9:
+            return index / a
+        discriminant = a * a + 2 * b * index
+        if discriminant < 0:
+            # 감소 램프에서 더 이상 도달할 수 없는 요청
+            return duration_s
+        return (-a + discriminant ** 0.5) / b
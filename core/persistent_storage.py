@@ -6,7 +6,7 @@ import time
 import threading
 import uuid
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
 import os
 import sys
 
@@ -14,6 +14,7 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.project_manager import ProjectManager
+from utils.file_utils import atomic_write_json
 
 
 class PersistentStorage:
@@ -25,6 +26,11 @@ class PersistentStorage:
         self.auto_save_interval = auto_save_interval
         self.auto_save_timer = None
         self.is_running = False
+        # project_id -> (instance_id, version) last written by this storage.
+        # Kept here rather than in ProjectManager so other savers (session store)
+        # don't mark projects clean for us, or vice versa.
+        self._saved_versions: Dict[str, Tuple[str, int]] = {}
+        self._saved_lock = threading.Lock()
         
     def load_all_projects(self) -> Dict[str, ProjectManager]:
         """Load all projects from disk"""
@@ -36,6 +42,7 @@ class PersistentStorage:
                     project_id = project_file.stem
                     pm = ProjectManager.load_from_file(str(project_file))
                     projects[project_id] = pm
+                    self._mark_saved(project_id, pm, pm.version)
                     print(f"  ✓ Loaded: {pm.project_name} ({project_id[:8]}...)")
                 except Exception as e:
                     print(f"  ✗ Failed to load {project_file.name}: {e}")
@@ -58,17 +65,32 @@ class PersistentStorage:
         """Save a single project to disk"""
         try:
             project_file = self.projects_dir / f"{project_id}.json"
-            pm.save_to_file(str(project_file))
+            version, data = pm.snapshot()
+            atomic_write_json(str(project_file), data)
+            self._mark_saved(project_id, pm, version)
         except Exception as e:
             print(f"Error saving project {project_id}: {e}")
+
+    def is_dirty(self, project_id: str, pm: ProjectManager) -> bool:
+        """Check whether the project changed since this storage last saved it"""
+        with self._saved_lock:
+            return self._saved_versions.get(project_id) != (pm.instance_id, pm.version)
+
+    def _mark_saved(self, project_id: str, pm: ProjectManager, version: int):
+        with self._saved_lock:
+            saved = self._saved_versions.get(project_id)
+            if saved is not None and saved[0] == pm.instance_id and saved[1] >= version:
+                return
+            self._saved_versions[project_id] = (pm.instance_id, version)
     
     def save_all_projects(self, projects: Dict[str, ProjectManager]):
-        """Save all projects to disk"""
+        """Save projects that changed since their last save"""
         try:
-            for project_id, pm in projects.items():
+            dirty = {project_id: pm for project_id, pm in projects.items() if self.is_dirty(project_id, pm)}
+            for project_id, pm in dirty.items():
                 self.save_project(project_id, pm)
-            if projects:
-                print(f"Auto-saved {len(projects)} projects")
+            if dirty:
+                print(f"Auto-saved {len(dirty)} projects")
         except Exception as e:
             print(f"Error during auto-save: {e}")
     
@@ -3,20 +3,141 @@
 """
 import json
 import threading
-from typing import Dict, Any, Optional, List
+import uuid
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
-from models.request_model import RequestModel, RequestFolder, HttpMethod, BodyType
+from models.request_model import RequestModel, RequestFolder, RetryPolicy, HttpMethod, BodyType
 from models.environment import EnvironmentManager
+from utils.file_utils import atomic_write_json
 
 
 class ProjectManager:
     """프로젝트 관리자 - Thread-safe"""
 
     def __init__(self):
+        self._lock = threading.RLock()  # Reentrant Lock for nested calls
+        # ID 인덱스: id -> (노드, 부모 폴더). 루트 폴더의 부모는 None
+        self._request_index: Dict[str, Tuple[RequestModel, RequestFolder]] = {}
+        self._folder_index: Dict[str, Tuple[RequestFolder, Optional[RequestFolder]]] = {}
+        # 변경 추적: 수정될 때마다 version 이 증가하고, 저장된 version 과 다르면 dirty
+        self._version = 0
+        self._saved_version = 0
+        # 인스턴스 식별자 - version 은 인스턴스마다 0부터 시작하므로 ETag 등에는 함께 사용
+        self.instance_id = uuid.uuid4().hex[:16]
         self.project_name = "Untitled Project"
         self.root_folder = RequestFolder("Root")
         self.env_manager = EnvironmentManager()
-        self._lock = threading.RLock()  # Reentrant Lock for nested calls
+
+    @property
+    def version(self) -> int:
+        """변경 버전 (수정될 때마다 증가)"""
+        return self._version
+
+    def etag(self) -> str:
+        """현재 상태를 식별하는 ETag 값 (내용이 바뀌면 달라짐)"""
+        return f"{self.instance_id}-{self._version}"
+
+    def mark_dirty(self):
+        """
+        프로젝트가 변경되었음을 표시
+
+        ProjectManager 메서드를 통한 트리 변경은 자동으로 표시되며,
+        요청/환경 속성을 직접 수정한 경우 호출해야 한다.
+        """
+        with self._lock:
+            self._version += 1
+
+    def is_dirty(self) -> bool:
+        """마지막 저장 이후 변경되었는지 확인"""
+        return self._version != self._saved_version
+
+    def mark_saved(self, version: int):
+        """
+        저장 완료 표시
+
+        Args:
+            version: 저장한 시점의 버전 (snapshot 반환값)
+        """
+        with self._lock:
+            self._saved_version = max(self._saved_version, version)
+
+    def snapshot(self) -> Tuple[int, Dict[str, Any]]:
+        """
+        현재 버전과 직렬화 데이터를 함께 가져오기 (일관된 시점)
+
+        Returns:
+            (버전, to_dict 결과)
+        """
+        with self._lock:
+            return self._version, self.to_dict()
+
+    @property
+    def root_folder(self) -> RequestFolder:
+        """루트 폴더"""
+        return self._root_folder
+
+    @root_folder.setter
+    def root_folder(self, folder: RequestFolder):
+        """루트 폴더 교체 (ID 인덱스 재구성)"""
+        with self._lock:
+            self._root_folder = folder
+            self.reindex()
+            self._version += 1
+
+    def reindex(self):
+        """
+        트리 전체를 순회하여 ID 인덱스 재구성
+
+        ProjectManager 를 거치지 않고 트리를 직접 수정한 경우 호출한다.
+        (조회 시에는 재구성하지 않으므로, 직접 수정한 쪽에서 반드시 호출해야 함)
+        """
+        with self._lock:
+            self._request_index = {}
+            self._folder_index = {}
+            self._index_subtree(self._root_folder, None)
+
+    def _index_subtree(self, folder: RequestFolder, parent: Optional[RequestFolder]):
+        """폴더와 그 하위 전체를 인덱스에 등록 (반복 순회)"""
+        stack = [(folder, parent)]
+        while stack:
+            current, current_parent = stack.pop()
+            self._folder_index[current.id] = (current, current_parent)
+            for req in current.requests:
+                self._request_index[req.id] = (req, current)
+            for sub_folder in current.folders:
+                stack.append((sub_folder, current))
+
+    def _unindex_subtree(self, folder: RequestFolder):
+        """폴더와 그 하위 전체를 인덱스에서 제거"""
+        stack = [folder]
+        while stack:
+            current = stack.pop()
+            self._folder_index.pop(current.id, None)
+            for req in current.requests:
+                self._request_index.pop(req.id, None)
+            stack.extend(current.folders)
+
+    def _folder_depth(self, folder: RequestFolder) -> int:
+        """폴더의 깊이 (루트는 0, 부모 체인 탐색)"""
+        depth = 0
+        entry = self._folder_index.get(folder.id)
+        while entry is not None and entry[1] is not None:
+            depth += 1
+            entry = self._folder_index.get(entry[1].id)
+        return depth
+
+    def _check_depth(self, folder: RequestFolder, parent: RequestFolder):
+        """folder 를 parent 아래에 두었을 때 최대 깊이를 넘으면 ValueError"""
+        if self._folder_depth(parent) + folder.subtree_depth() > RequestFolder.MAX_DEPTH:
+            raise ValueError(f"Folders cannot be nested more than {RequestFolder.MAX_DEPTH} levels deep")
+
+    def _lookup_request(self, request_id: str) -> Optional[Tuple[RequestModel, RequestFolder]]:
+        """인덱스에서 요청 조회"""
+        return self._request_index.get(request_id)
+
+    def _lookup_folder(self, folder_id: str) -> Optional[Tuple[RequestFolder, Optional[RequestFolder]]]:
+        """인덱스에서 폴더 조회"""
+        return self._folder_index.get(folder_id)
 
     def to_dict(self) -> Dict[str, Any]:
         """프로젝트 전체를 딕셔너리로 변환"""
@@ -35,19 +156,22 @@ class ProjectManager:
         manager.project_name = data.get("project_name", "Untitled Project")
         manager.root_folder = RequestFolder.from_dict(data.get("root_folder", {"name": "Root"}))
         manager.env_manager = EnvironmentManager.from_dict(data.get("environment_manager", {}))
+        # 불러온 직후는 저장된 상태와 동일
+        manager.mark_saved(manager.version)
         return manager
 
-    def save_to_file(self, file_path: str):
+    def save_to_file(self, file_path: str, mark_saved: bool = True):
         """
-        프로젝트를 JSON 파일로 저장
+        프로젝트를 JSON 파일로 저장 (임시 파일 + rename)
 
         Args:
             file_path: 저장할 파일 경로
+            mark_saved: 저장 완료로 표시할지 여부 (내보내기 용도이면 False)
         """
-        with self._lock:
-            data = self.to_dict()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+        version, data = self.snapshot()
+        atomic_write_json(file_path, data)
+        if mark_saved:
+            self.mark_saved(version)
 
     @classmethod
     def load_from_file(cls, file_path: str) -> 'ProjectManager':
@@ -66,61 +190,83 @@ class ProjectManager:
 
     def find_request_by_id(self, request_id: str, folder: Optional[RequestFolder] = None) -> Optional[RequestModel]:
         """
-        ID로 요청 찾기 (재귀적 탐색)
+        ID로 요청 찾기 (인덱스 조회)
 
         Args:
             request_id: 요청 ID
-            folder: 검색할 폴더 (None이면 루트부터)
+            folder: 검색할 폴더 (None이면 프로젝트 전체)
 
         Returns:
             찾은 요청 또는 None
         """
         with self._lock:
-            if folder is None:
-                folder = self.root_folder
-
-            # 현재 폴더의 요청 검색
-            for req in folder.requests:
-                if req.id == request_id:
-                    return req
-
-            # 하위 폴더 재귀 검색
-            for sub_folder in folder.folders:
-                result = self.find_request_by_id(request_id, sub_folder)
-                if result:
-                    return result
-
-            return None
+            entry = self._lookup_request(request_id)
+            if entry is None:
+                return None
+            if folder is not None and not self._is_within(entry[1], folder):
+                return None
+            return entry[0]
 
     def find_folder_by_id(self, folder_id: str, folder: Optional[RequestFolder] = None) -> Optional[RequestFolder]:
         """
-        ID로 폴더 찾기 (재귀적 탐색)
+        ID로 폴더 찾기 (인덱스 조회)
 
         Args:
             folder_id: 폴더 ID
-            folder: 검색할 폴더 (None이면 루트부터)
+            folder: 검색할 폴더 (None이면 프로젝트 전체)
 
         Returns:
             찾은 폴더 또는 None
         """
         with self._lock:
-            if folder is None:
-                folder = self.root_folder
+            entry = self._lookup_folder(folder_id)
+            if entry is None:
+                return None
+            if folder is not None and not self._is_within(entry[0], folder):
+                return None
+            return entry[0]
+
+    def get_parent_folder(self, node_id: str) -> Optional[RequestFolder]:
+        """
+        요청 또는 폴더의 부모 폴더 찾기
 
-            if folder.id == folder_id:
-                return folder
+        Args:
+            node_id: 요청 ID 또는 폴더 ID
+
+        Returns:
+            부모 폴더 (루트이거나 없으면 None)
+        """
+        with self._lock:
+            entry = self._lookup_request(node_id) or self._lookup_folder(node_id)
+            return entry[1] if entry else None
+
+    def get_retry_policy(self, request_id: str) -> Optional[RetryPolicy]:
+        """
+        요청에 적용할 재시도 정책 (요청 정책, 없으면 가장 가까운 상위 폴더 정책)
 
-            # 하위 폴더 재귀 검색
-            for sub_folder in folder.folders:
-                result = self.find_folder_by_id(folder_id, sub_folder)
-                if result:
-                    return result
+        Args:
+            request_id: 요청 ID
 
+        Returns:
+            재시도 정책 (없으면 None)
+        """
+        with self._lock:
+            entry = self._lookup_request(request_id)
+            if entry is None:
+                return None
+            request, folder = entry
+            if request.retry_policy is not None:
+                return request.retry_policy
+            while folder is not None:
+                if folder.retry_policy is not None:
+                    return folder.retry_policy
+                folder_entry = self._lookup_folder(folder.id)
+                folder = folder_entry[1] if folder_entry else None
             return None
 
     def get_all_requests(self, folder: Optional[RequestFolder] = None) -> List[RequestModel]:
         """
-        모든 요청 가져오기 (재귀적)
+        모든 요청 가져오기 (트리 순서)
 
         Args:
             folder: 검색할 폴더 (None이면 루트부터)
@@ -132,94 +278,218 @@ class ProjectManager:
             if folder is None:
                 folder = self.root_folder
 
-            requests = list(folder.requests)
-
-            # 하위 폴더의 요청들도 추가
-            for sub_folder in folder.folders:
-                requests.extend(self.get_all_requests(sub_folder))
+            requests = []
+            stack = [folder]
+            while stack:
+                current = stack.pop()
+                requests.extend(current.requests)
+                # 하위 폴더를 원래 순서대로 방문하도록 역순으로 쌓음
+                stack.extend(reversed(current.folders))
 
             return requests
 
-    def remove_folder_recursive(self, folder_id: str, parent: Optional[RequestFolder] = None) -> bool:
+    def add_request(self, request: RequestModel, folder: Optional[RequestFolder] = None):
         """
-        폴더를 재귀적으로 삭제
+        요청 추가
 
         Args:
-            folder_id: 삭제할 폴더 ID
-            parent: 부모 폴더 (None이면 루트부터)
+            request: 추가할 요청
+            folder: 대상 폴더 (None이면 루트)
+        """
+        with self._lock:
+            if folder is None:
+                folder = self.root_folder
+            folder.add_request(request)
+            self._request_index[request.id] = (request, folder)
+            self._version += 1
 
-        Returns:
-            삭제 성공 여부
+    def add_folder(self, folder: RequestFolder, parent: Optional[RequestFolder] = None):
+        """
+        폴더 추가 (하위 트리 전체를 인덱스에 등록하므로 임포트 결과에도 사용)
+
+        Args:
+            folder: 추가할 폴더
+            parent: 부모 폴더 (None이면 루트)
+
+        Raises:
+            ValueError: 폴더 깊이가 RequestFolder.MAX_DEPTH 를 넘는 경우
         """
         with self._lock:
             if parent is None:
                 parent = self.root_folder
+            self._check_depth(folder, parent)
+            parent.add_folder(folder)
+            self._index_subtree(folder, parent)
+            self._version += 1
 
-            # 직접 자식 폴더 검색 및 삭제
-            if parent.remove_folder(folder_id):
-                return True
+    def replace_folder(self, folder_id: str, new_folder: RequestFolder) -> bool:
+        """
+        폴더를 같은 위치에서 다른 폴더로 교체 (재임포트용)
 
-            # 하위 폴더에서 재귀적으로 삭제
-            for sub_folder in parent.folders:
-                if self.remove_folder_recursive(folder_id, sub_folder):
-                    return True
+        Args:
+            folder_id: 교체할 폴더 ID
+            new_folder: 새 폴더
+
+        Returns:
+            교체 성공 여부
 
+        Raises:
+            ValueError: 폴더 깊이가 RequestFolder.MAX_DEPTH 를 넘는 경우
+        """
+        with self._lock:
+            entry = self._lookup_folder(folder_id)
+            if entry is None or entry[1] is None:
+                return False
+            old_folder, parent = entry
+            self._check_depth(new_folder, parent)
+            for idx, folder in enumerate(parent.folders):
+                if folder is old_folder:
+                    parent.folders[idx] = new_folder
+                    self._unindex_subtree(old_folder)
+                    self._index_subtree(new_folder, parent)
+                    self._version += 1
+                    return True
             return False
 
+    def remove_folder_recursive(self, folder_id: str, parent: Optional[RequestFolder] = None) -> bool:
+        """
+        폴더 삭제 (하위 폴더/요청 포함)
+
+        Args:
+            folder_id: 삭제할 폴더 ID
+            parent: 부모 폴더 (None이면 프로젝트 전체에서 검색)
+
+        Returns:
+            삭제 성공 여부
+        """
+        with self._lock:
+            entry = self._lookup_folder(folder_id)
+            if entry is None or entry[1] is None:
+                return False
+            folder, folder_parent = entry
+            if parent is not None and not self._is_within(folder_parent, parent):
+                return False
+
+            if not folder_parent.remove_folder(folder_id):
+                return False
+            self._unindex_subtree(folder)
+            self._version += 1
+            return True
+
     def remove_request_recursive(self, request_id: str, folder: Optional[RequestFolder] = None) -> bool:
         """
-        요청을 재귀적으로 삭제
+        요청 삭제
 
         Args:
             request_id: 삭제할 요청 ID
-            folder: 검색할 폴더 (None이면 루트부터)
+            folder: 검색할 폴더 (None이면 프로젝트 전체)
 
         Returns:
             삭제 성공 여부
         """
         with self._lock:
-            if folder is None:
-                folder = self.root_folder
+            entry = self._lookup_request(request_id)
+            if entry is None:
+                return False
+            if folder is not None and not self._is_within(entry[1], folder):
+                return False
+
+            if not entry[1].remove_request(request_id):
+                return False
+            del self._request_index[request_id]
+            self._version += 1
+            return True
+
+    def move_request(self, request_id: str, target_folder: RequestFolder) -> bool:
+        """
+        요청을 다른 폴더로 이동
 
-            # 현재 폴더에서 요청 삭제 시도
-            if folder.remove_request(request_id):
-                return True
+        Args:
+            request_id: 이동할 요청 ID
+            target_folder: 대상 폴더
 
-            # 하위 폴더에서 재귀적으로 삭제
-            for sub_folder in folder.folders:
-                if self.remove_request_recursive(request_id, sub_folder):
-                    return True
+        Returns:
+            이동 성공 여부
+        """
+        with self._lock:
+            entry = self._lookup_request(request_id)
+            if entry is None:
+                return False
+            req, parent = entry
+            if not parent.remove_request(request_id):
+                return False
+            target_folder.add_request(req)
+            self._request_index[request_id] = (req, target_folder)
+            self._version += 1
+            return True
+
+    def move_folder(self, folder_id: str, target_folder: RequestFolder) -> bool:
+        """
+        폴더를 다른 폴더 아래로 이동 (자기 자신이나 하위로는 이동 불가)
 
-            return False
+        Args:
+            folder_id: 이동할 폴더 ID
+            target_folder: 대상 폴더
+
+        Returns:
+            이동 성공 여부
+
+        Raises:
+            ValueError: 폴더 깊이가 RequestFolder.MAX_DEPTH 를 넘는 경우
+        """
+        with self._lock:
+            entry = self._lookup_folder(folder_id)
+            if entry is None or entry[1] is None:
+                return False
+            folder, parent = entry
+            if self._is_within(target_folder, folder):
+                return False
+            self._check_depth(folder, target_folder)
+            if not parent.remove_folder(folder_id):
+                return False
+            target_folder.add_folder(folder)
+            # 하위 노드의 부모는 그대로이므로 폴더 자신만 갱신
+            self._folder_index[folder_id] = (folder, target_folder)
+            self._version += 1
+            return True
 
     def is_descendant(self, potential_descendant_id: str, ancestor_id: str, folder: Optional[RequestFolder] = None) -> bool:
         """
         한 폴더가 다른 폴더의 하위인지 확인 (순환 참조 방지용)
 
+        부모 체인을 따라 올라가므로 트리 깊이에만 비례한다.
+
         Args:
             potential_descendant_id: 하위일 가능성이 있는 폴더 ID
             ancestor_id: 상위 폴더 ID
-            folder: 검색을 시작할 폴더 (None이면 ancestor부터)
+            folder: 사용하지 않음 (하위 호환용)
 
         Returns:
             True if potential_descendant is a descendant of ancestor
         """
         with self._lock:
-            if folder is None:
-                folder = self.find_folder_by_id(ancestor_id)
-                if not folder:
-                    return False
+            entry = self._lookup_folder(potential_descendant_id)
+            if entry is None or self._lookup_folder(ancestor_id) is None:
+                return False
 
-            # 직접 자식 폴더 검색
-            for sub_folder in folder.folders:
-                if sub_folder.id == potential_descendant_id:
-                    return True
-                # 재귀적으로 하위 폴더 검색
-                if self.is_descendant(potential_descendant_id, ancestor_id, sub_folder):
+            parent = entry[1]
+            while parent is not None:
+                if parent.id == ancestor_id:
                     return True
-
+                parent_entry = self._folder_index.get(parent.id)
+                parent = parent_entry[1] if parent_entry else None
             return False
 
+    def _is_within(self, folder: RequestFolder, ancestor: RequestFolder) -> bool:
+        """folder 가 ancestor 자신이거나 그 하위인지 확인 (부모 체인 탐색)"""
+        current: Optional[RequestFolder] = folder
+        while current is not None:
+            if current is ancestor:
+                return True
+            entry = self._folder_index.get(current.id)
+            current = entry[1] if entry else None
+        return False
+
     def create_sample_project(self):
         """샘플 프로젝트 생성 (테스트용)"""
         with self._lock:
@@ -246,13 +516,13 @@ class ProjectManager:
             req3.headers = {"Content-Type": "application/json"}
 
             # 루트 폴더에 추가
-            self.root_folder.add_request(req1)
-            self.root_folder.add_request(req2)
+            self.add_request(req1)
+            self.add_request(req2)
 
             # 하위 폴더 생성
             posts_folder = RequestFolder("Posts")
             posts_folder.add_request(req3)
-            self.root_folder.add_folder(posts_folder)
+            self.add_folder(posts_folder)
 
             # 샘플 환경 변수 생성
             from models.environment import Environment
@@ -0,0 +1,237 @@
+"""
+HTTP 요청 실행 추적
+연결 단계(DNS 조회, TCP 연결, TLS 핸드셰이크, 전송, 첫 바이트 대기)의 시각을
+단조 시계(time.perf_counter)로 기록하고 진행 이벤트를 콜백으로 전달한다.
+
+requests 세션에 TracingHTTPAdapter 를 마운트하면, RequestTrace 가 활성화된
+스레드에서 실행되는 요청의 urllib3 연결이 자신의 단계를 기록한다.
+"""
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+
+
+# 이벤트 콜백: (이벤트 이름, 데이터)
+TraceCallback = Callable[[str, Dict[str, Any]], None]
+
+_local = threading.local()
+
+
+class RequestTrace:
+    """
+    단일 요청 실행 추적
+
+    단계별 소요 시간(ms)은 phases 에 누적된다 (리다이렉트로 연결이 여러 번 생기면 합산).
+    재사용된 연결에서는 dns/connect/tls 단계가 기록되지 않는다.
+    """
+
+    def __init__(self, on_event: Optional[TraceCallback] = None):
+        self.on_event = on_event
+        self.started_at = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.new_connections = 0
+        self.last_connected_at: Optional[float] = None
+        self.headers_received_at: Optional[float] = None
+
+    def elapsed_ms(self, now: Optional[float] = None) -> float:
+        """추적 시작 이후 경과 시간 (ms)"""
+        return ((now if now is not None else time.perf_counter()) - self.started_at) * 1000
+
+    def add_phase(self, name: str, seconds: float):
+        """단계 소요 시간 누적"""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds * 1000
+
+    def get_timings(self, finished_at: Optional[float] = None) -> Dict[str, float]:
+        """
+        단계별 소요 시간 (ms)
+
+        Args:
+            finished_at: 본문 수신 완료 시각 (perf_counter, None이면 현재)
+
+        Returns:
+            dns/connect/tls/send/wait 중 기록된 단계, download (응답 헤더 이후), total
+        """
+        finished_at = finished_at if finished_at is not None else time.perf_counter()
+        timings = dict(self.phases)
+        if self.headers_received_at is not None:
+            timings['download'] = (finished_at - self.headers_received_at) * 1000
+        timings['total'] = self.elapsed_ms(finished_at)
+        return timings
+
+    def emit(self, event: str, **data):
+        """진행 이벤트 전달 (콜백이 예외를 던지면 요청이 중단됨)"""
+        if self.on_event is not None:
+            data['elapsed_ms'] = self.elapsed_ms()
+            self.on_event(event, data)
+
+    @contextmanager
+    def activate(self):
+        """현재 스레드에서 실행되는 요청에 이 추적을 적용"""
+        previous = getattr(_local, 'trace', None)
+        _local.trace = self
+        try:
+            yield self
+        finally:
+            _local.trace = previous
+
+
+def current_trace() -> Optional[RequestTrace]:
+    """현재 스레드에 활성화된 추적 (없으면 None)"""
+    return getattr(_local, 'trace', None)
+
+
+class _TracingConnectionMixin:
+    """urllib3 연결에 단계별 시각 기록 추가"""
+
+    def _new_conn(self):
+        trace = current_trace()
+        if trace is None:
+            return super()._new_conn()
+
+        # DNS 조회를 따로 재기 위해 직접 조회한 뒤 주소별로 연결 (Happy Eyeballs 없이 순서대로)
+        dns_start = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(self._dns_host, self.port, 0, socket.SOCK_STREAM)
+        except socket.gaierror:
+            # 조회 실패 시 urllib3 가 버전에 맞는 예외를 만들도록 위임
+            return super()._new_conn()
+        connect_start = time.perf_counter()
+        trace.add_phase('dns', connect_start - dns_start)
+        trace.emit('dns', host=self.host, addresses=[info[4][0] for info in addresses])
+
+        dns_host = self._dns_host
+        last_error = None
+        try:
+            for info in addresses:
+                self._dns_host = info[4][0]
+                try:
+                    sock = super()._new_conn()
+                    break
+                except NewConnectionError as e:
+                    last_error = e
+            else:
+                raise last_error
+        finally:
+            self._dns_host = dns_host
+
+        connected_at = time.perf_counter()
+        trace.add_phase('connect', connected_at - connect_start)
+        trace.new_connections += 1
+        trace.last_connected_at = connected_at
+        trace.emit('connect', address=sock.getpeername()[0] if hasattr(sock, 'getpeername') else None)
+        return sock
+
+    def request(self, *args, **kwargs):
+        self._trace_request_start = time.perf_counter()
+        return super().request(*args, **kwargs)
+
+    def getresponse(self, *args, **kwargs):
+        trace = current_trace()
+        if trace is None:
+            return super().getresponse(*args, **kwargs)
+
+        # 요청 전송 완료 - HTTP 에서는 request() 안에서 연결하므로 연결 시간은 제외
+        sent_at = time.perf_counter()
+        send_start = getattr(self, '_trace_request_start', sent_at)
+        if trace.last_connected_at is not None and trace.last_connected_at > send_start:
+            send_start = trace.last_connected_at
+        trace.add_phase('send', sent_at - send_start)
+        trace.emit('sent')
+
+        response = super().getresponse(*args, **kwargs)
+        trace.headers_received_at = time.perf_counter()
+        trace.add_phase('wait', trace.headers_received_at - sent_at)
+        return response
+
+
+class TracingHTTPConnection(_TracingConnectionMixin, HTTPConnection):
+    """단계 기록 HTTP 연결"""
+
+
+class TracingHTTPSConnection(_TracingConnectionMixin, HTTPSConnection):
+    """단계 기록 HTTPS 연결 (TLS 핸드셰이크 포함)"""
+
+    def connect(self):
+        super().connect()
+        trace = current_trace()
+        if trace is not None and trace.last_connected_at is not None:
+            handshake_done = time.perf_counter()
+            trace.add_phase('tls', handshake_done - trace.last_connected_at)
+            trace.last_connected_at = handshake_done
+            version = self.sock.version() if hasattr(self.sock, 'version') else None
+            trace.emit('tls', version=version)
+
+
+class TracingHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TracingHTTPConnection
+
+
+class TracingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TracingHTTPSConnection
+
+
+class TracingHTTPAdapter(HTTPAdapter):
+    """
+    연결 단계를 기록하는 연결 풀을 사용하는 어댑터
+
+    pool_connections (풀을 유지할 호스트 수), pool_maxsize (호스트별 유지 연결 수),
+    pool_block (maxsize 를 넘으면 새 연결 대신 대기) 는 HTTPAdapter 와 같다.
+    """
+
+    POOL_CLASSES = {
+        'http': TracingHTTPConnectionPool,
+        'https': TracingHTTPSConnectionPool,
+    }
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = dict(self.POOL_CLASSES)
+
+    def proxy_manager_for(self, *args, **kwargs):
+        manager = super().proxy_manager_for(*args, **kwargs)
+        manager.pool_classes_by_scheme = dict(self.POOL_CLASSES)
+        return manager
+
+    def get_pool_stats(self) -> List[Dict[str, Any]]:
+        """
+        호스트별 연결 풀 상태
+
+        Returns:
+            [{'scheme', 'host', 'port', 'open', 'idle', 'in_use', 'maxsize',
+              'connections_created', 'requests'}, ...]
+        """
+        stats = []
+        for manager in [self.poolmanager, *self.proxy_manager.values()]:
+            pools = manager.pools
+            # 조회만으로 LRU 순서가 바뀌지 않도록 내부 컨테이너를 잠금 안에서 복사
+            with pools.lock:
+                connection_pools = list(pools._container.values())
+
+            for pool in connection_pools:
+                queue = pool.pool
+                if queue is None:  # 닫힌 풀
+                    continue
+                with queue.mutex:
+                    slots = list(queue.queue)
+                # 큐에는 유휴 연결과 아직 만들지 않은 자리(None)가 들어 있음
+                idle = sum(1 for conn in slots if conn is not None and getattr(conn, 'sock', None) is not None)
+                in_use = max(queue.maxsize - len(slots), 0)
+                stats.append({
+                    'scheme': pool.scheme,
+                    'host': pool.host,
+                    'port': pool.port,
+                    'open': idle + in_use,
+                    'idle': idle,
+                    'in_use': in_use,
+                    'maxsize': queue.maxsize,
+                    'connections_created': pool.num_connections,
+                    'requests': pool.num_requests,
+                })
+        return stats
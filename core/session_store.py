@@ -0,0 +1,325 @@
+"""
+웹 서버 세션 저장소
+세션(프로젝트 목록, 활성 프로젝트, 마지막 접근 시간)을 영속화하는 백엔드
+"""
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+from utils.file_utils import atomic_write_json
+from utils.sqlite_utils import ThreadLocalConnections
+
+
+class SessionConflictError(Exception):
+    """저장소의 세션이 로드한 이후 다른 프로세스에 의해 변경됨"""
+
+
+class SessionStore(ABC):
+    """
+    세션 저장소 인터페이스
+
+    세션 데이터 형식:
+        {
+            'session_id': str,
+            'last_accessed': float,
+            'active_project_id': Optional[str],
+            'projects': {project_id: ProjectManager.to_dict() 결과},
+            'revision': 로드 시점의 revision (load_session 결과에만 포함)
+        }
+
+    revision 은 세션이 저장될 때마다 바뀌는 값으로, 다른 프로세스가 같은 세션을
+    수정했는지 확인하는 데 사용한다.
+    """
+
+    # 여러 프로세스가 같은 저장소를 공유할 수 있는지 여부
+    supports_multiprocess = False
+
+    @abstractmethod
+    def load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """세션 데이터 로드 (없으면 None)"""
+
+    @abstractmethod
+    def save_session(self, session_id: str, active_project_id: Optional[str], last_accessed: float,
+                     projects: Dict[str, Dict[str, Any]], changed: Optional[Iterable[str]] = None,
+                     removed: Optional[Iterable[str]] = None, expected_revision: Optional[int] = None) -> int:
+        """
+        세션 데이터 저장
+
+        Args:
+            session_id: 세션 ID
+            active_project_id: 활성 프로젝트 ID
+            last_accessed: 마지막 접근 시간
+            projects: 세션의 모든 프로젝트 {project_id: 프로젝트 데이터}
+            changed: 실제로 변경된 프로젝트 ID (None이면 전부)
+            removed: 이 프로세스에서 삭제한 프로젝트 ID (저장소에서도 삭제됨)
+            expected_revision: 로드(또는 마지막 저장) 시점의 revision (None이면 아직 저장소에 없는 세션).
+                               supports_multiprocess 저장소에서만 확인한다
+
+        Returns:
+            저장 후 revision
+
+        Raises:
+            SessionConflictError: 저장소의 revision 이 expected_revision 과 다른 경우
+        """
+
+    @abstractmethod
+    def has_session(self, session_id: str) -> bool:
+        """세션이 저장되어 있는지 확인"""
+
+    @abstractmethod
+    def get_revision(self, session_id: str) -> Optional[int]:
+        """세션의 현재 revision (없으면 None)"""
+
+    @abstractmethod
+    def touch(self, session_id: str, last_accessed: float):
+        """마지막 접근 시간만 갱신"""
+
+    @abstractmethod
+    def delete_session(self, session_id: str):
+        """세션 삭제"""
+
+    @abstractmethod
+    def list_sessions(self) -> List[Tuple[str, float]]:
+        """저장된 모든 세션의 (세션 ID, 마지막 접근 시간) 목록"""
+
+    def close(self):
+        """저장소 닫기"""
+
+
+class JsonFileSessionStore(SessionStore):
+    """
+    세션당 JSON 파일 하나를 사용하는 저장소 (기본값, 단일 프로세스용)
+
+    마지막 접근 시간은 파일 수정 시간으로도 기록되며, revision 은 수정 시간(ns)이다.
+    """
+
+    def __init__(self, data_dir: Path):
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(exist_ok=True)
+
+    def _session_file(self, session_id: str) -> Path:
+        return self.data_dir / f'session_{session_id}.json'
+
+    def load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        session_file = self._session_file(session_id)
+        revision = self.get_revision(session_id)
+        if revision is None:
+            return None
+        with open(session_file, 'r', encoding='utf-8') as f:
+            session_data = json.load(f)
+        session_data['revision'] = revision
+        return session_data
+
+    def save_session(self, session_id: str, active_project_id: Optional[str], last_accessed: float,
+                     projects: Dict[str, Dict[str, Any]], changed: Optional[Iterable[str]] = None,
+                     removed: Optional[Iterable[str]] = None, expected_revision: Optional[int] = None) -> int:
+        # 파일 하나에 세션 전체를 쓰므로 changed/removed 는 사용하지 않음 (단일 프로세스라 revision 확인도 생략)
+        session_file = self._session_file(session_id)
+        atomic_write_json(session_file, {
+            'session_id': session_id,
+            'last_accessed': last_accessed,
+            'active_project_id': active_project_id,
+            'projects': projects,
+        })
+        return session_file.stat().st_mtime_ns
+
+    def has_session(self, session_id: str) -> bool:
+        return self._session_file(session_id).exists()
+
+    def get_revision(self, session_id: str) -> Optional[int]:
+        try:
+            return self._session_file(session_id).stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def touch(self, session_id: str, last_accessed: float):
+        try:
+            os.utime(self._session_file(session_id), (last_accessed, last_accessed))
+        except OSError:
+            pass
+
+    def delete_session(self, session_id: str):
+        session_file = self._session_file(session_id)
+        if session_file.exists():
+            session_file.unlink()
+
+    def list_sessions(self) -> List[Tuple[str, float]]:
+        sessions = []
+        for session_file in self.data_dir.glob('session_*.json'):
+            try:
+                sessions.append((session_file.stem.replace('session_', ''), session_file.stat().st_mtime))
+            except OSError:
+                pass
+        return sessions
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    SQLite 저장소 (WAL 모드, 프로젝트별 행)
+
+    여러 워커 프로세스가 같은 DB 파일을 공유할 수 있다.
+    변경된 프로젝트 행만 다시 쓰고, 저장 트랜잭션 안에서 revision 을 비교하여
+    다른 워커가 먼저 저장한 세션을 덮어쓰지 않는다 (SessionConflictError).
+    """
+
+    supports_multiprocess = True
+
+    BUSY_TIMEOUT_MS = 5000
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS sessions (
+            session_id TEXT PRIMARY KEY,
+            active_project_id TEXT,
+            last_accessed REAL NOT NULL,
+            revision INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS projects (
+            session_id TEXT NOT NULL,
+            project_id TEXT NOT NULL,
+            data TEXT NOT NULL,
+            PRIMARY KEY (session_id, project_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_sessions_last_accessed ON sessions (last_accessed);
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = str(db_path)
+        self._connections = ThreadLocalConnections(self.db_path, self.BUSY_TIMEOUT_MS)
+
+        conn = self._get_connection()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript(self.SCHEMA)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """현재 스레드의 연결"""
+        return self._connections.get()
+
+    def load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        conn = self._get_connection()
+        # 세션 행과 프로젝트 행을 같은 스냅샷에서 읽음
+        conn.execute('BEGIN')
+        try:
+            row = conn.execute(
+                'SELECT active_project_id, last_accessed, revision FROM sessions WHERE session_id = ?',
+                (session_id,)
+            ).fetchone()
+            project_rows = conn.execute(
+                'SELECT project_id, data FROM projects WHERE session_id = ?', (session_id,)
+            ).fetchall() if row else []
+        finally:
+            conn.execute('COMMIT')
+
+        if row is None:
+            return None
+
+        return {
+            'session_id': session_id,
+            'active_project_id': row[0],
+            'last_accessed': row[1],
+            'revision': row[2],
+            'projects': {project_id: json.loads(data) for project_id, data in project_rows},
+        }
+
+    def save_session(self, session_id: str, active_project_id: Optional[str], last_accessed: float,
+                     projects: Dict[str, Dict[str, Any]], changed: Optional[Iterable[str]] = None,
+                     removed: Optional[Iterable[str]] = None, expected_revision: Optional[int] = None) -> int:
+        changed_ids = list(projects) if changed is None else [pid for pid in changed if pid in projects]
+        # 직렬화는 트랜잭션 밖에서 (쓰기 잠금 시간 최소화)
+        rows = [(session_id, pid, json.dumps(projects[pid], ensure_ascii=False)) for pid in changed_ids]
+        removed_rows = [(session_id, pid) for pid in (removed or ()) if pid not in projects]
+
+        conn = self._get_connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            # 쓰기 잠금을 잡은 뒤 비교하므로 비교와 저장 사이에 다른 워커가 끼어들 수 없음
+            row = conn.execute(
+                'SELECT revision FROM sessions WHERE session_id = ?', (session_id,)
+            ).fetchone()
+            stored_revision = row[0] if row else None
+            if stored_revision != expected_revision:
+                raise SessionConflictError(
+                    f"Session {session_id} was modified by another process "
+                    f"(revision {stored_revision}, expected {expected_revision})"
+                )
+
+            conn.execute(
+                """
+                INSERT INTO sessions (session_id, active_project_id, last_accessed, revision)
+                VALUES (?, ?, ?, 1)
+                ON CONFLICT(session_id) DO UPDATE SET
+                    active_project_id = excluded.active_project_id,
+                    last_accessed = MAX(sessions.last_accessed, excluded.last_accessed),
+                    revision = sessions.revision + 1
+                """,
+                (session_id, active_project_id, last_accessed)
+            )
+            conn.executemany(
+                'INSERT OR REPLACE INTO projects (session_id, project_id, data) VALUES (?, ?, ?)', rows
+            )
+
+            # 이 프로세스에서 삭제한 프로젝트만 삭제
+            conn.executemany('DELETE FROM projects WHERE session_id = ? AND project_id = ?', removed_rows)
+
+            revision = conn.execute(
+                'SELECT revision FROM sessions WHERE session_id = ?', (session_id,)
+            ).fetchone()[0]
+            conn.execute('COMMIT')
+            return revision
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+
+    def has_session(self, session_id: str) -> bool:
+        return self.get_revision(session_id) is not None
+
+    def get_revision(self, session_id: str) -> Optional[int]:
+        row = self._get_connection().execute(
+            'SELECT revision FROM sessions WHERE session_id = ?', (session_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def touch(self, session_id: str, last_accessed: float):
+        self._get_connection().execute(
+            'UPDATE sessions SET last_accessed = MAX(last_accessed, ?) WHERE session_id = ?',
+            (last_accessed, session_id)
+        )
+
+    def delete_session(self, session_id: str):
+        conn = self._get_connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute('DELETE FROM projects WHERE session_id = ?', (session_id,))
+            conn.execute('DELETE FROM sessions WHERE session_id = ?', (session_id,))
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+
+    def list_sessions(self) -> List[Tuple[str, float]]:
+        return self._get_connection().execute('SELECT session_id, last_accessed FROM sessions').fetchall()
+
+    def close(self):
+        self._connections.close_all()
+
+
+def create_session_store(spec: Optional[str], data_dir: Path) -> SessionStore:
+    """
+    설정 문자열로 세션 저장소 생성
+
+    Args:
+        spec: 'json' (기본), 'sqlite' (data_dir/sessions.db), 'sqlite:///경로'
+        data_dir: 데이터 디렉토리
+
+    Returns:
+        세션 저장소
+    """
+    spec = (spec or 'json').strip()
+    if spec == 'json':
+        return JsonFileSessionStore(data_dir)
+    if spec == 'sqlite':
+        return SQLiteSessionStore(Path(data_dir) / 'sessions.db')
+    if spec.startswith('sqlite:///'):
+        return SQLiteSessionStore(Path(spec[len('sqlite:///'):]))
+    raise ValueError(f"Unknown session store: {spec}")
@@ -1,5 +1,5 @@
-from .request_model import RequestModel, RequestFolder
+from .request_model import RequestModel, RequestFolder, RetryPolicy
 from .environment import Environment
 from .response_model import ResponseModel
 
-__all__ = ['RequestModel', 'RequestFolder', 'Environment', 'ResponseModel']
+__all__ = ['RequestModel', 'RequestFolder', 'RetryPolicy', 'Environment', 'ResponseModel']
@@ -1,67 +1,103 @@
 """
 요청/응답 히스토리 모델
 """
+import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any, List
+from itertools import islice
+from typing import Dict, Any, List, Optional, Tuple
 from models.request_model import RequestModel
 from models.response_model import ResponseModel
 
 
 class HistoryEntry:
-    """단일 히스토리 항목"""
+    """
+    단일 히스토리 항목
+
+    요청/응답 객체 자체를 참조하지 않고 표시에 필요한 값만 복사해 둔다.
+    (응답 본문 전체가 히스토리에 남아 메모리를 차지하지 않도록)
+    """
+
+    __slots__ = ('request_id', 'created_at', 'request_snapshot', 'status_code', 'status_text',
+                 'elapsed_ms', 'timings', 'attempts', 'size_bytes', 'headers', 'body_preview', 'error')
+
+    # 응답 본문은 앞부분만 보관 (1KB)
+    MAX_BODY_CHARS = 1000
+    # 요청 본문 보관 한도 (히스토리에서 요청 복원용)
+    MAX_REQUEST_BODY_CHARS = 64 * 1024
 
     def __init__(self, request: RequestModel, response: ResponseModel):
-        self.timestamp = datetime.now()
-        self.request = request
-        self.response = response
+        self.request_id = request.id
+        self.created_at = time.time()
+        request_body = request.body_raw[:self.MAX_REQUEST_BODY_CHARS] if request.body_raw else None
         self.request_snapshot = {
             'name': request.name,
             'method': request.method.value,
             'url': request.url,
             'headers': dict(request.headers),
             'params': dict(request.params),
-            'body': request.body_raw if request.body_raw else None
+            'body': request_body
         }
+        self.status_code = response.status_code
+        self.status_text = response.status_text
+        self.elapsed_ms = response.elapsed_ms
+        self.timings = dict(response.timings)
+        # 재시도 기록 (시도별 단계 시간은 빼고 결과만)
+        self.attempts = [
+            {key: value for key, value in attempt.items() if key != 'timings'} for attempt in response.attempts
+        ]
+        self.size_bytes = response.size_bytes
+        self.headers = dict(response.headers)
+        self.body_preview = response.get_body_preview(self.MAX_BODY_CHARS) or None
+        self.error = response.error
+
+    @property
+    def timestamp(self) -> datetime:
+        """항목 생성 시각"""
+        return datetime.fromtimestamp(self.created_at)
 
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
         return {
+            'request_id': self.request_id,
             'timestamp': self.timestamp.isoformat(),
             'request': self.request_snapshot,
             'response': {
-                'status_code': self.response.status_code,
-                'status_text': self.response.status_text,
-                'elapsed_ms': self.response.elapsed_ms,
-                'size_bytes': self.response.size_bytes,
-                'headers': self.response.headers,
-                'body': self.response.body[:1000] if self.response.body else None,  # 1KB 제한
-                'error': self.response.error
+                'status_code': self.status_code,
+                'status_text': self.status_text,
+                'elapsed_ms': self.elapsed_ms,
+                'timings': self.timings,
+                'attempts': self.attempts,
+                'size_bytes': self.size_bytes,
+                'headers': self.headers,
+                'body': self.body_preview,
+                'error': self.error
             }
         }
 
 
 class RequestHistory:
-    """요청별 히스토리 관리"""
+    """
+    요청별 히스토리 관리
+
+    고정 크기 링 버퍼: 가득 차면 가장 오래된 항목이 O(1)로 밀려난다.
+    """
 
     def __init__(self, request_id: str, max_entries: int = 50):
         self.request_id = request_id
         self.max_entries = max_entries
-        self.entries: List[HistoryEntry] = []
+        # 최신 항목이 앞에
+        self.entries: deque = deque(maxlen=max_entries)
 
     def add_entry(self, request: RequestModel, response: ResponseModel):
         """히스토리 항목 추가"""
-        entry = HistoryEntry(request, response)
-        self.entries.insert(0, entry)  # 최신 항목이 앞에
-
-        # 최대 개수 제한
-        if len(self.entries) > self.max_entries:
-            self.entries = self.entries[:self.max_entries]
+        self.entries.appendleft(HistoryEntry(request, response))
 
-    def get_entries(self, limit: int = None) -> List[HistoryEntry]:
-        """히스토리 항목 가져오기"""
+    def get_entries(self, limit: Optional[int] = None) -> List[HistoryEntry]:
+        """히스토리 항목 가져오기 (최신순)"""
         if limit:
-            return self.entries[:limit]
-        return self.entries
+            return list(islice(self.entries, limit))
+        return list(self.entries)
 
     def clear(self):
         """히스토리 초기화"""
@@ -77,28 +113,94 @@ class RequestHistory:
 
 
 class HistoryManager:
-    """전체 히스토리 관리자"""
+    """
+    전체 히스토리 관리자
+
+    store 를 지정하면 항목을 메모리 대신 저장소(core.history_store.HistoryStore)의
+    session_id/project_id 범위에 기록하고 조회한다.
+    """
 
-    def __init__(self):
+    def __init__(self, max_entries_per_request: int = 50, store=None,
+                 session_id: Optional[str] = None, project_id: Optional[str] = None):
+        self.max_entries_per_request = max_entries_per_request
         self.histories: Dict[str, RequestHistory] = {}
+        self.store = store
+        self.session_id = session_id
+        self.project_id = project_id
 
     def add_entry(self, request: RequestModel, response: ResponseModel):
         """히스토리 항목 추가"""
-        if request.id not in self.histories:
-            self.histories[request.id] = RequestHistory(request.id)
+        if self.store is not None:
+            entry = HistoryEntry(request, response)
+            self.store.add(self.session_id, self.project_id, request.id, entry.created_at, entry.to_dict())
+            return
 
-        self.histories[request.id].add_entry(request, response)
+        history = self.histories.get(request.id)
+        if history is None:
+            history = RequestHistory(request.id, self.max_entries_per_request)
+            self.histories[request.id] = history
+
+        history.add_entry(request, response)
 
     def get_history(self, request_id: str, limit: int = None) -> List[Dict[str, Any]]:
         """특정 요청의 히스토리 가져오기"""
+        if self.store is not None:
+            return self.query(request_id=request_id, limit=limit or self.max_entries_per_request)[1]
+
         if request_id not in self.histories:
             return []
 
         entries = self.histories[request_id].get_entries(limit)
         return [entry.to_dict() for entry in entries]
 
+    def query(self, request_id: Optional[str] = None, status_range: Optional[Tuple[int, int]] = None,
+              method: Optional[str] = None, since: Optional[float] = None, until: Optional[float] = None,
+              limit: int = 50, offset: int = 0) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        조건에 맞는 히스토리 조회 (최신순, 페이지 단위)
+
+        Args:
+            request_id: 요청 ID (None이면 전체)
+            status_range: 상태 코드 범위 (최소, 최대) - 양 끝 포함
+            method: HTTP 메서드
+            since: 이 시각 이후 (epoch 초, 포함)
+            until: 이 시각 이전 (epoch 초, 미포함)
+            limit: 최대 개수
+            offset: 건너뛸 개수
+
+        Returns:
+            (조건에 맞는 전체 개수, 항목 딕셔너리 목록)
+        """
+        if self.store is not None:
+            return self.store.query(self.session_id, self.project_id, request_id=request_id,
+                                    status_range=status_range, method=method, since=since, until=until,
+                                    limit=limit, offset=offset)
+
+        if request_id is not None:
+            histories = [self.histories[request_id]] if request_id in self.histories else []
+        else:
+            histories = list(self.histories.values())
+
+        method = method.upper() if method else None
+        matched = [
+            entry for history in histories for entry in history.entries
+            if (status_range is None or status_range[0] <= entry.status_code <= status_range[1])
+            and (method is None or entry.request_snapshot['method'] == method)
+            and (since is None or entry.created_at >= since)
+            and (until is None or entry.created_at < until)
+        ]
+        matched.sort(key=lambda entry: entry.created_at, reverse=True)
+        return len(matched), [entry.to_dict() for entry in matched[offset:offset + limit]]
+
     def get_all_histories(self) -> Dict[str, Any]:
-        """모든 히스토리 가져오기"""
+        """모든 히스토리 가져오기 (요청별 최근 max_entries_per_request 개)"""
+        if self.store is not None:
+            result = {}
+            for req_id in self.store.list_request_ids(self.session_id, self.project_id):
+                total, entries = self.query(request_id=req_id, limit=self.max_entries_per_request)
+                result[req_id] = {'request_id': req_id, 'count': total, 'entries': entries}
+            return result
+
         return {
             req_id: history.to_dict()
             for req_id, history in self.histories.items()
@@ -106,6 +208,10 @@ class HistoryManager:
 
     def clear_history(self, request_id: str = None):
         """히스토리 삭제"""
+        if self.store is not None:
+            self.store.clear(self.session_id, self.project_id, request_id)
+            return
+
         if request_id:
             if request_id in self.histories:
                 self.histories[request_id].clear()
@@ -1,7 +1,10 @@
 """
 HTTP 요청을 표현하는 데이터 모델
 """
+import random
+import time
 import uuid
+from email.utils import parsedate_to_datetime
 from typing import Dict, List, Optional, Any
 from enum import Enum
 
@@ -33,6 +36,171 @@ class BodyType(Enum):
     FORM_DATA = "form_data"
 
 
+class RetryPolicy:
+    """
+    요청 재시도 정책
+
+    재시도 대상 상태 코드를 받거나 재시도 대상 오류(timeout/connection)가 나면
+    max_attempts 까지 다시 보낸다. 대기 시간은 지수 백오프
+    (backoff_base_ms * backoff_factor ** (시도 - 1), 최대 backoff_max_ms) 이고,
+    jitter 를 켜면 0 ~ 그 값 사이에서 무작위로 고른다 (full jitter).
+    respect_retry_after 이면 응답의 Retry-After 를 우선한다 (backoff_max_ms 로 제한).
+    """
+
+    DEFAULT_RETRY_ON_STATUS = [429, 502, 503, 504]
+    RETRY_ERRORS = ('timeout', 'connection')  # 재시도할 수 있는 오류 종류
+    MAX_ATTEMPTS_LIMIT = 10
+    MAX_BACKOFF_LIMIT_MS = 60 * 1000
+
+    def __init__(self, max_attempts: int = 3, retry_on_status: Optional[List[int]] = None,
+                 retry_on_errors: Optional[List[str]] = None, backoff_base_ms: float = 500,
+                 backoff_factor: float = 2.0, backoff_max_ms: float = 10 * 1000,
+                 jitter: bool = True, respect_retry_after: bool = True):
+        self.max_attempts = max_attempts
+        self.retry_on_status: List[int] = (
+            list(self.DEFAULT_RETRY_ON_STATUS) if retry_on_status is None else retry_on_status
+        )
+        self.retry_on_errors: List[str] = list(self.RETRY_ERRORS) if retry_on_errors is None else retry_on_errors
+        self.backoff_base_ms = backoff_base_ms
+        self.backoff_factor = backoff_factor
+        self.backoff_max_ms = backoff_max_ms
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+
+    def should_retry_status(self, status_code: int) -> bool:
+        """재시도 대상 상태 코드인지 확인"""
+        return status_code in self.retry_on_status
+
+    def should_retry_error(self, error_kind: Optional[str]) -> bool:
+        """재시도 대상 오류인지 확인 (error_kind: 'timeout', 'connection' 등)"""
+        return error_kind is not None and error_kind in self.retry_on_errors
+
+    def get_delay_ms(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        다음 시도까지 대기 시간
+
+        Args:
+            attempt: 방금 끝난 시도 번호 (1부터)
+            retry_after: 응답의 Retry-After 헤더 값 (초 또는 HTTP 날짜)
+
+        Returns:
+            대기 시간 (ms)
+        """
+        if self.respect_retry_after and retry_after:
+            delay_ms = self._parse_retry_after_ms(retry_after)
+            if delay_ms is not None:
+                return min(delay_ms, self.backoff_max_ms)
+
+        delay_ms = min(self.backoff_base_ms * self.backoff_factor ** (attempt - 1), self.backoff_max_ms)
+        if self.jitter:
+            delay_ms = random.uniform(0, delay_ms)
+        return delay_ms
+
+    @staticmethod
+    def _parse_retry_after_ms(value: str) -> Optional[float]:
+        """Retry-After 값을 ms 로 변환 (해석할 수 없으면 None)"""
+        value = value.strip()
+        try:
+            return max(float(value), 0.0) * 1000
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at is None:
+            return None
+        return max(retry_at.timestamp() - time.time(), 0.0) * 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return {
+            "max_attempts": self.max_attempts,
+            "retry_on_status": self.retry_on_status,
+            "retry_on_errors": self.retry_on_errors,
+            "backoff_base_ms": self.backoff_base_ms,
+            "backoff_factor": self.backoff_factor,
+            "backoff_max_ms": self.backoff_max_ms,
+            "jitter": self.jitter,
+            "respect_retry_after": self.respect_retry_after,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RetryPolicy':
+        """
+        딕셔너리에서 복원 (값 검증 포함)
+
+        Raises:
+            ValueError: 잘못된 값
+        """
+        if not isinstance(data, dict):
+            raise ValueError("retry_policy must be an object")
+
+        # bool("false") 는 True 이므로 변환하지 않고 타입을 확인
+        flags = {}
+        for key in ("jitter", "respect_retry_after"):
+            value = data.get(key, True)
+            if not isinstance(value, bool):
+                raise ValueError(f"{key} must be a boolean")
+            flags[key] = value
+
+        retry_on_status = data.get("retry_on_status", cls.DEFAULT_RETRY_ON_STATUS)
+        if (not isinstance(retry_on_status, list)
+                or not all(isinstance(code, int) and not isinstance(code, bool) for code in retry_on_status)):
+            raise ValueError("retry_on_status must be a list of integer status codes")
+        if not all(100 <= code <= 599 for code in retry_on_status):
+            raise ValueError("retry_on_status codes must be between 100 and 599")
+
+        retry_on_errors = data.get("retry_on_errors", list(cls.RETRY_ERRORS))
+        if not isinstance(retry_on_errors, list) or not all(isinstance(kind, str) for kind in retry_on_errors):
+            raise ValueError("retry_on_errors must be a list of strings")
+
+        try:
+            policy = cls(
+                max_attempts=int(data.get("max_attempts", 3)),
+                retry_on_status=list(retry_on_status),
+                retry_on_errors=list(retry_on_errors),
+                backoff_base_ms=float(data.get("backoff_base_ms", 500)),
+                backoff_factor=float(data.get("backoff_factor", 2.0)),
+                backoff_max_ms=float(data.get("backoff_max_ms", 10 * 1000)),
+                **flags,
+            )
+        except (TypeError, ValueError):
+            raise ValueError("Invalid retry_policy")
+
+        if not 1 <= policy.max_attempts <= cls.MAX_ATTEMPTS_LIMIT:
+            raise ValueError(f"max_attempts must be between 1 and {cls.MAX_ATTEMPTS_LIMIT}")
+        if not 0 <= policy.backoff_max_ms <= cls.MAX_BACKOFF_LIMIT_MS:
+            raise ValueError(f"backoff_max_ms must be between 0 and {cls.MAX_BACKOFF_LIMIT_MS}")
+        if policy.backoff_base_ms < 0 or policy.backoff_factor < 1:
+            raise ValueError("backoff_base_ms must be >= 0 and backoff_factor >= 1")
+        unknown = set(policy.retry_on_errors) - set(cls.RETRY_ERRORS)
+        if unknown:
+            raise ValueError(f"Unknown retry_on_errors: {', '.join(sorted(unknown))}")
+        return policy
+
+    @classmethod
+    def from_stored(cls, data: Any, owner: str) -> Optional['RetryPolicy']:
+        """
+        저장된 데이터에서 복원 (잘못된 정책은 경고 후 버림)
+
+        API 입력과 달리 저장된 프로젝트는 정책 하나 때문에 불러오지 못하면 안 되므로
+        예외를 던지지 않는다.
+
+        Args:
+            data: 저장된 retry_policy 값
+            owner: 경고 메시지에 표시할 요청/폴더 이름
+
+        Returns:
+            재시도 정책 (잘못된 값이면 None)
+        """
+        try:
+            return cls.from_dict(data)
+        except ValueError as e:
+            print(f"Ignoring invalid retry_policy on '{owner}': {e}")
+            return None
+
+
 class RequestModel:
     """단일 HTTP 요청의 데이터 모델"""
 
@@ -66,6 +234,9 @@ class RequestModel:
         # API 문서 (마크다운)
         self.documentation = ""
 
+        # 재시도 정책 (None이면 상위 폴더 정책, 폴더에도 없으면 재시도하지 않음)
+        self.retry_policy: Optional[RetryPolicy] = None
+
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환 (JSON 저장용)"""
         return {
@@ -87,6 +258,15 @@ class RequestModel:
             "auth_api_key_value": self.auth_api_key_value,
             "auth_api_key_location": self.auth_api_key_location,
             "documentation": self.documentation,
+            "retry_policy": self.retry_policy.to_dict() if self.retry_policy else None,
+        }
+
+    def to_summary_dict(self) -> Dict[str, Any]:
+        """트리 표시용 요약 (ID, 이름, 메서드)"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "method": self.method.value,
         }
 
     @classmethod
@@ -110,6 +290,8 @@ class RequestModel:
         request.auth_api_key_value = data.get("auth_api_key_value", "")
         request.auth_api_key_location = data.get("auth_api_key_location", "header")
         request.documentation = data.get("documentation", "")
+        if data.get("retry_policy"):
+            request.retry_policy = RetryPolicy.from_stored(data["retry_policy"], request.name)
         return request
 
     def clone(self) -> 'RequestModel':
@@ -123,29 +305,83 @@ class RequestModel:
 class RequestFolder:
     """요청을 그룹화하는 폴더"""
 
+    # 최대 폴더 중첩 깊이 (루트 바로 아래가 1) - 저장 시 json 인코딩/디코딩의 재귀 한도보다 충분히 낮게
+    MAX_DEPTH = 100
+
     def __init__(self, name: str = "New Folder"):
         self.id = str(uuid.uuid4())
         self.name = name
         self.requests: List[RequestModel] = []
         self.folders: List['RequestFolder'] = []
+        # 하위 요청/폴더의 기본 재시도 정책 (None이면 상위 폴더 정책)
+        self.retry_policy: Optional[RetryPolicy] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """딕셔너리로 변환"""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "requests": [req.to_dict() for req in self.requests],
-            "folders": [folder.to_dict() for folder in self.folders],
-        }
+        """딕셔너리로 변환 (반복 순회)"""
+        return self._convert_tree(lambda folder: {
+            "id": folder.id,
+            "name": folder.name,
+            "requests": [req.to_dict() for req in folder.requests],
+            "folders": [],
+            "retry_policy": folder.retry_policy.to_dict() if folder.retry_policy else None,
+        })
+
+    def to_summary_dict(self) -> Dict[str, Any]:
+        """트리 표시용 요약 (폴더 구조와 요청 요약만, 반복 순회)"""
+        return self._convert_tree(lambda folder: {
+            "id": folder.id,
+            "name": folder.name,
+            "requests": [req.to_summary_dict() for req in folder.requests],
+            "folders": [],
+        })
+
+    def _convert_tree(self, convert) -> Dict[str, Any]:
+        """
+        하위 트리 전체를 딕셔너리로 변환 (깊은 트리에서도 재귀 한도에 걸리지 않도록 스택 사용)
+
+        Args:
+            convert: 폴더 하나를 "folders" 가 빈 리스트인 딕셔너리로 변환하는 함수
+        """
+        result = convert(self)
+        stack = [(self, result)]
+        while stack:
+            folder, data = stack.pop()
+            for sub_folder in folder.folders:
+                sub_data = convert(sub_folder)
+                data["folders"].append(sub_data)
+                stack.append((sub_folder, sub_data))
+        return result
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'RequestFolder':
-        """딕셔너리에서 복원"""
-        folder = cls(data.get("name", "New Folder"))
-        folder.id = data.get("id", str(uuid.uuid4()))
-        folder.requests = [RequestModel.from_dict(req) for req in data.get("requests", [])]
-        folder.folders = [RequestFolder.from_dict(f) for f in data.get("folders", [])]
-        return folder
+        """딕셔너리에서 복원 (반복 순회)"""
+        def convert(folder_data: Dict[str, Any]) -> 'RequestFolder':
+            folder = cls(folder_data.get("name", "New Folder"))
+            folder.id = folder_data.get("id", str(uuid.uuid4()))
+            folder.requests = [RequestModel.from_dict(req) for req in folder_data.get("requests", [])]
+            if folder_data.get("retry_policy"):
+                folder.retry_policy = RetryPolicy.from_stored(folder_data["retry_policy"], folder.name)
+            return folder
+
+        root = convert(data)
+        stack = [(data, root)]
+        while stack:
+            folder_data, folder = stack.pop()
+            for sub_data in folder_data.get("folders", []):
+                sub_folder = convert(sub_data)
+                folder.folders.append(sub_folder)
+                stack.append((sub_data, sub_folder))
+        return root
+
+    def subtree_depth(self) -> int:
+        """이 폴더를 포함한 하위 트리의 폴더 깊이 (하위 폴더가 없으면 1)"""
+        depth = 0
+        stack = [(self, 1)]
+        while stack:
+            folder, level = stack.pop()
+            depth = max(depth, level)
+            stack.extend((sub_folder, level + 1) for sub_folder in folder.folders)
+        return depth
 
     def add_request(self, request: RequestModel):
         """요청 추가"""
@@ -1,24 +1,143 @@
 """
 HTTP 응답을 표현하는 데이터 모델
 """
-from typing import Dict, Optional
+import os
+import uuid
+import weakref
+from typing import Any, Dict, Iterator, List, Optional
 from datetime import datetime
 
 
+def _remove_file(path: str):
+    """임시 파일 삭제 (이미 없으면 무시)"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
 class ResponseModel:
     """HTTP 응답 데이터 모델"""
 
+    DEFAULT_CHUNK_SIZE = 64 * 1024
+
+    # 단계별 소요 시간 (timings 키, 순서대로) - 재사용된 연결에서는 dns/connect/tls 가 없음
+    TIMING_PHASES = ('dns', 'connect', 'tls', 'send', 'wait', 'download')
+    TIMING_LABELS = {
+        'dns': 'DNS',
+        'connect': 'Connect',
+        'tls': 'TLS',
+        'send': 'Send',
+        'wait': 'TTFB',
+        'download': 'Download',
+    }
+
     def __init__(self):
+        self.id = str(uuid.uuid4())
         self.status_code: int = 0
         self.status_text: str = ""
         self.headers: Dict[str, str] = {}
-        self.body: str = ""
         self.body_bytes: Optional[bytes] = None
-        self.elapsed_ms: float = 0.0
+        self.body_path: Optional[str] = None  # 크기 제한을 넘어 임시 파일로 옮겨진 본문
+        self.encoding: str = "utf-8"
+        self.elapsed_ms: float = 0.0  # 전체 소요 시간 (단조 시계 기준)
+        self.timings: Dict[str, float] = {}  # 단계별 소요 시간 (ms) + 'total'
+        # 재시도 정책이 적용된 경우 시도별 기록
+        # [{'attempt', 'status_code', 'error', 'elapsed_ms', 'timings', 'retry_delay_ms'(재시도한 경우)}]
+        self.attempts: List[Dict[str, Any]] = []
         self.size_bytes: int = 0
         self.timestamp: datetime = datetime.now()
         self.error: Optional[str] = None
         self.content_type: str = ""
+        self._body: Optional[str] = None
+        self._finalizer = None
+
+    @property
+    def body(self) -> str:
+        """
+        본문 텍스트 (접근 시점에 디코딩)
+
+        본문이 임시 파일로 옮겨진 경우 전체를 읽지 않고 앞부분 미리보기만 반환한다.
+        """
+        if self._body is not None:
+            return self._body
+        if self.body_bytes is not None:
+            return self.body_bytes.decode(self.encoding, errors='replace')
+        if self.body_path:
+            return self.get_body_preview()
+        return ""
+
+    @body.setter
+    def body(self, value: str):
+        self._body = value
+
+    def set_body_file(self, path: str):
+        """본문을 임시 파일로 지정 (응답 객체가 사라지면 파일도 삭제됨)"""
+        self.body_path = path
+        self.body_bytes = None
+        self._finalizer = weakref.finalize(self, _remove_file, path)
+
+    def get_timing_summary(self) -> str:
+        """단계별 소요 시간 요약 문자열 (예: 'DNS 2 ms | Connect 1 ms | TTFB 35 ms | Download 4 ms')"""
+        parts = [
+            f"{self.TIMING_LABELS[phase]} {self.timings[phase]:.0f} ms"
+            for phase in self.TIMING_PHASES if phase in self.timings
+        ]
+        if parts and 'connect' not in self.timings:
+            parts.insert(0, "Reused connection")
+        if len(self.attempts) > 1:
+            parts.insert(0, f"Attempt {len(self.attempts)}")
+        return " | ".join(parts)
+
+    def is_spilled(self) -> bool:
+        """본문이 임시 파일에 저장되었는지 확인"""
+        return self.body_path is not None
+
+    def get_body_preview(self, max_chars: int = 64 * 1024) -> str:
+        """본문 앞부분만 디코딩하여 반환"""
+        if self._body is not None:
+            return self._body[:max_chars]
+
+        # UTF-8 기준 한 글자는 최대 4바이트
+        max_bytes = max_chars * 4
+        if self.body_bytes is not None:
+            data = self.body_bytes[:max_bytes]
+        elif self.body_path:
+            with open(self.body_path, 'rb') as f:
+                data = f.read(max_bytes)
+        else:
+            return ""
+        return data.decode(self.encoding, errors='replace')[:max_chars]
+
+    def iter_body(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """본문을 청크 단위로 순회 (메모리/임시 파일 모두 지원)"""
+        if self.body_bytes is not None:
+            for start in range(0, len(self.body_bytes), chunk_size):
+                yield self.body_bytes[start:start + chunk_size]
+        elif self.body_path:
+            with open(self.body_path, 'rb') as f:
+                while True:
+                    chunk = f.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+        elif self._body:
+            yield self._body.encode(self.encoding, errors='replace')
+
+    def discard_body(self, keep_preview_chars: int = 0):
+        """
+        본문 해제 (임시 파일 삭제)
+
+        Args:
+            keep_preview_chars: 해제 후에도 body 로 남겨둘 앞부분 글자 수
+        """
+        preview = self.get_body_preview(keep_preview_chars) if keep_preview_chars > 0 else None
+        self.body_bytes = None
+        self._body = preview
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self.body_path = None
 
     def is_json(self) -> bool:
         """응답이 JSON인지 확인"""
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Lumina Collection Runner - CLI
+
+저장된 프로젝트 파일의 요청들을 동시에 실행하고 결과를 출력합니다.
+하나라도 실패하면 종료 코드 1을 반환하므로 배포 게이트에서 사용할 수 있습니다.
+
+사용 예:
+    python run_collection.py project.json
+    python run_collection.py project.json --folder Posts --workers 16 --per-host 8
+    python run_collection.py project.json --environment Staging --json
+"""
+
+import argparse
+import json
+import os
+import sys
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.project_manager import ProjectManager
+from core.http_client import HttpClient
+from core.collection_runner import CollectionRunner
+
+
+def parse_args(argv=None):
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="Run every request of a Lumina project folder concurrently.")
+    parser.add_argument('project_file', help="Lumina project JSON file")
+    parser.add_argument('--folder', help="Folder id or name to run (default: whole project)")
+    parser.add_argument('--environment', help="Environment id or name to activate")
+    parser.add_argument('--workers', type=int, default=CollectionRunner.DEFAULT_MAX_WORKERS,
+                        help="Maximum concurrent requests (default: %(default)s)")
+    parser.add_argument('--per-host', type=int, default=CollectionRunner.DEFAULT_PER_HOST_LIMIT,
+                        help="Maximum concurrent requests per host (default: %(default)s)")
+    parser.add_argument('--json', action='store_true', help="Print the full report as JSON")
+    return parser.parse_args(argv)
+
+
+def find_folder(pm: ProjectManager, folder_ref: str):
+    """ID 또는 이름으로 폴더 찾기"""
+    folder = pm.find_folder_by_id(folder_ref)
+    if folder:
+        return folder
+
+    pending = [pm.root_folder]
+    while pending:
+        current = pending.pop()
+        if current.name == folder_ref:
+            return current
+        pending.extend(current.folders)
+    return None
+
+
+def main(argv=None) -> int:
+    """CLI 메인 함수"""
+    args = parse_args(argv)
+
+    pm = ProjectManager.load_from_file(args.project_file)
+
+    if args.environment:
+        env_manager = pm.env_manager
+        env = next((e for e in env_manager.environments
+                    if e.id == args.environment or e.name == args.environment), None)
+        if not env:
+            print(f"Environment not found: {args.environment}", file=sys.stderr)
+            return 2
+        env_manager.set_active(env.id)
+
+    folder = pm.root_folder
+    if args.folder:
+        folder = find_folder(pm, args.folder)
+        if not folder:
+            print(f"Folder not found: {args.folder}", file=sys.stderr)
+            return 2
+
+    http_client = HttpClient(pm.env_manager)
+    runner = CollectionRunner(http_client, max_workers=args.workers, per_host_limit=args.per_host,
+                              retry_policy_for=lambda req: pm.get_retry_policy(req.id))
+
+    def print_result(result):
+        if args.json:
+            return
+        mark = "✓" if result.passed else "✗"
+        status = result.response.error or f"{result.response.status_code} {result.response.status_text}"
+        attempts = f", {len(result.response.attempts)} attempts" if len(result.response.attempts) > 1 else ""
+        print(f"  {mark} {result.request.method.value:7} {result.request.name} - {status} "
+              f"({result.response.elapsed_ms:.0f} ms{attempts})")
+
+    try:
+        report = runner.run(pm.get_all_requests(folder), on_result=print_result)
+    finally:
+        http_client.close()
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2, ensure_ascii=False))
+    else:
+        print()
+        print(f"{report.passed}/{report.total} passed, {report.failed} failed "
+              f"in {report.elapsed_ms:.0f} ms")
+
+    return 0 if report.is_success() else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -29,7 +29,7 @@ class RequestThread(QThread):
 
     def run(self):
         """스레드 실행"""
-        response = self.http_client.send_request(self.request)
+        response = self.http_client.send_request(self.request, stream=True)
         self.finished.emit(response)
 
 
@@ -264,23 +264,27 @@ class MainWindow(QMainWindow):
         self.statusBar.showMessage(f"Loaded project: {self.project_manager.project_name}")
 
     def load_environment_combo(self):
-        """환경 콤보박스 로드"""
-        self.env_combo.clear()
+        """환경 콤보박스 로드 (프로젝트의 활성 환경을 표시만 하므로 변경 시그널은 막음)"""
+        self.env_combo.blockSignals(True)
+        try:
+            self.env_combo.clear()
 
-        # No Environment 옵션
-        self.env_combo.addItem("No Environment", None)
+            # No Environment 옵션
+            self.env_combo.addItem("No Environment", None)
 
-        # 환경 목록
-        for env in self.project_manager.env_manager.environments:
-            self.env_combo.addItem(env.name, env)
+            # 환경 목록
+            for env in self.project_manager.env_manager.environments:
+                self.env_combo.addItem(env.name, env)
 
-        # 활성 환경 선택
-        if self.project_manager.env_manager.active_environment:
-            for i in range(self.env_combo.count()):
-                env = self.env_combo.itemData(i)
-                if env and env.id == self.project_manager.env_manager.active_environment.id:
-                    self.env_combo.setCurrentIndex(i)
-                    break
+            # 활성 환경 선택
+            if self.project_manager.env_manager.active_environment:
+                for i in range(self.env_combo.count()):
+                    env = self.env_combo.itemData(i)
+                    if env and env.id == self.project_manager.env_manager.active_environment.id:
+                        self.env_combo.setCurrentIndex(i)
+                        break
+        finally:
+            self.env_combo.blockSignals(False)
 
     def on_request_selected(self, request: RequestModel):
         """요청 선택 시"""
@@ -297,24 +301,39 @@ class MainWindow(QMainWindow):
 
     def on_request_updated(self, request: RequestModel):
         """요청 업데이트 시"""
+        # 편집기가 요청 속성을 직접 수정하므로 변경 표시
+        self.project_manager.mark_dirty()
+        self.setWindowTitle(f"Lumina ✨ - {self.project_manager.project_name} *")
+
         # 트리 갱신 (메서드나 이름이 변경되었을 수 있음)
         self.request_tree.load_folder(self.project_manager.root_folder)
 
     def on_request_changed(self):
         """요청 구조 변경 시"""
+        # 트리 위젯이 폴더를 직접 수정하므로 ID 인덱스 재구성
+        self.project_manager.reindex()
+        self.project_manager.mark_dirty()
+
         # 프로젝트 변경 표시
         self.setWindowTitle(f"Lumina ✨ - {self.project_manager.project_name} *")
 
     def on_environment_changed(self, index: int):
         """환경 변경 시"""
         env = self.env_combo.itemData(index)
+        env_manager = self.project_manager.env_manager
+        previous = env_manager.active_environment
         if env:
-            self.project_manager.env_manager.set_active(env.id)
+            env_manager.set_active(env.id)
             self.statusBar.showMessage(f"Environment changed to: {env.name}")
         else:
-            self.project_manager.env_manager.active_environment = None
+            env_manager.active_environment = None
             self.statusBar.showMessage("No environment selected")
 
+        # 활성 환경은 프로젝트에 저장되므로 변경 표시 (콤보박스를 다시 채울 때는 그대로)
+        if env_manager.active_environment is not previous:
+            self.project_manager.mark_dirty()
+            self.setWindowTitle(f"Lumina ✨ - {self.project_manager.project_name} *")
+
     def send_request(self):
         """요청 전송"""
         if not self.current_request:
@@ -460,7 +479,7 @@ class MainWindow(QMainWindow):
                 imported_folder = MarkdownAPIParser.parse_file(file_path)
 
                 # 루트 폴더에 임포트된 폴더 추가
-                self.project_manager.root_folder.add_folder(imported_folder)
+                self.project_manager.add_folder(imported_folder)
 
                 # UI 갱신
                 self.load_project_data()
@@ -485,18 +504,12 @@ class MainWindow(QMainWindow):
                 is_json = file_path.lower().endswith('.json')
                 
                 if is_json:
-                    # JSON 파일: Postman인지 OpenAPI인지 확인
-                    import json
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    # Postman 컬렉션 확인 (info > _postman_id 또는 schema 체크)
-                    is_postman = 'info' in data and ('_postman_id' in data['info'] or 'schema' in data.get('info', {}))
-                    
-                    if is_postman:
-                        from utils.postman_converter import PostmanConverter
-                        imported_folder = PostmanConverter.import_from_postman(data)
-                    else:
+                    # JSON 파일: Postman 으로 스트리밍 변환 (Postman 컬렉션이 아니면 None)
+                    from utils.postman_converter import PostmanConverter
+                    with open(file_path, 'rb') as f:
+                        imported_folder = PostmanConverter.import_from_stream(f)
+
+                    if imported_folder is None:
                         # Postman이 아니면 OpenAPI로 간주
                         from utils.openapi_converter import OpenAPIConverter
                         imported_folder = OpenAPIConverter.import_from_file(file_path)
@@ -507,7 +520,7 @@ class MainWindow(QMainWindow):
 
                 if imported_folder:
                     # 루트 폴더에 임포트된 폴더 추가
-                    self.project_manager.root_folder.add_folder(imported_folder)
+                    self.project_manager.add_folder(imported_folder)
 
                     # UI 갱신
                     self.load_project_data()
@@ -542,7 +555,7 @@ class MainWindow(QMainWindow):
 
                 if imported_folder:
                     # 루트 폴더에 임포트된 폴더 추가
-                    self.project_manager.root_folder.add_folder(imported_folder)
+                    self.project_manager.add_folder(imported_folder)
                     
                     # 전역 변수 업데이트
                     if global_vars:
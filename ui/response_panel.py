@@ -37,6 +37,11 @@ class ResponsePanel(QWidget):
         status_layout.addStretch()
         layout.addLayout(status_layout)
 
+        # 단계별 소요 시간 (DNS / Connect / TLS / TTFB / Download)
+        self.timing_label = QLabel("")
+        self.timing_label.setStyleSheet("color: gray; padding: 0 5px 5px 5px;")
+        layout.addWidget(self.timing_label)
+
         # 탭 위젯
         self.tabs = QTabWidget()
 
@@ -93,6 +98,7 @@ class ResponsePanel(QWidget):
             self.status_label.setStyleSheet("color: red; font-weight: bold; padding: 5px;")
             self.time_label.setText("")
             self.size_label.setText("")
+            self.timing_label.setText(response.get_timing_summary())
             self.body_text.setPlainText(response.error)
             self.headers_table.setRowCount(0)
         else:
@@ -103,6 +109,7 @@ class ResponsePanel(QWidget):
 
             self.time_label.setText(f"Time: {response.elapsed_ms:.0f} ms")
             self.size_label.setText(f"Size: {response.size_bytes} bytes")
+            self.timing_label.setText(response.get_timing_summary())
 
             # Body 표시
             self._display_body()
@@ -115,6 +122,15 @@ class ResponsePanel(QWidget):
         if not self.current_response:
             return
 
+        if self.current_response.is_spilled():
+            # 큰 본문은 임시 파일에 있으므로 앞부분만 표시
+            preview = self.current_response.get_body_preview()
+            self.body_text.setPlainText(
+                f"[Response body is {self.current_response.size_bytes} bytes; showing the first "
+                f"{len(preview)} characters]\n\n{preview}"
+            )
+            return
+
         body = self.current_response.body
 
         if self.is_pretty_mode and self.current_response.is_json():
@@ -164,6 +180,7 @@ class ResponsePanel(QWidget):
         self.status_label.setStyleSheet("font-weight: bold; padding: 5px;")
         self.time_label.setText("")
         self.size_label.setText("")
+        self.timing_label.setText("")
         self.body_text.clear()
         self.headers_table.setRowCount(0)
         self.current_response = None
@@ -0,0 +1,35 @@
+"""
+파일 저장 유틸리티
+"""
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Union
+
+
+def atomic_write_json(file_path: Union[str, Path], data: Any, indent: int = 2):
+    """
+    JSON 파일을 원자적으로 저장 (임시 파일에 쓴 뒤 rename)
+
+    저장 도중 프로세스가 종료되어도 기존 파일이 깨지지 않는다.
+
+    Args:
+        file_path: 저장할 파일 경로
+        data: 저장할 데이터
+        indent: JSON 들여쓰기
+    """
+    file_path = Path(file_path)
+    fd, temp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f'.{file_path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
@@ -6,96 +6,58 @@ import uuid
 
 import time
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Callable, Optional
 from models.request_model import RequestModel, RequestFolder, HttpMethod, BodyType, AuthType
+from utils.insomnia_import import InsomniaResources
 
 
 class InsomniaConverter:
     """Insomnia 형식 변환기"""
 
     @staticmethod
-    def import_from_insomnia(insomnia_data: Dict[str, Any]) -> tuple[RequestFolder, Dict[str, str]]:
+    def import_from_insomnia(insomnia_data: Dict[str, Any],
+                             progress: Optional[Callable[[int, int], None]] = None) -> tuple[RequestFolder, Dict[str, str]]:
         """
         Insomnia JSON 데이터를 Lumina RequestFolder로 변환
 
         Args:
             insomnia_data: Insomnia export JSON
+            progress: 진행 콜백 (변환한 요청 수, 만든 폴더 수), 예외를 던지면 변환 중단
 
         Returns:
             Tuple[RequestFolder, Dict[str, str]]: 변환된 폴더와 전역 변수
         """
-        resources = insomnia_data.get('resources', [])
+        # 리소스를 한 번만 순회하여 종류/부모별로 분류
+        index = InsomniaResources(insomnia_data.get('resources', []))
+        workspace = index.workspace
 
-        # 워크스페이스 찾기
-        workspace = None
-        for resource in resources:
-            if resource.get('_type') == 'workspace':
-                workspace = resource
-                break
-        
         root_name = workspace.get('name', 'Imported from Insomnia') if workspace else 'Imported from Insomnia'
         root_folder = RequestFolder(root_name)
-        
-        workspace_id = workspace.get('_id') if workspace else None
-
-        # 폴더 매핑 (ID -> Folder)
-        folders = {}
-        folders['__root__'] = root_folder
-        if workspace_id:
-            folders[workspace_id] = root_folder
-
-        # 1. 폴더 생성 (Request Groups)
-        for resource in resources:
-            if resource.get('_type') == 'request_group':
-                folder = RequestFolder(resource.get('name', 'Unnamed Folder'))
-                folder.id = resource.get('_id', str(uuid.uuid4()))
-                folders[resource['_id']] = folder
-
-        # 2. 폴더 계층 구조 연결
-        for resource in resources:
-            if resource.get('_type') == 'request_group':
-                folder_id = resource['_id']
-                parent_id = resource.get('parentId')
-
-                if folder_id in folders:
-                    folder = folders[folder_id]
-                    # 부모가 없거나 워크스페이스면 루트에 추가
-                    if not parent_id or parent_id == workspace_id:
-                        parent_folder = root_folder
-                    else:
-                        parent_folder = folders.get(parent_id, root_folder)
-                    
-                    # 루트가 자기 자신이 아니고, 부모의 자식에 아직 없으면 추가
-                    if folder != parent_folder and folder not in parent_folder.folders:
-                        parent_folder.add_folder(folder)
-
-        # 3. 요청 생성 및 폴더에 할당
-        for resource in resources:
-            if resource.get('_type') == 'request':
-                request = InsomniaConverter._convert_insomnia_request(resource)
-                parent_id = resource.get('parentId')
-                
-                # 부모가 없거나 워크스페이스면 루트에 추가
-                if not parent_id or parent_id == workspace_id:
-                    parent_folder = root_folder
-                else:
-                    parent_folder = folders.get(parent_id, root_folder)
-                
-                parent_folder.add_request(request)
-
-        # 4. 환경 변수 추출 (Base Environment)
+
+        # 폴더/요청 트리 구성 (폴더 ID 는 Insomnia ID 유지)
+        index.build_tree(root_folder, InsomniaConverter._convert_insomnia_folder,
+                         InsomniaConverter._convert_insomnia_request, progress)
+
+        # 환경 변수 추출 (Base Environment)
         global_vars = {}
-        for resource in resources:
-            if resource.get('_type') == 'environment':
-                # Base Environment는 parentId가 워크스페이스 ID임
-                if resource.get('parentId') == workspace_id:
-                    env_data = resource.get('data', {})
-                    for k, v in env_data.items():
-                        global_vars[k] = str(v)
-                    break
+        workspace_id = index.workspace_id
+        for resource in index.environments:
+            # Base Environment는 parentId가 워크스페이스 ID임
+            if resource.get('parentId') == workspace_id:
+                env_data = resource.get('data', {})
+                for k, v in env_data.items():
+                    global_vars[k] = str(v)
+                break
 
         return root_folder, global_vars
 
+    @staticmethod
+    def _convert_insomnia_folder(resource: Dict[str, Any]) -> RequestFolder:
+        """Insomnia request_group을 RequestFolder로 변환 (ID 유지)"""
+        folder = RequestFolder(resource.get('name', 'Unnamed Folder'))
+        folder.id = resource.get('_id', str(uuid.uuid4()))
+        return folder
+
     @staticmethod
     def _convert_insomnia_request(insomnia_req: Dict[str, Any]) -> RequestModel:
         """Insomnia 요청을 Lumina RequestModel로 변환"""
@@ -0,0 +1,110 @@
+"""
+Insomnia export 가져오기 공통 엔진
+리소스 목록을 한 번만 순회하여 종류/부모별로 분류하고, 딕셔너리 조회로 폴더 트리를 구성한다.
+InsomniaConverter 와 InsomniaParser 가 함께 사용한다.
+"""
+from typing import Any, Callable, Dict, List, Optional
+
+from models.request_model import RequestModel, RequestFolder
+
+
+class InsomniaResources:
+    """
+    Insomnia export 리소스 인덱스
+
+    resources 를 한 번 순회하며 _type 별로 나누고 (원래 순서 유지),
+    request_group 의 parentId 를 기록한다.
+    """
+
+    def __init__(self, resources: List[Dict[str, Any]]):
+        self.workspace: Optional[Dict[str, Any]] = None
+        self.groups: List[Dict[str, Any]] = []
+        self.requests: List[Dict[str, Any]] = []
+        self.environments: List[Dict[str, Any]] = []
+        # request_group ID -> parentId
+        self.group_parents: Dict[str, Optional[str]] = {}
+
+        for resource in resources:
+            if not isinstance(resource, dict):
+                continue
+            resource_type = resource.get('_type')
+            if resource_type == 'request':
+                self.requests.append(resource)
+            elif resource_type == 'request_group':
+                group_id = resource.get('_id')
+                # ID 가 없거나 중복된 폴더는 건너뜀 (트리에 두 번 연결되지 않도록)
+                if group_id is None or group_id in self.group_parents:
+                    continue
+                self.groups.append(resource)
+                self.group_parents[group_id] = resource.get('parentId')
+            elif resource_type == 'environment':
+                self.environments.append(resource)
+            elif resource_type == 'workspace' and self.workspace is None:
+                self.workspace = resource
+
+    @property
+    def workspace_id(self) -> Optional[str]:
+        return self.workspace.get('_id') if self.workspace else None
+
+    def resolve_group_parents(self) -> Dict[str, Optional[str]]:
+        """
+        폴더별 실제 부모 폴더 ID (루트에 붙일 폴더는 None)
+
+        부모가 폴더가 아니면 (워크스페이스, 없음, 알 수 없는 ID) 루트에 붙이고,
+        parentId 가 순환하면 순환에 처음 들어간 폴더를 루트에 붙여 끊는다.
+        각 폴더를 한 번씩만 방문한다.
+        """
+        resolved: Dict[str, Optional[str]] = {}
+        for start in self.group_parents:
+            path = []
+            on_path = set()
+            node = start
+            while node in self.group_parents and node not in resolved and node not in on_path:
+                path.append(node)
+                on_path.add(node)
+                node = self.group_parents[node]
+
+            if node in on_path:
+                # 순환: 여기서 끊음
+                resolved[node] = None
+            for group_id in path:
+                if group_id not in resolved:
+                    parent_id = self.group_parents[group_id]
+                    resolved[group_id] = parent_id if parent_id in self.group_parents else None
+        return resolved
+
+    def build_tree(self, root_folder: RequestFolder,
+                   create_folder: Callable[[Dict[str, Any]], RequestFolder],
+                   create_request: Callable[[Dict[str, Any]], RequestModel],
+                   progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, RequestFolder]:
+        """
+        폴더/요청 트리 구성 (리소스 순서대로 추가)
+
+        Args:
+            root_folder: 워크스페이스 직속 항목을 넣을 폴더
+            create_folder: request_group -> RequestFolder
+            create_request: request -> RequestModel
+            progress: 요청마다 (변환한 요청 수, 만든 폴더 수) 로 호출 (예외를 던지면 중단)
+
+        Returns:
+            request_group ID -> RequestFolder
+        """
+        folders = {group['_id']: create_folder(group) for group in self.groups}
+
+        parents = self.resolve_group_parents()
+        for group in self.groups:
+            parent_id = parents[group['_id']]
+            parent_folder = folders[parent_id] if parent_id is not None else root_folder
+            parent_folder.add_folder(folders[group['_id']])
+
+        if progress is not None:
+            progress(0, len(folders))
+
+        for count, resource in enumerate(self.requests, 1):
+            # 부모가 없거나 워크스페이스면 루트에 추가
+            parent_folder = folders.get(resource.get('parentId'), root_folder)
+            parent_folder.add_request(create_request(resource))
+            if progress is not None:
+                progress(count, len(folders))
+
+        return folders
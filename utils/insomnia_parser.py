@@ -7,6 +7,7 @@ from typing import Dict, Any, List
 from datetime import datetime
 from models.request_model import RequestModel, RequestFolder, HttpMethod, BodyType, AuthType
 from core.project_manager import ProjectManager
+from utils.insomnia_import import InsomniaResources
 
 
 class InsomniaParser:
@@ -22,112 +23,59 @@ class InsomniaParser:
 
         Returns:
             변환된 ProjectManager 인스턴스
+
+        Raises:
+            ValueError: 폴더 깊이가 RequestFolder.MAX_DEPTH 를 넘는 경우
         """
         # 프로젝트 생성
         pm = ProjectManager()
 
-        # 워크스페이스 정보 추출
-        resources = json_data.get('resources', [])
-        workspace = None
-
-        # 워크스페이스 찾기
-        for resource in resources:
-            if resource.get('_type') == 'workspace':
-                workspace = resource
-                break
+        # 리소스를 한 번만 순회하여 종류/부모별로 분류 (InsomniaConverter 와 같은 엔진)
+        index = InsomniaResources(json_data.get('resources', []))
+        workspace = index.workspace
 
         if workspace:
             pm.project_name = workspace.get('name', 'Imported from Insomnia')
         else:
             pm.project_name = 'Imported from Insomnia'
 
-        # 폴더 및 요청 매핑 생성
-        folders_map = {}  # folder_id -> RequestFolder
-        requests = []  # 모든 요청 리스트
-
-        # 1단계: 모든 폴더 생성
-        for resource in resources:
-            if resource.get('_type') == 'request_group':
-                folder = InsomniaParser._create_folder(resource)
-                folders_map[resource['_id']] = folder
-
-        # 2단계: 모든 요청 생성
-        for resource in resources:
-            if resource.get('_type') == 'request':
-                request_model = InsomniaParser._create_request(resource)
-                requests.append({
-                    'model': request_model,
-                    'parent_id': resource.get('parentId')
-                })
+        # 폴더/요청 트리 구성 (워크스페이스 직속이거나 부모를 모르면 루트에 추가)
+        index.build_tree(pm.root_folder, InsomniaParser._create_folder, InsomniaParser._create_request)
 
-        # 3단계: 폴더 계층 구조 생성
-        for folder_id, folder in folders_map.items():
-            # 각 폴더의 부모 찾기
-            for resource in resources:
-                if resource.get('_id') == folder_id:
-                    parent_id = resource.get('parentId')
-                    if parent_id and parent_id in folders_map:
-                        # 부모 폴더에 추가
-                        folders_map[parent_id].add_folder(folder)
-                    elif parent_id:
-                        # 부모가 워크스페이스이거나 없으면 루트에 추가
-                        pm.root_folder.add_folder(folder)
-                    break
-
-        # 워크스페이스 직속 폴더 추가 (아직 추가되지 않은 경우)
-        for folder_id, folder in folders_map.items():
-            if folder not in pm.root_folder.folders:
-                # 다른 폴더의 하위가 아닌지 확인
-                is_subfolder = False
-                for parent_folder in folders_map.values():
-                    if folder in parent_folder.folders:
-                        is_subfolder = True
-                        break
-                if not is_subfolder:
-                    pm.root_folder.add_folder(folder)
-
-        # 4단계: 요청을 해당 폴더나 루트에 추가
-        for request_data in requests:
-            request_model = request_data['model']
-            parent_id = request_data['parent_id']
-
-            if parent_id in folders_map:
-                # 폴더에 추가
-                folders_map[parent_id].add_request(request_model)
-            else:
-                # 루트에 추가
-                pm.root_folder.add_request(request_model)
+        # 환경 변수 처리
+        InsomniaParser._import_environments(index.environments, pm, index.workspace_id)
 
-        # 5단계: 환경 변수 처리
-        InsomniaParser._import_environments(resources, pm, workspace['_id'] if workspace else None)
+        # 트리를 직접 구성했으므로 깊이 확인 후 ID 인덱스 재구성 (루트 자신은 깊이에서 제외)
+        if pm.root_folder.subtree_depth() - 1 > RequestFolder.MAX_DEPTH:
+            raise ValueError(f"Folders cannot be nested more than {RequestFolder.MAX_DEPTH} levels deep")
+        pm.reindex()
 
         return pm
 
     @staticmethod
-    def _import_environments(resources: List[Dict[str, Any]], pm: ProjectManager, workspace_id: str):
-        """Insomnia environment를 ProjectManager로 import"""
+    def _import_environments(environments: List[Dict[str, Any]], pm: ProjectManager, workspace_id: str):
+        """Insomnia environment 리소스를 ProjectManager로 import"""
         from models.environment import Environment
 
-        for resource in resources:
-            if resource.get('_type') == 'environment':
-                env_name = resource.get('name', 'Imported Environment')
-                env_data = resource.get('data', {})
-
-                # Base Environment는 Global로 처리
-                if env_name == 'Base Environment' or resource.get('parentId') == workspace_id:
-                    # Global environment에 변수 추가
-                    for key, value in env_data.items():
-                        pm.env_manager.global_environment.set(key, str(value))
-                else:
-                    # Sub Environment는 새로운 환경으로 추가
-                    env = Environment(env_name)
-                    for key, value in env_data.items():
-                        env.set(key, str(value))
-                    pm.env_manager.add_environment(env)
-
-                    # 첫 번째 환경을 활성화
-                    if not pm.env_manager.active_environment:
-                        pm.env_manager.set_active(env.id)
+        for resource in environments:
+            env_name = resource.get('name', 'Imported Environment')
+            env_data = resource.get('data', {})
+
+            # Base Environment는 Global로 처리
+            if env_name == 'Base Environment' or resource.get('parentId') == workspace_id:
+                # Global environment에 변수 추가
+                for key, value in env_data.items():
+                    pm.env_manager.global_environment.set(key, str(value))
+            else:
+                # Sub Environment는 새로운 환경으로 추가
+                env = Environment(env_name)
+                for key, value in env_data.items():
+                    env.set(key, str(value))
+                pm.env_manager.add_environment(env)
+
+                # 첫 번째 환경을 활성화
+                if not pm.env_manager.active_environment:
+                    pm.env_manager.set_active(env.id)
 
     @staticmethod
     def _create_folder(resource: Dict[str, Any]) -> RequestFolder:
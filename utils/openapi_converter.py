@@ -2,97 +2,342 @@
 OpenAPI (Swagger) Import Converter
 OpenAPI 3.0 YAML/JSON 형식과 Lumina 형식 간 변환
 """
-import yaml
 import json
-from typing import Dict, List, Any, Optional
+import time
+from typing import Dict, List, Any, Optional, Callable, Iterator, Set, Tuple, Union
+from urllib.parse import unquote
+
+import yaml
 from models.request_model import RequestModel, RequestFolder, HttpMethod, BodyType, AuthType
 
+try:
+    # libyaml 이 있으면 C 구현 로더 사용 (순수 Python 로더보다 수십 배 빠름)
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+class RefResolver:
+    """
+    OpenAPI 문서 내부 $ref (JSON Pointer) 해석기
+
+    같은 $ref 는 한 번만 해석하고, 스키마 예제도 ($ref, 남은 깊이) 별로 한 번만 생성하여
+    여러 오퍼레이션이 공유하는 컴포넌트를 다시 펼치지 않는다.
+    순환 참조와 MAX_DEPTH 보다 깊은 중첩은 None 으로 끊고, 예제가 MAX_EXAMPLE_NODES 를
+    넘으면 깊이 제한을 줄여 다시 만든다 (공유 컴포넌트가 겹겹이 중첩된 스키마 대비).
+    문서 외부 참조 (다른 파일/URL) 는 해석하지 않는다.
+    """
+
+    MAX_DEPTH = 16  # 예제 생성 시 최대 중첩 깊이 (object/array 단계)
+    MAX_EXAMPLE_NODES = 5000  # 예제 하나의 최대 값 개수
+
+    def __init__(self, document: Dict[str, Any]):
+        self.document = document
+        self._targets: Dict[str, Any] = {}
+        # ($ref, 남은 깊이) -> (예제, 값 개수)
+        self._examples: Dict[Tuple[str, int], Tuple[Any, int]] = {}
+
+    def resolve_pointer(self, ref: str) -> Any:
+        """
+        $ref 가 가리키는 객체 (없거나 외부 참조면 None)
+
+        Args:
+            ref: '#/components/schemas/Pet', '#/paths/~1pets/get' 등
+        """
+        if ref in self._targets:
+            return self._targets[ref]
+
+        target = None
+        if ref.startswith('#'):
+            target = self.document
+            pointer = unquote(ref[1:])
+            tokens = pointer[1:].split('/') if pointer.startswith('/') else []
+            for token in tokens:
+                token = token.replace('~1', '/').replace('~0', '~')
+                if isinstance(target, dict) and token in target:
+                    target = target[token]
+                elif isinstance(target, list) and token.isdigit() and int(token) < len(target):
+                    target = target[int(token)]
+                else:
+                    target = None
+                    break
+
+        self._targets[ref] = target
+        return target
+
+    def resolve(self, obj: Any) -> Any:
+        """$ref 를 따라가 실제 객체 반환 ($ref 가 없으면 그대로, 순환/해석 실패 시 None)"""
+        seen = set()
+        while isinstance(obj, dict) and '$ref' in obj:
+            ref = obj['$ref']
+            if not isinstance(ref, str) or ref in seen:
+                return None
+            seen.add(ref)
+            obj = self.resolve_pointer(ref)
+        return obj
+
+    def generate_example(self, schema: Any) -> Any:
+        """스키마로부터 예제 데이터 생성"""
+        max_depth = self.MAX_DEPTH
+        while True:
+            value, _, nodes = self._generate_example(schema, (), max_depth)
+            if nodes <= self.MAX_EXAMPLE_NODES or max_depth <= 1:
+                return value
+            max_depth -= 1
+
+    def _generate_example(self, schema: Any, ref_stack: Tuple[str, ...], remaining: int) -> Tuple[Any, bool, int]:
+        """
+        Args:
+            ref_stack: 현재 펼치고 있는 $ref 경로 (순환 감지용)
+            remaining: 남은 중첩 깊이 (object 속성/array 항목마다 1 감소)
+
+        Returns:
+            (예제, cacheable, 값 개수) - 순환 참조를 끊은 결과는 경로에 따라 달라지므로
+            cacheable=False 이며 캐시하지 않는다.
+        """
+        if not isinstance(schema, dict):
+            return None, True, 1
+
+        ref = schema.get('$ref')
+        if isinstance(ref, str):
+            key = (ref, remaining)
+            if key in self._examples:
+                value, nodes = self._examples[key]
+                return value, True, nodes
+            if ref in ref_stack:
+                return None, False, 1
+            target = self.resolve_pointer(ref)
+            if target is None:
+                return {}, True, 1
+            value, cacheable, nodes = self._generate_example(target, ref_stack + (ref,), remaining)
+            if cacheable:
+                self._examples[key] = (value, nodes)
+            return value, cacheable, nodes
+
+        if 'example' in schema:
+            return schema['example'], True, 1
+
+        schema_type = schema.get('type')
+
+        if schema_type in ('object', 'array') and remaining <= 0:
+            return None, True, 1
+
+        if schema_type == 'object':
+            result = {}
+            cacheable = True
+            nodes = 1
+            properties = schema.get('properties') or {}
+            for key, prop in properties.items():
+                result[key], prop_cacheable, prop_nodes = self._generate_example(prop, ref_stack, remaining - 1)
+                cacheable = cacheable and prop_cacheable
+                nodes += prop_nodes
+            return result, cacheable, nodes
+
+        elif schema_type == 'array':
+            item, cacheable, nodes = self._generate_example(schema.get('items') or {}, ref_stack, remaining - 1)
+            return [item], cacheable, nodes + 1
+
+        elif schema_type == 'string':
+            return "string", True, 1
+        elif schema_type == 'integer' or schema_type == 'number':
+            return 0, True, 1
+        elif schema_type == 'boolean':
+            return False, True, 1
+
+        return None, True, 1
+
 
 class OpenAPIConverter:
     """OpenAPI Specification 형식 변환기"""
 
+    HTTP_METHODS = frozenset(['get', 'post', 'put', 'delete', 'patch', 'options', 'head'])
+
     @staticmethod
-    def import_from_file(file_path: str) -> RequestFolder:
+    def import_from_file(file_path: str, metrics: Optional[Dict[str, Any]] = None,
+                         progress: Optional[Callable[[int, int], None]] = None) -> RequestFolder:
         """
         OpenAPI 파일(YAML/JSON)을 Lumina RequestFolder로 변환
 
         Args:
             file_path: 파일 경로
+            metrics: 지정하면 변환 지표를 채움 (import_from_content 참고)
+            progress: 진행 콜백 (import_from_content 참고)
 
         Returns:
             RequestFolder: 변환된 폴더
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
+        # 디코딩 없이 바이트로 파싱 (json/yaml 모두 UTF-8 바이트 입력 지원)
+        with open(file_path, 'rb') as f:
             content = f.read()
-        return OpenAPIConverter.import_from_content(content)
+        return OpenAPIConverter.import_from_content(content, metrics, progress)
 
     @staticmethod
-    def import_from_content(content: str) -> RequestFolder:
+    def import_from_content(content: Union[str, bytes], metrics: Optional[Dict[str, Any]] = None,
+                            progress: Optional[Callable[[int, int], None]] = None) -> RequestFolder:
         """
         OpenAPI 내용(YAML/JSON 문자열)을 Lumina RequestFolder로 변환
-        
+
+        파싱한 문서의 paths 는 요청으로 변환하는 대로 비워서,
+        원본 문서와 변환 결과가 메모리에 동시에 다 올라가 있지 않게 한다.
+
         Args:
-            content: YAML 또는 JSON 문자열
-            
+            content: YAML 또는 JSON 문자열 (bytes 도 가능)
+            metrics: 지정하면 다음 값을 채움
+                     parser ('json' / 'yaml-c' / 'yaml'), size_bytes, operations,
+                     parse_ms, convert_ms, total_ms
+            progress: 오퍼레이션마다 (변환한 요청 수, 만든 폴더 수) 로 호출 (예외를 던지면 중단)
+
         Returns:
             RequestFolder: 변환된 폴더
         """
-        # YAML/JSON 파싱
+        started = time.perf_counter()
+        data, parser = OpenAPIConverter._load_content(content)
+        parsed = time.perf_counter()
+
+        if not isinstance(data, dict):
+            raise ValueError("Invalid OpenAPI content format. Must be YAML or JSON.")
+        root_folder = OpenAPIConverter._parse_openapi_data(data, consume=True, progress=progress)
+        finished = time.perf_counter()
+
+        if metrics is not None:
+            metrics.update({
+                'parser': parser,
+                'size_bytes': len(content) if isinstance(content, bytes) else len(content.encode('utf-8')),
+                'operations': OpenAPIConverter.count_requests(root_folder),
+                'parse_ms': (parsed - started) * 1000,
+                'convert_ms': (finished - parsed) * 1000,
+                'total_ms': (finished - started) * 1000,
+            })
+        return root_folder
+
+    @staticmethod
+    def _load_content(content: Union[str, bytes]) -> Tuple[Any, str]:
+        """
+        YAML/JSON 파싱
+
+        JSON 으로 보이면 json 모듈(C 구현)로 먼저 파싱하고, 실패하면 YAML 로더를 사용한다.
+
+        Returns:
+            (파싱 결과, 사용한 파서 이름)
+        """
+        head = content[:64].lstrip()
+        if head[:1] in ('{', '[', b'{', b'['):
+            try:
+                return json.loads(content), 'json'
+            except ValueError:
+                pass  # JSON 형식이 아니면 YAML 로 시도 (YAML 은 JSON 의 상위 집합)
+
         try:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=SafeLoader)
         except yaml.YAMLError:
-            # YAML 파싱 실패 시 JSON으로 시도
-            try:
-                data = json.loads(content)
-            except json.JSONDecodeError:
-                raise ValueError("Invalid OpenAPI content format. Must be YAML or JSON.")
+            raise ValueError("Invalid OpenAPI content format. Must be YAML or JSON.")
+        return data, 'yaml-c' if SafeLoader is not yaml.SafeLoader else 'yaml'
 
-        return OpenAPIConverter._parse_openapi_data(data)
+    @staticmethod
+    def count_requests(folder: RequestFolder) -> int:
+        """폴더 하위 전체 요청 수"""
+        count = 0
+        stack = [folder]
+        while stack:
+            current = stack.pop()
+            count += len(current.requests)
+            stack.extend(current.folders)
+        return count
 
     @staticmethod
-    def _parse_openapi_data(data: Dict[str, Any]) -> RequestFolder:
-        """OpenAPI 데이터를 파싱하여 RequestFolder 생성"""
+    def _parse_openapi_data(data: Dict[str, Any], consume: bool = False,
+                            progress: Optional[Callable[[int, int], None]] = None) -> RequestFolder:
+        """
+        OpenAPI 데이터를 파싱하여 RequestFolder 생성
+
+        Args:
+            data: 파싱된 OpenAPI 문서
+            consume: True 이면 변환한 path 항목을 data 에서 제거 (메모리 절약)
+            progress: 오퍼레이션마다 (변환한 요청 수, 만든 폴더 수) 로 호출
+        """
         info = data.get('info', {})
         title = info.get('title', 'Imported API')
-        
+
         root_folder = RequestFolder(title)
-        
+
+        # 태그별 폴더 생성을 위한 맵
+        folder_map: Dict[str, RequestFolder] = {}
+
+        for count, (tag_name, request) in enumerate(OpenAPIConverter.iter_requests(data, consume), 1):
+            # 태그 확인 (폴더링)
+            if tag_name is not None:
+                folder = folder_map.get(tag_name)
+                if folder is None:
+                    folder = RequestFolder(tag_name)
+                    folder_map[tag_name] = folder
+                    root_folder.add_folder(folder)
+                folder.add_request(request)
+            else:
+                # 태그가 없으면 루트에 추가
+                root_folder.add_request(request)
+
+            if progress is not None:
+                progress(count, len(folder_map))
+
+        return root_folder
+
+    @staticmethod
+    def iter_requests(data: Dict[str, Any], consume: bool = False) -> Iterator[Tuple[Optional[str], RequestModel]]:
+        """
+        OpenAPI 오퍼레이션을 하나씩 요청으로 변환
+
+        Args:
+            data: 파싱된 OpenAPI 문서
+            consume: True 이면 변환한 path 항목을 data 에서 제거 (메모리 절약).
+                     '#/paths/...' $ref 로 참조되는 path 항목은 제거하지 않음
+
+        Yields:
+            (첫 번째 태그 또는 None, 요청)
+        """
         # 서버 URL (기본 URL)
         servers = data.get('servers', [])
         base_url = servers[0].get('url', '') if servers else ''
-        
-        # 태그별 폴더 생성을 위한 맵
-        folder_map: Dict[str, RequestFolder] = {}
-        
-        paths = data.get('paths', {})
-        for path, operations in paths.items():
+        # 컴포넌트 $ref 해석/예제 생성 결과를 문서 단위로 캐시
+        resolver = RefResolver(data)
+
+        paths = data.get('paths') or {}
+        # 다른 곳에서 $ref 로 가리키는 path 항목은 변환이 끝날 때까지 남겨 둠
+        referenced = OpenAPIConverter._referenced_paths(data) if consume else set()
+        for path in list(paths):
+            # consume 이면 꺼내면서 제거하여 변환이 끝난 원본을 바로 해제
+            operations = paths.pop(path) if consume and path not in referenced else paths[path]
+            if not isinstance(operations, dict):
+                continue
             for method_str, operation in operations.items():
-                if method_str.lower() not in ['get', 'post', 'put', 'delete', 'patch', 'options', 'head']:
+                if method_str.lower() not in OpenAPIConverter.HTTP_METHODS or not isinstance(operation, dict):
                     continue
-                    
+
                 # 요청 모델 생성
-                request = OpenAPIConverter._create_request(
-                    base_url, path, method_str, operation, data.get('components', {})
-                )
-                
-                # 태그 확인 (폴더링)
+                request = OpenAPIConverter._create_request(base_url, path, method_str, operation, resolver)
+
                 tags = operation.get('tags', [])
-                if tags:
-                    tag_name = tags[0] # 첫 번째 태그를 폴더명으로 사용
-                    if tag_name not in folder_map:
-                        folder = RequestFolder(tag_name)
-                        folder_map[tag_name] = folder
-                        root_folder.add_folder(folder)
-                    
-                    folder_map[tag_name].add_request(request)
-                else:
-                    # 태그가 없으면 루트에 추가
-                    root_folder.add_request(request)
-                    
-        return root_folder
+                # 첫 번째 태그를 폴더명으로 사용
+                yield (tags[0] if tags else None), request
+
+    @staticmethod
+    def _referenced_paths(data: Dict[str, Any]) -> Set[str]:
+        """문서 안의 $ref ('#/paths/...') 가 가리키는 path 키 목록 (반복 순회)"""
+        referenced = set()
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                ref = node.get('$ref')
+                if isinstance(ref, str) and ref.startswith('#/paths/'):
+                    token = unquote(ref[len('#/paths/'):]).split('/', 1)[0]
+                    referenced.add(token.replace('~1', '/').replace('~0', '~'))
+                stack.extend(node.values())
+            elif isinstance(node, list):
+                stack.extend(node)
+        return referenced
 
     @staticmethod
-    def _create_request(base_url: str, path: str, method: str, operation: Dict[str, Any], components: Dict[str, Any]) -> RequestModel:
+    def _create_request(base_url: str, path: str, method: str, operation: Dict[str, Any], resolver: RefResolver) -> RequestModel:
         """개별 요청 생성"""
         summary = operation.get('summary', operation.get('operationId', 'Unnamed Request'))
         request = RequestModel(summary)
@@ -113,12 +358,11 @@ class OpenAPIConverter:
         # Parameters (Header, Query)
         parameters = operation.get('parameters', [])
         for param in parameters:
-            # $ref 처리 (간단하게 components 참조 확인)
-            if '$ref' in param:
-                ref_key = param['$ref'].split('/')[-1]
-                if 'parameters' in components and ref_key in components['parameters']:
-                    param = components['parameters'][ref_key]
-            
+            # $ref 처리 (JSON Pointer, 해석 결과는 resolver 에 캐시됨)
+            param = resolver.resolve(param)
+            if not isinstance(param, dict):
+                continue
+
             name = param.get('name')
             in_loc = param.get('in')
             # schema = param.get('schema', {})
@@ -126,7 +370,9 @@ class OpenAPIConverter:
             example = param.get('example', '') # 파라미터 직접 예제
             
             if not example and 'schema' in param:
-                 example = param['schema'].get('example', '')
+                param_schema = resolver.resolve(param['schema'])
+                if isinstance(param_schema, dict):
+                    example = param_schema.get('example', '')
 
             if in_loc == 'header':
                 request.headers[name] = str(example)
@@ -134,15 +380,15 @@ class OpenAPIConverter:
                 request.params[name] = str(example)
                 
         # Request Body
-        request_body = operation.get('requestBody', {})
-        content = request_body.get('content', {})
+        request_body = resolver.resolve(operation.get('requestBody')) or {}
+        content = request_body.get('content') or {}
         
         if 'application/json' in content:
             request.body_type = BodyType.RAW
             schema = content['application/json'].get('schema', {})
             
-            # 예제 생성 로직 (간소화)
-            example_body = OpenAPIConverter._generate_example_from_schema(schema, components)
+            # 예제 생성 ($ref 별로 한 번만 생성하여 재사용)
+            example_body = resolver.generate_example(schema)
             request.body_raw = json.dumps(example_body, indent=2, ensure_ascii=False)
             
             request.headers['Content-Type'] = 'application/json'
@@ -150,54 +396,31 @@ class OpenAPIConverter:
         elif 'application/x-www-form-urlencoded' in content:
             request.body_type = BodyType.FORM_URLENCODED
             schema = content['application/x-www-form-urlencoded'].get('schema', {})
-            props = schema.get('properties', {})
-            for key, prop in props.items():
-                request.body_form[key] = str(prop.get('example', prop.get('default', '')))
-                
+            request.body_form.update(OpenAPIConverter._form_fields(schema, resolver))
+
             request.headers['Content-Type'] = 'application/x-www-form-urlencoded'
 
         elif 'multipart/form-data' in content:
             request.body_type = BodyType.FORM_DATA
             schema = content['multipart/form-data'].get('schema', {})
-            props = schema.get('properties', {})
-            for key, prop in props.items():
-                request.body_form[key] = str(prop.get('example', prop.get('default', '')))
-            
+            request.body_form.update(OpenAPIConverter._form_fields(schema, resolver))
+
             # Content-Type 헤더는 클라이언트가 자동으로 설정하게 둠 (boundary 때문에)
             # request.headers['Content-Type'] = 'multipart/form-data'
 
         return request
 
     @staticmethod
-    def _generate_example_from_schema(schema: Dict[str, Any], components: Dict[str, Any]) -> Any:
-        """스키마로부터 예제 데이터 생성"""
-        if '$ref' in schema:
-            ref_key = schema['$ref'].split('/')[-1]
-            if 'schemas' in components and ref_key in components['schemas']:
-                return OpenAPIConverter._generate_example_from_schema(components['schemas'][ref_key], components)
+    def _form_fields(schema: Any, resolver: RefResolver) -> Dict[str, str]:
+        """폼 스키마의 속성별 예제 값 (예제가 없으면 기본값)"""
+        schema = resolver.resolve(schema)
+        if not isinstance(schema, dict):
             return {}
-            
-        if 'example' in schema:
-            return schema['example']
-            
-        schema_type = schema.get('type')
-        
-        if schema_type == 'object':
-            result = {}
-            properties = schema.get('properties', {})
-            for key, prop in properties.items():
-                result[key] = OpenAPIConverter._generate_example_from_schema(prop, components)
-            return result
-            
-        elif schema_type == 'array':
-            items = schema.get('items', {})
-            return [OpenAPIConverter._generate_example_from_schema(items, components)]
-            
-        elif schema_type == 'string':
-            return "string"
-        elif schema_type == 'integer' or schema_type == 'number':
-            return 0
-        elif schema_type == 'boolean':
-            return False
-            
-        return None
+        fields = {}
+        for key, prop in (schema.get('properties') or {}).items():
+            prop = resolver.resolve(prop)
+            if isinstance(prop, dict):
+                fields[key] = str(prop.get('example', prop.get('default', '')))
+            else:
+                fields[key] = ''
+        return fields
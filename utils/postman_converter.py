@@ -2,21 +2,49 @@
 Postman Import/Export Converter
 Postman Collection 형식과 Lumina 형식 간 변환
 """
+import json
+import time
 import uuid
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, BinaryIO, Callable, Tuple
 from models.request_model import RequestModel, RequestFolder, HttpMethod, BodyType, AuthType
 
+# 진행 콜백: (변환한 요청 수, 만든 폴더 수). 예외를 던지면 변환이 중단됨
+ProgressCallback = Callable[[int, int], None]
+
+try:
+    # ijson 이 있으면 업로드를 이벤트 단위로 읽으며 변환 (문서 전체를 dict 로 만들지 않음)
+    import ijson
+except ImportError:
+    ijson = None
+
+
+class _NotPostmanCollection(Exception):
+    """스트리밍 파싱 도중 Postman Collection 이 아님을 확인함"""
+
+
+class _ItemFrame:
+    """스트리밍 파싱 중인 item 객체 (컬렉션 루트 포함)"""
+
+    __slots__ = ('fields', 'folder', 'in_items')
+
+    def __init__(self):
+        self.fields: Dict[str, Any] = {}
+        # 'item' 키가 나오면 폴더로 확정
+        self.folder: Optional[RequestFolder] = None
+        self.in_items = False
+
 
 class PostmanConverter:
     """Postman Collection 형식 변환기"""
 
     @staticmethod
-    def import_from_postman(postman_data: Dict[str, Any]) -> RequestFolder:
+    def import_from_postman(postman_data: Dict[str, Any], progress: Optional[ProgressCallback] = None) -> RequestFolder:
         """
         Postman Collection JSON 데이터를 Lumina RequestFolder로 변환
 
         Args:
             postman_data: Postman Collection JSON
+            progress: item 마다 호출할 진행 콜백
 
         Returns:
             RequestFolder: 변환된 폴더
@@ -28,26 +56,232 @@ class PostmanConverter:
 
         # Collection의 item들을 처리
         items = postman_data.get('item', [])
-        PostmanConverter._process_items(items, root_folder)
+        PostmanConverter._process_items(items, root_folder, progress)
+
+        return root_folder
+
+    @staticmethod
+    def is_postman_collection(data: Any) -> bool:
+        """Postman Collection 인지 확인 (info 에 _postman_id 또는 schema)"""
+        if not isinstance(data, dict):
+            return False
+        info = data.get('info')
+        return isinstance(info, dict) and ('_postman_id' in info or 'schema' in info)
+
+    @staticmethod
+    def import_from_stream(stream: BinaryIO, metrics: Optional[Dict[str, Any]] = None,
+                           progress: Optional[ProgressCallback] = None) -> Optional[RequestFolder]:
+        """
+        Postman Collection JSON 파일(바이너리 스트림)을 읽으며 RequestFolder로 변환
+
+        ijson 이 설치되어 있으면 파싱 이벤트를 받는 대로 폴더/요청을 만들어,
+        문서 전체를 dict 로 올리지 않고 요청 하나 분량만 메모리에 유지한다.
+        없으면 json.load 로 한 번에 읽어 변환한다.
+        중첩 깊이와 관계없이 재귀 없이 처리한다.
+
+        Args:
+            stream: JSON 바이너리 스트림 (업로드 파일 등)
+            metrics: 지정하면 parser ('ijson' / 'json'), requests, folders, total_ms 를 채움
+            progress: item 마다 호출할 진행 콜백
+
+        Returns:
+            RequestFolder: 변환된 폴더 (Postman Collection 이 아니면 None)
 
+        Raises:
+            ValueError: JSON 형식이 잘못된 경우
+        """
+        started = time.perf_counter()
+        # UTF-8 BOM 건너뛰기 (ijson 은 BOM 을 허용하지 않음)
+        position = stream.tell()
+        if stream.read(3) != b'\xef\xbb\xbf':
+            stream.seek(position)
+
+        if ijson is not None:
+            parser = 'ijson'
+            try:
+                root_folder = PostmanConverter._import_events(ijson.basic_parse(stream, use_float=True), progress)
+            except _NotPostmanCollection:
+                root_folder = None
+            except ijson.JSONError as e:
+                raise ValueError(f"Invalid JSON: {e}") from e
+        else:
+            parser = 'json'
+            try:
+                data = json.load(stream)
+            except RecursionError:
+                # 표준 json 모듈은 재귀로 파싱하므로 아주 깊은 중첩은 ijson 필요
+                raise ValueError("Collection is nested too deeply to parse (install ijson)")
+            if PostmanConverter.is_postman_collection(data):
+                root_folder = PostmanConverter.import_from_postman(data, progress)
+            else:
+                root_folder = None
+
+        if metrics is not None and root_folder is not None:
+            request_count, folder_count = PostmanConverter._count_items(root_folder)
+            metrics.update({
+                'parser': parser,
+                'requests': request_count,
+                'folders': folder_count,
+                'total_ms': (time.perf_counter() - started) * 1000,
+            })
+        return root_folder
+
+    @staticmethod
+    def _import_events(events, progress: Optional[ProgressCallback] = None) -> RequestFolder:
+        """
+        ijson.basic_parse 이벤트로 폴더 트리 구성 (재귀 없음)
+
+        item 객체마다 프레임을 쌓고, 'item' 배열이 아닌 필드는 값 단위로 모은다.
+        item 객체가 끝나면 폴더 이름을 정하거나 요청으로 변환해 부모에 추가한다
+        (형제 item 은 순서대로 끝나므로 원래 순서가 유지됨).
+        루트에서 Postman Collection 이 아님을 알게 되면 바로 중단한다.
+        """
+        events = iter(events)
+        first = next(events, None)
+        if first is None or first[0] != 'start_map':
+            raise _NotPostmanCollection()
+
+        root = _ItemFrame()
+        stack = [root]
+        request_count = folder_count = 0
+        for event, value in events:
+            frame = stack[-1]
+
+            if frame.in_items:
+                # 'item' 배열의 원소
+                if event == 'start_map':
+                    stack.append(_ItemFrame())
+                elif event == 'end_array':
+                    frame.in_items = False
+                else:
+                    # 객체가 아닌 원소는 무시
+                    PostmanConverter._build_value(event, value, events)
+                continue
+
+            if event == 'map_key':
+                key = value
+                event, value = next(events)
+                if key == 'item' and event == 'start_array':
+                    if frame.folder is None:
+                        frame.folder = RequestFolder('')
+                    frame.in_items = True
+                    continue
+
+                frame.fields[key] = PostmanConverter._build_value(event, value, events)
+                if frame is root:
+                    if key in ('openapi', 'swagger'):
+                        raise _NotPostmanCollection()
+                    if key == 'info' and not PostmanConverter.is_postman_collection(root.fields):
+                        raise _NotPostmanCollection()
+                continue
+
+            # end_map: item 객체 종료
+            stack.pop()
+            if not stack:
+                break
+            if PostmanConverter._attach_item(frame, stack[-1].folder):
+                folder_count += 1
+            else:
+                request_count += 1
+            if progress is not None:
+                progress(request_count, folder_count)
+
+        if not PostmanConverter.is_postman_collection(root.fields):
+            raise _NotPostmanCollection()
+
+        root_folder = root.folder or RequestFolder('')
+        root_folder.name = root.fields['info'].get('name', 'Imported from Postman')
         return root_folder
 
     @staticmethod
-    def _process_items(items: List[Dict[str, Any]], parent_folder: RequestFolder):
-        """Postman item들을 재귀적으로 처리"""
-        for item in items:
-            # item이 폴더인지 요청인지 확인
-            if 'item' in item:
-                # 폴더 (하위 item이 있음)
-                folder = RequestFolder(item.get('name', 'Unnamed Folder'))
-                parent_folder.add_folder(folder)
-
-                # 하위 아이템 재귀 처리
-                PostmanConverter._process_items(item['item'], folder)
+    def _build_value(event: str, value: Any, events) -> Any:
+        """현재 이벤트부터 값 하나를 끝까지 읽어 Python 객체로 변환 (재귀 없음)"""
+        if event == 'start_map':
+            result = {}
+        elif event == 'start_array':
+            result = []
+        else:
+            return value
+
+        # 열린 dict/list 스택. dict 의 값 바로 앞에는 항상 map_key 가 오므로 키는 하나만 기억
+        containers = [result]
+        key = None
+        for event, value in events:
+            if event == 'map_key':
+                key = value
+                continue
+            if event == 'end_map' or event == 'end_array':
+                containers.pop()
+                if not containers:
+                    break
+                continue
+
+            if event == 'start_map':
+                value = {}
+            elif event == 'start_array':
+                value = []
+            container = containers[-1]
+            if type(container) is dict:
+                container[key] = value
+            else:
+                container.append(value)
+            if event == 'start_map' or event == 'start_array':
+                containers.append(value)
+        return result
+
+    @staticmethod
+    def _attach_item(frame: _ItemFrame, parent_folder: RequestFolder) -> bool:
+        """완성된 item 을 폴더 또는 요청으로 부모 폴더에 추가 (폴더이면 True)"""
+        fields = frame.fields
+        if frame.folder is not None or 'item' in fields:
+            folder = frame.folder or RequestFolder('')
+            folder.name = fields.get('name', 'Unnamed Folder')
+            parent_folder.add_folder(folder)
+            return True
+        parent_folder.add_request(PostmanConverter._convert_postman_request(fields))
+        return False
+
+    @staticmethod
+    def _process_items(items: List[Dict[str, Any]], parent_folder: RequestFolder,
+                       progress: Optional[ProgressCallback] = None):
+        """Postman item들을 처리 (깊게 중첩된 컬렉션도 재귀 없이 스택으로)"""
+        # (남은 item 반복자, 추가할 폴더)
+        stack = [(iter(items), parent_folder)]
+        request_count = folder_count = 0
+        while stack:
+            remaining, folder = stack[-1]
+            for item in remaining:
+                # item이 폴더인지 요청인지 확인
+                if 'item' in item:
+                    # 폴더 (하위 item이 있음) - 하위 아이템을 먼저 처리한 뒤 이어서 진행
+                    sub_folder = RequestFolder(item.get('name', 'Unnamed Folder'))
+                    folder.add_folder(sub_folder)
+                    stack.append((iter(item['item']), sub_folder))
+                    folder_count += 1
+                    if progress is not None:
+                        progress(request_count, folder_count)
+                    break
+                else:
+                    # 요청
+                    request = PostmanConverter._convert_postman_request(item)
+                    folder.add_request(request)
+                    request_count += 1
+                    if progress is not None:
+                        progress(request_count, folder_count)
             else:
-                # 요청
-                request = PostmanConverter._convert_postman_request(item)
-                parent_folder.add_request(request)
+                stack.pop()
+
+    @staticmethod
+    def _count_items(folder: RequestFolder) -> Tuple[int, int]:
+        """폴더 안의 (요청 수, 하위 폴더 수)"""
+        request_count = folder_count = 0
+        pending = [folder]
+        while pending:
+            current = pending.pop()
+            request_count += len(current.requests)
+            folder_count += len(current.folders)
+            pending.extend(current.folders)
+        return request_count, folder_count
 
     @staticmethod
     def _convert_postman_request(postman_item: Dict[str, Any]) -> RequestModel:
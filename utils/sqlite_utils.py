@@ -0,0 +1,45 @@
+"""
+SQLite 유틸리티
+"""
+import sqlite3
+import threading
+from typing import List
+
+
+class ThreadLocalConnections:
+    """
+    스레드별 SQLite 연결 관리 (sqlite3 연결은 스레드 간 공유하지 않음)
+
+    autocommit 모드(isolation_level=None)로 열며, 트랜잭션은 호출 측에서
+    BEGIN / BEGIN IMMEDIATE 로 직접 시작한다.
+    """
+
+    def __init__(self, db_path: str, busy_timeout_ms: int = 5000):
+        self.db_path = str(db_path)
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def get(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 (없으면 생성)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout_ms / 1000, isolation_level=None)
+            conn.execute(f'PRAGMA busy_timeout={self.busy_timeout_ms}')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def close_all(self):
+        """모든 스레드의 연결 닫기"""
+        with self._lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections = []
+        self._local = threading.local()
@@ -2,7 +2,32 @@
 환경 변수를 치환하는 유틸리티
 """
 import re
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, List, Tuple, Union
+
+
+class CompiledTemplate:
+    """
+    {{변수명}} 템플릿을 미리 파싱한 형태
+
+    segments 는 리터럴 문자열과 (변수명, 원본 텍스트) 튜플의 목록이다.
+    """
+
+    __slots__ = ('source', 'segments', 'variables')
+
+    def __init__(self, source: str, segments: List[Union[str, Tuple[str, str]]]):
+        self.source = source
+        self.segments = tuple(segments)
+        self.variables = tuple(seg[0] for seg in segments if isinstance(seg, tuple))
+
+    def render(self, variables: Dict[str, str]) -> str:
+        """변수 딕셔너리로 렌더링 (값이 없으면 원본 유지)"""
+        if not self.variables:
+            return self.source
+        return ''.join(
+            seg if isinstance(seg, str) else variables.get(seg[0], seg[1])
+            for seg in self.segments
+        )
 
 
 class VariableResolver:
@@ -11,6 +36,54 @@ class VariableResolver:
     # {{변수명}} 형태를 찾는 정규식
     PATTERN = re.compile(r'\{\{([^}]+)\}\}')
 
+    # 컴파일된 템플릿 캐시 크기 (소스 텍스트 기준)
+    CACHE_SIZE = 4096
+
+    # 이보다 긴 텍스트는 캐시하지 않음 (큰 본문이 캐시에 남아 메모리를 차지하지 않도록)
+    CACHE_MAX_TEXT_LENGTH = 4096
+
+    @staticmethod
+    def compile(text: str) -> CompiledTemplate:
+        """
+        텍스트를 리터럴/변수 세그먼트로 파싱
+
+        CACHE_MAX_TEXT_LENGTH 이하의 텍스트는 소스 텍스트 기준으로 캐시된다.
+        캐시 키가 원본 텍스트이므로 요청이 수정되면 자연히 새 항목이 사용되고,
+        변수 값은 렌더링 시점에 바인딩되므로 환경이 바뀌어도 무효화가 필요 없다.
+
+        Args:
+            text: 템플릿 텍스트
+
+        Returns:
+            컴파일된 템플릿
+        """
+        if len(text) > VariableResolver.CACHE_MAX_TEXT_LENGTH:
+            return VariableResolver._parse(text)
+        return VariableResolver._compile_cached(text)
+
+    @staticmethod
+    @lru_cache(maxsize=CACHE_SIZE)
+    def _compile_cached(text: str) -> CompiledTemplate:
+        return VariableResolver._parse(text)
+
+    @staticmethod
+    def _parse(text: str) -> CompiledTemplate:
+        segments: List[Union[str, Tuple[str, str]]] = []
+        position = 0
+        for match in VariableResolver.PATTERN.finditer(text):
+            if match.start() > position:
+                segments.append(text[position:match.start()])
+            segments.append((match.group(1).strip(), match.group(0)))
+            position = match.end()
+        if position < len(text):
+            segments.append(text[position:])
+        return CompiledTemplate(text, segments)
+
+    @classmethod
+    def clear_cache(cls):
+        """컴파일된 템플릿 캐시 비우기"""
+        cls._compile_cached.cache_clear()
+
     @classmethod
     def resolve(cls, text: str, variables: Dict[str, str]) -> str:
         """
@@ -26,11 +99,7 @@ class VariableResolver:
         if not text:
             return text
 
-        def replacer(match):
-            var_name = match.group(1).strip()
-            return variables.get(var_name, match.group(0))  # 값이 없으면 원본 유지
-
-        return cls.PATTERN.sub(replacer, text)
+        return cls.compile(text).render(variables)  # 값이 없으면 원본 유지
 
     @classmethod
     def resolve_dict(cls, data: Dict[str, str], variables: Dict[str, str]) -> Dict[str, str]:
@@ -60,5 +129,4 @@ class VariableResolver:
         if not text:
             return []
 
-        matches = cls.PATTERN.findall(text)
-        return [match.strip() for match in matches]
+        return list(cls.compile(text).variables)
@@ -0,0 +1,120 @@
+"""
+HTTP 응답 압축
+Accept-Encoding 에 따라 API 응답을 gzip (brotli 패키지가 있으면 br) 으로 압축
+"""
+import zlib
+from typing import Iterable, Iterator, Optional
+
+from flask import Flask, Response, request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# 이보다 작은 본문은 압축하지 않음 (압축 이득보다 오버헤드가 큼)
+MIN_COMPRESS_SIZE = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5  # 동적 응답용 (11 은 너무 느림)
+
+COMPRESSIBLE_TYPES = (
+    'text/',
+    'application/json',
+    'application/javascript',
+    'application/xml',
+    'application/x-www-form-urlencoded',
+    'image/svg+xml',
+)
+
+
+def choose_encoding() -> Optional[str]:
+    """현재 요청의 Accept-Encoding 에서 사용할 인코딩 선택 (없으면 None)"""
+    accept = request.accept_encodings
+    gzip_q = accept.quality('gzip')
+    if brotli is not None:
+        br_q = accept.quality('br')
+        if br_q > 0 and br_q >= gzip_q:
+            return 'br'
+    return 'gzip' if gzip_q > 0 else None
+
+
+def is_compressible(response: Response) -> bool:
+    """압축 대상 응답인지 확인"""
+    if response.status_code < 200 or response.status_code in (204, 206, 304):
+        return False
+    if 'Content-Encoding' in response.headers or 'Content-Range' in response.headers:
+        return False
+    # send_file 등 파일을 그대로 넘기는 응답
+    if response.direct_passthrough:
+        return False
+    mimetype = response.mimetype or ''
+    # SSE 는 이벤트 단위로 바로 전달되어야 함
+    if mimetype == 'text/event-stream':
+        return False
+    return mimetype.startswith(COMPRESSIBLE_TYPES)
+
+
+def compress_bytes(data: bytes, encoding: str) -> bytes:
+    """본문 전체 압축"""
+    if encoding == 'br':
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)  # wbits=31: gzip 형식
+    return compressor.compress(data) + compressor.flush()
+
+
+def compress_stream(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    """청크 단위 스트리밍 압축 (본문 전체를 메모리에 올리지 않음)"""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        compress, finish = compressor.process, compressor.finish
+    else:
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        compress, finish = compressor.compress, compressor.flush
+
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            data = compress(chunk)
+            if data:
+                yield data
+        yield finish()
+    finally:
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
+
+
+def init_compression(app: Flask, min_size: int = MIN_COMPRESS_SIZE):
+    """
+    앱에 응답 압축 등록
+
+    크기를 아는 응답은 min_size 이상일 때 한 번에 압축하고,
+    스트리밍 응답(임시 파일 본문 다운로드 등)은 청크 단위로 압축한다.
+
+    Args:
+        app: Flask 앱
+        min_size: 압축할 최소 본문 크기 (바이트)
+    """
+    @app.after_request
+    def compress_response(response: Response) -> Response:
+        if not is_compressible(response):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = choose_encoding()
+        if encoding is None:
+            return response
+
+        if response.is_streamed:
+            response.response = compress_stream(response.response, encoding)
+            response.headers.pop('Content-Length', None)
+        else:
+            data = response.get_data()
+            if len(data) < min_size:
+                return response
+            response.set_data(compress_bytes(data, encoding))
+
+        response.headers['Content-Encoding'] = encoding
+        return response
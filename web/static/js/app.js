@@ -1,6 +1,10 @@
 // Lumina Web App - Main JavaScript
 
 const API_BASE = '/api';
+// 이보다 큰 Postman/OpenAPI 파일은 미리보기용으로 브라우저에서 파싱하지 않음
+const POSTMAN_PREVIEW_MAX_BYTES = 5 * 1024 * 1024;
+// 백그라운드 가져오기 작업 상태 조회 간격 (ms)
+const IMPORT_POLL_INTERVAL_MS = 500;
 
 // Ensure all fetch calls include credentials by default so sessions stick
 const __originalFetch = window.fetch.bind(window);
@@ -24,6 +28,7 @@ class LuminaApp {
         this.currentProject = null;
         this.projects = [];
         this.isResizing = false;
+        this.activeImportJobId = null;
         this.init();
     }
 
@@ -78,6 +83,12 @@ class LuminaApp {
         // Request Toolbar
         document.getElementById('btn-copy-url').addEventListener('click', () => this.copyRequestUrl());
         document.getElementById('btn-delete-request').addEventListener('click', () => this.deleteRequest());
+        document.getElementById('btn-load-test').addEventListener('click', () => this.showLoadTestModal());
+
+        // Load Test Modal
+        document.getElementById('btn-close-load-test').addEventListener('click', () => this.hideLoadTestModal());
+        document.getElementById('btn-cancel-load-test').addEventListener('click', () => this.hideLoadTestModal());
+        document.getElementById('btn-run-load-test').addEventListener('click', () => this.runLoadTest());
 
         // Click outside to close more menu
         document.addEventListener('click', (e) => {
@@ -194,7 +205,8 @@ class LuminaApp {
 
     async loadFolderTree() {
         try {
-            const response = await fetch(`${API_BASE}/folders/tree`);
+            // 트리에는 요약만 받고, 요청 상세는 선택 시 로드 (selectRequest)
+            const response = await fetch(`${API_BASE}/folders/tree?summary=1`);
             const data = await response.json();
             this.folderTree = data.tree;
             this.renderFolderTree();
@@ -833,8 +845,8 @@ class LuminaApp {
                 await this.executeRequestBrowserMode(isMultipart);
             } else {
                 // ==================== BACKEND PROXY EXECUTION ====================
-                const response = await fetch(`${API_BASE}/requests/${this.currentRequest.id}/execute`, fetchOptions);
-                const result = await response.json();
+                // 진행 상황과 본문을 SSE 로 받아 점진적으로 표시
+                const result = await this.executeRequestStreaming(fetchOptions);
                 this.renderResponse(result);
                 // 히스토리 새로고침
                 await this.loadHistory();
@@ -851,6 +863,91 @@ class LuminaApp {
         }
     }
 
+    async executeRequestStreaming(fetchOptions) {
+        const response = await fetch(`${API_BASE}/requests/${this.currentRequest.id}/execute/stream`, fetchOptions);
+        const contentType = response.headers.get('content-type') || '';
+        if (!response.body || !contentType.startsWith('text/event-stream')) {
+            // 오류 응답(JSON) 또는 스트림을 지원하지 않는 환경
+            return await response.json();
+        }
+
+        const statusEl = document.getElementById('response-status');
+        const metaEl = document.getElementById('response-meta');
+        const bodyEl = document.getElementById('response-body');
+        document.getElementById('response-panel').classList.remove('hidden');
+        statusEl.className = 'response-status';
+        statusEl.textContent = 'Connecting...';
+        metaEl.textContent = '';
+        bodyEl.textContent = '';
+
+        const phaseLabels = {
+            start: 'Starting', dns: 'DNS resolved', connect: 'Connected', tls: 'TLS handshake done',
+            sent: 'Request sent, waiting for response'
+        };
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        let bodyText = '';
+        let result = null;
+
+        const handleEvent = (event, data) => {
+            if (phaseLabels[event]) {
+                statusEl.textContent = `${phaseLabels[event]}...`;
+                metaEl.textContent = `${data.elapsed_ms.toFixed(0)} ms`;
+            } else if (event === 'headers') {
+                const statusClass = data.status_code >= 200 && data.status_code < 300 ? 'status-success' : 'status-error';
+                statusEl.className = `response-status ${statusClass}`;
+                statusEl.textContent = `${data.status_code} ${data.status_text}`;
+                metaEl.textContent = `First byte: ${data.elapsed_ms.toFixed(0)} ms | Receiving...`;
+                this.renderResponseHeaders(data.headers || {});
+            } else if (event === 'chunk') {
+                bodyText += data.text;
+                bodyEl.textContent += data.text;
+                metaEl.textContent = `Time: ${data.elapsed_ms.toFixed(0)} ms | Received: ${data.received} bytes`;
+            } else if (event === 'progress') {
+                metaEl.textContent = `Time: ${data.elapsed_ms.toFixed(0)} ms | Received: ${data.received} bytes`;
+            } else if (event === 'retry') {
+                statusEl.className = 'response-status';
+                statusEl.textContent = `Attempt ${data.attempt}/${data.max_attempts} failed (${data.reason}), retrying...`;
+                metaEl.textContent = `Waiting ${data.delay_ms.toFixed(0)} ms`;
+            } else if (event === 'complete') {
+                result = data;
+            } else if (event === 'error') {
+                result = { error: data.error, status_code: 0 };
+            }
+        };
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+
+            let boundary;
+            while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                const block = buffer.slice(0, boundary);
+                buffer = buffer.slice(boundary + 2);
+                let event = 'message';
+                let data = '';
+                block.split('\n').forEach(line => {
+                    if (line.startsWith('event: ')) event = line.slice(7);
+                    else if (line.startsWith('data: ')) data += line.slice(6);
+                });
+                if (data) handleEvent(event, JSON.parse(data));
+            }
+        }
+
+        if (!result) {
+            return { error: 'Connection closed before the response completed', status_code: 0 };
+        }
+        if (result.body_streamed) {
+            result.body = bodyText;
+        } else if (result.body_truncated && bodyText.length > result.body.length) {
+            // 스트리밍으로 받은 부분이 미리보기보다 길면 그것을 표시
+            result.body = bodyText;
+        }
+        return result;
+    }
+
     async executeRequestHelper(fetchOptions) {
         return await fetch(`${API_BASE}/requests/${this.currentRequest.id}/execute`, fetchOptions);
     }
@@ -1054,21 +1151,27 @@ class LuminaApp {
         if (response.error) {
             statusEl.className = 'response-status status-error';
             statusEl.textContent = `Error: ${response.error}`;
-            metaEl.textContent = '';
+            metaEl.textContent = `${this.formatTimings(response.timings).trim()}${this.formatAttempts(response.attempts)}`;
             bodyEl.textContent = response.error;
         } else {
             const statusClass = response.status_code >= 200 && response.status_code < 300 ? 'status-success' : 'status-error';
             statusEl.className = `response-status ${statusClass}`;
             statusEl.textContent = `${response.status_code} ${response.status_text}`;
 
-            metaEl.textContent = `Time: ${response.elapsed_ms.toFixed(0)} ms | Size: ${response.size_bytes} bytes`;
+            metaEl.textContent = `Time: ${response.elapsed_ms.toFixed(0)} ms${this.formatTimings(response.timings)} | Size: ${response.size_bytes} bytes${this.formatAttempts(response.attempts)}`;
 
-            // Body (Pretty JSON if possible)
-            try {
-                const jsonData = JSON.parse(response.body);
-                bodyEl.textContent = JSON.stringify(jsonData, null, 2);
-            } catch {
-                bodyEl.textContent = response.body;
+            if (response.body_truncated) {
+                // 큰 응답은 미리보기만 표시하고 전체 본문은 다운로드 링크로 제공
+                metaEl.innerHTML = `${metaEl.textContent} | <a href="${response.body_url}?download=1">Download full body</a>`;
+                bodyEl.textContent = `[Showing the first ${response.body.length} characters]\n\n${response.body}`;
+            } else {
+                // Body (Pretty JSON if possible)
+                try {
+                    const jsonData = JSON.parse(response.body);
+                    bodyEl.textContent = JSON.stringify(jsonData, null, 2);
+                } catch {
+                    bodyEl.textContent = response.body;
+                }
             }
         }
 
@@ -1082,6 +1185,25 @@ class LuminaApp {
         this.loadHistory();
     }
 
+    formatTimings(timings) {
+        // 단계별 소요 시간: " (DNS 2 · Connect 1 · TLS 30 · TTFB 40 · Download 5 ms)"
+        if (!timings) return '';
+        const labels = { dns: 'DNS', connect: 'Connect', tls: 'TLS', send: 'Send', wait: 'TTFB', download: 'Download' };
+        const parts = Object.keys(labels)
+            .filter(phase => timings[phase] !== undefined)
+            .map(phase => `${labels[phase]} ${timings[phase].toFixed(0)}`);
+        if (parts.length === 0) return '';
+        if (timings.connect === undefined) parts.unshift('reused conn');
+        return ` (${parts.join(' · ')} ms)`;
+    }
+
+    formatAttempts(attempts) {
+        // 재시도 기록: " | Attempts: 3 (503, timeout, 200)"
+        if (!attempts || attempts.length < 2) return '';
+        const outcomes = attempts.map(a => a.error ? (a.error === 'Request timeout' ? 'timeout' : 'error') : a.status_code);
+        return ` | Attempts: ${attempts.length} (${outcomes.join(', ')})`;
+    }
+
     renderResponseHeaders(headers) {
         const tbody = document.getElementById('response-headers-tbody');
         if (!tbody) return; // Element doesn't exist in simplified UI
@@ -1224,7 +1346,7 @@ class LuminaApp {
                     <strong>${entry.request.method}</strong> ${entry.request.url}
                 </div>
                 <div class="history-meta">
-                    Time: ${entry.response.elapsed_ms.toFixed(0)} ms |
+                    Time: ${entry.response.elapsed_ms.toFixed(0)} ms${this.formatTimings(entry.response.timings)} |
                     Size: ${entry.response.size_bytes} bytes
                 </div>
             `;
@@ -1325,7 +1447,7 @@ class LuminaApp {
         statusEl.className = `response-status ${statusClass}`;
         statusEl.textContent = `${entry.response.status_code} ${entry.response.status_text || ''}`;
 
-        metaEl.textContent = `Time: ${entry.response.elapsed_ms.toFixed(0)} ms | Size: ${entry.response.size_bytes} bytes`;
+        metaEl.textContent = `Time: ${entry.response.elapsed_ms.toFixed(0)} ms${this.formatTimings(entry.response.timings)} | Size: ${entry.response.size_bytes} bytes`;
 
         // Body
         if (entry.response.body) {
@@ -1892,6 +2014,98 @@ class LuminaApp {
         }
     }
 
+    // ==================== Load Test Functions ====================
+
+    showLoadTestModal() {
+        if (!this.currentRequest) {
+            alert('Please select a request first');
+            return;
+        }
+        document.getElementById('load-test-results').style.display = 'none';
+        this.showModal('load-test-modal');
+    }
+
+    hideLoadTestModal() {
+        this.hideModal('load-test-modal');
+    }
+
+    async runLoadTest() {
+        if (!this.currentRequest) return;
+
+        const rampFrom = document.getElementById('load-test-ramp-from').value;
+        const payload = {
+            rps: parseFloat(document.getElementById('load-test-rps').value),
+            duration: parseFloat(document.getElementById('load-test-duration').value),
+            max_concurrency: parseInt(document.getElementById('load-test-concurrency').value, 10),
+            ramp_from: rampFrom === '' ? null : parseFloat(rampFrom)
+        };
+
+        const btn = document.getElementById('btn-run-load-test');
+        btn.disabled = true;
+        btn.textContent = `Running (${payload.duration}s)...`;
+
+        try {
+            // 진행 중인 편집 내용을 먼저 저장
+            await this.saveCurrentRequest();
+
+            const response = await fetch(`${API_BASE}/requests/${this.currentRequest.id}/loadtest`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify(payload)
+            });
+            const result = await response.json();
+
+            if (!response.ok) {
+                alert(`Load test failed: ${result.error}`);
+                return;
+            }
+            this.renderLoadTestResults(result);
+        } catch (error) {
+            console.error('Failed to run load test:', error);
+            alert('Load test failed');
+        } finally {
+            btn.disabled = false;
+            btn.textContent = 'Run';
+        }
+    }
+
+    renderLoadTestResults(result) {
+        const latency = result.latency;
+        const maxCount = Math.max(1, ...latency.buckets.map(b => b.count));
+        const bars = latency.buckets
+            .filter(b => b.count > 0)
+            .map(b => {
+                const label = b.le_ms === null ? `> ${b.gt_ms} ms` : `≤ ${b.le_ms} ms`;
+                const width = Math.round((b.count / maxCount) * 100);
+                return `<tr>
+                    <td style="white-space: nowrap;">${label}</td>
+                    <td><div style="background: var(--primary-color); height: 0.8rem; width: ${width}%;"></div></td>
+                    <td>${b.count}</td>
+                </tr>`;
+            }).join('');
+        const statuses = Object.entries(result.status_counts)
+            .map(([status, count]) => `${status}: ${count}`).join(', ');
+
+        const resultsEl = document.getElementById('load-test-results');
+        resultsEl.innerHTML = `
+            <table class="key-value-table">
+                <tbody>
+                    <tr><td>Requests</td><td>${result.completed} / ${result.sent} sent in ${result.elapsed_s.toFixed(1)} s</td></tr>
+                    <tr><td>Dropped</td><td>${result.dropped}${result.dropped ? ' (target could not keep up)' : ''}</td></tr>
+                    <tr><td>Throughput</td><td>${result.throughput_rps.toFixed(1)} req/s</td></tr>
+                    <tr><td>Errors</td><td>${result.errors}</td></tr>
+                    <tr><td>Status</td><td>${statuses || '-'}</td></tr>
+                    <tr><td>p50 / p90 / p99</td><td>${latency.p50_ms.toFixed(0)} / ${latency.p90_ms.toFixed(0)} / ${latency.p99_ms.toFixed(0)} ms</td></tr>
+                    <tr><td>Min / Mean / Max</td><td>${latency.min_ms.toFixed(0)} / ${latency.mean_ms.toFixed(0)} / ${latency.max_ms.toFixed(0)} ms</td></tr>
+                </tbody>
+            </table>
+            <table class="key-value-table" style="margin-top: 1rem;">
+                <tbody>${bars}</tbody>
+            </table>
+        `;
+        resultsEl.style.display = 'block';
+    }
+
     // ==================== Global Constants Functions ====================
 
     async showGlobalConstantsModal() {
@@ -2008,6 +2222,64 @@ class LuminaApp {
         }
     }
 
+    // ==================== Import Job Functions ====================
+
+    // 가져오기를 백그라운드 작업으로 시작하고 끝날 때까지 진행 상황을 버튼에 표시
+    // 반환값은 동기 가져오기 응답과 같은 형태 (취소되면 { cancelled: true })
+    async runImportJob(path, options, button) {
+        const response = await fetch(`${API_BASE}${path}?background=1`, options);
+        const started = await response.json();
+        if (!response.ok || !started.job) {
+            return { success: false, error: started.error || `HTTP ${response.status}` };
+        }
+
+        let job = started.job;
+        this.activeImportJobId = job.id;
+        try {
+            while (!['completed', 'failed', 'cancelled'].includes(job.status)) {
+                if (button) {
+                    button.textContent = this.formatImportProgress(job);
+                }
+                await new Promise(resolve => setTimeout(resolve, IMPORT_POLL_INTERVAL_MS));
+                const poll = await fetch(`${API_BASE}/import/jobs/${job.id}`);
+                const polled = await poll.json();
+                if (!poll.ok) {
+                    return { success: false, error: polled.error || `HTTP ${poll.status}` };
+                }
+                job = polled;
+            }
+        } finally {
+            if (this.activeImportJobId === job.id) {
+                this.activeImportJobId = null;
+            }
+        }
+
+        if (job.status === 'cancelled') {
+            return { success: false, cancelled: true };
+        }
+        return job.status === 'completed' ? job.result : { success: false, error: job.error };
+    }
+
+    formatImportProgress(job) {
+        if (job.status === 'queued') {
+            return '대기 중...';
+        }
+        if (job.stage === 'fetching') {
+            return '다운로드 중...';
+        }
+        const { operations, folders } = job.progress;
+        return `가져오는 중... (요청 ${operations}개, 폴더 ${folders}개)`;
+    }
+
+    // 진행 중인 가져오기 작업 취소 (가져오기 창을 닫을 때)
+    cancelActiveImportJob() {
+        if (!this.activeImportJobId) {
+            return;
+        }
+        fetch(`${API_BASE}/import/jobs/${this.activeImportJobId}/cancel`, { method: 'POST' })
+            .catch(error => console.error('Failed to cancel import job:', error));
+    }
+
     // ==================== Insomnia Import/Export Functions ====================
 
     showImportInsomniaModal() {
@@ -2020,6 +2292,7 @@ class LuminaApp {
     }
 
     hideImportInsomniaModal() {
+        this.cancelActiveImportJob();
         this.hideModal('import-insomnia-modal');
     }
 
@@ -2077,15 +2350,16 @@ class LuminaApp {
         btn.textContent = '가져오는 중...';
 
         try {
-            const response = await fetch(`${API_BASE}/import/insomnia`, {
+            const result = await this.runImportJob('/import/insomnia', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({ data: this.selectedInsomniaFile })
-            });
+            }, btn);
 
-            const result = await response.json();
-
-            if (result.success) {
+            if (result.cancelled) {
+                btn.disabled = false;
+                btn.textContent = 'Import as New Project';
+            } else if (result.success) {
                 alert(`폴더 "${result.folder_name}"를 성공적으로 가져왔습니다! (${result.imported_count}개 요청)`);
                 this.hideImportInsomniaModal();
 
@@ -2174,6 +2448,7 @@ class LuminaApp {
     }
 
     hideImportPostmanModal() {
+        this.cancelActiveImportJob();
         this.hideModal('import-postman-modal');
     }
 
@@ -2186,7 +2461,21 @@ class LuminaApp {
             return;
         }
 
-        // 파일 읽기
+        // 파일은 그대로 업로드하고, 여기서는 미리보기용 이름만 읽음
+        this.selectedPostmanFile = file;
+        const showPreview = (collectionName) => {
+            document.getElementById('import-postman-filename').textContent = file.name;
+            document.getElementById('import-postman-collectionname').textContent = collectionName;
+            document.getElementById('import-postman-preview').style.display = 'block';
+            document.getElementById('btn-confirm-import-postman').disabled = false;
+        };
+
+        // 큰 파일은 브라우저에서 파싱하지 않음 (서버가 스트리밍으로 처리)
+        if (file.size > POSTMAN_PREVIEW_MAX_BYTES) {
+            showPreview(`${file.name} (${(file.size / 1024 / 1024).toFixed(1)} MB)`);
+            return;
+        }
+
         const reader = new FileReader();
         reader.onload = (e) => {
             const content = e.target.result;
@@ -2204,19 +2493,13 @@ class LuminaApp {
                 } else {
                     collectionName = "JSON File";
                 }
-
-                this.selectedPostmanFile = jsonData;
             } catch (error) {
                 // JSON 파싱 실패 -> YAML 등 Raw 텍스트로 간주
-                this.selectedPostmanFile = content;
                 collectionName = "YAML / Raw Content";
             }
 
             // 미리보기 표시
-            document.getElementById('import-postman-filename').textContent = file.name;
-            document.getElementById('import-postman-collectionname').textContent = collectionName;
-            document.getElementById('import-postman-preview').style.display = 'block';
-            document.getElementById('btn-confirm-import-postman').disabled = false;
+            showPreview(collectionName);
         };
         reader.readAsText(file);
     }
@@ -2232,15 +2515,18 @@ class LuminaApp {
         btn.textContent = '가져오는 중...';
 
         try {
-            const response = await fetch(`${API_BASE}/import/postman`, {
+            // 파일을 multipart 로 그대로 업로드 (서버에서 스트리밍 파싱)
+            const formData = new FormData();
+            formData.append('file', this.selectedPostmanFile);
+            const result = await this.runImportJob('/import/postman', {
                 method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ data: this.selectedPostmanFile })
-            });
-
-            const result = await response.json();
+                body: formData
+            }, btn);
 
-            if (result.success) {
+            if (result.cancelled) {
+                btn.disabled = false;
+                btn.textContent = 'Import as New Project';
+            } else if (result.success) {
                 alert(`성공적으로 가져왔습니다! (${result.imported_count}개 요청)`);
                 this.hideImportPostmanModal();
 
@@ -2326,6 +2612,7 @@ class LuminaApp {
     }
 
     hideImportOpenApiModal() {
+        this.cancelActiveImportJob();
         this.hideModal('import-openapi-modal');
     }
 
@@ -2343,13 +2630,11 @@ class LuminaApp {
         btn.textContent = 'Importing...';
 
         try {
-            const response = await fetch(`${API_BASE}/import/openapi`, {
+            const result = await this.runImportJob('/import/openapi', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({ url, content })
-            });
-
-            const result = await response.json();
+            }, btn);
 
             if (result.success) {
                 // Sync projects and switch to the imported one
@@ -2364,7 +2649,7 @@ class LuminaApp {
                 this.hideImportOpenApiModal();
                 await this.loadProjects();
                 await this.loadFolderTree();
-            } else {
+            } else if (!result.cancelled) {
                 alert(`Import failed: ${result.error}`);
             }
         } catch (error) {
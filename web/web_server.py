@@ -2,32 +2,72 @@
 Lumina Web Server
 Flask 기반 REST API 서버 - Thread-safe with session isolation
 """
-from flask import Flask, render_template, jsonify, request, session
+from flask import Flask, Response, g, render_template, jsonify, request, session, stream_with_context
 from flask_cors import CORS
+import codecs
+import queue
 import threading
 import os
 import sys
 import uuid
 import json
+import tempfile
 import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict
+from typing import Dict, Any, Callable, Optional, Tuple
 
 # 상위 디렉토리를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.project_manager import ProjectManager
 from core.http_client import HttpClient
+from core.http_client_registry import HttpClientRegistry
+from core.import_jobs import ImportJob, ImportJobManager, ImportQueueFull
+from core.import_job_store import ImportJobStore
+from core.collection_runner import CollectionRunner
 from core.share_manager import ShareManager
-from models.request_model import RequestModel, RequestFolder, HttpMethod, BodyType, AuthType
+from core.session_store import SessionConflictError, SessionStore, create_session_store
+from core.history_store import HistoryStore
+from web.compression import init_compression
+from models.request_model import RequestModel, RequestFolder, RetryPolicy, HttpMethod, BodyType, AuthType
 from models.history_model import HistoryManager
+from models.response_model import ResponseModel
 
 
 class LuminaWebServer:
     """Lumina 웹 서버 - 세션별 프로젝트 격리"""
 
-    def __init__(self, host='127.0.0.1', port=15555):
+    MAX_RUNNER_WORKERS = 32  # 컬렉션 실행 시 최대 동시 요청 수
+    MAX_ASYNC_RUNNER_CONCURRENCY = 256  # async 모드 컬렉션 실행 시 최대 동시 요청 수
+    MAX_LOADTEST_RPS = 500  # 부하 테스트 최대 RPS
+    MAX_LOADTEST_DURATION_S = 30  # 부하 테스트 최대 실행 시간 (초) - 요청 안에서 실행되므로 프록시 타임아웃보다 짧게
+    MAX_LOADTEST_CONCURRENCY = 200  # 부하 테스트 최대 동시 요청 수
+    MAX_LARGE_RESPONSES_PER_SESSION = 3  # 세션별로 다운로드 가능하게 보관할 큰 응답 수
+    RESPONSE_PREVIEW_CHARS = 64 * 1024  # 큰 응답의 JSON 미리보기 글자 수
+    STREAM_BODY_CHARS = 1024 * 1024  # 스트리밍 실행 시 이벤트로 보낼 최대 본문 글자 수
+    STREAM_PROGRESS_INTERVAL_MS = 250  # 그 이후 진행 상황(progress) 이벤트 간격
+    STREAM_EVENT_POLL_S = 15  # 실행 스레드 이벤트 대기 시간 (지나면 keep-alive 를 보내고 스레드 생존 확인)
+    MAX_RESIDENT_SESSIONS = 200  # 메모리에 유지할 최대 세션 수 (초과분은 오래된 것부터 디스크로)
+    SESSION_IDLE_EVICT_S = 30 * 60  # 이 시간 동안 접근이 없으면 메모리에서 내림 (초)
+    SESSION_RETENTION_S = 30 * 24 * 60 * 60  # 세션 파일 보관 기간 (30일)
+    HISTORY_RETENTION_S = 30 * 24 * 60 * 60  # 실행 히스토리 보관 기간 (30일)
+    MAX_HISTORY_PAGE_SIZE = 500  # 히스토리 조회 한 페이지 최대 항목 수
+    MAX_REQUESTS_PAGE_SIZE = 500  # 요청 목록 한 페이지 최대 항목 수
+    REQUEST_FIELDS = frozenset(RequestModel().to_dict())  # fields= 로 선택 가능한 요청 필드
+    SHARED_POOL_HOSTS = 100  # 공유 연결 풀에서 풀을 유지할 호스트 수
+    SHARED_POOL_MAXSIZE = MAX_RUNNER_WORKERS  # 공유 연결 풀의 호스트별 최대 연결 수
+    MAX_HTTP_CLIENTS = 256  # 메모리에 유지할 최대 HTTP 클라이언트 수 (초과분은 오래 사용되지 않은 것부터 닫음)
+    HTTP_CLIENT_IDLE_EVICT_S = 15 * 60  # 이 시간 동안 사용되지 않은 HTTP 클라이언트는 닫음 (초)
+    MAX_IMPORT_WORKERS = 2  # 동시에 실행할 백그라운드 가져오기 작업 수
+    MAX_IMPORT_JOBS_PER_SESSION = 4  # 세션별로 대기/실행 중일 수 있는 가져오기 작업 수
+    IMPORT_JOB_RETENTION_S = 60 * 60  # 끝난 가져오기 작업을 조회할 수 있는 시간 (초)
+
+    def __init__(self, host='127.0.0.1', port=15555, session_store: Optional[SessionStore] = None,
+                 start_background_tasks: bool = True, history_store: Optional[HistoryStore] = None):
         self.host = host
         self.port = port
         self.app = Flask(__name__,
@@ -42,20 +82,23 @@ class LuminaWebServer:
         ]
         CORS(self.app, supports_credentials=True, origins=allowed_origins)
 
+        # 큰 JSON / 본문 응답은 gzip (brotli 설치 시 br) 으로 압축
+        init_compression(self.app)
+
         # 데이터 디렉토리 설정
         self.data_dir = Path('.lumina_data')
         self.data_dir.mkdir(exist_ok=True)
 
+        # 세션 저장소 (기본: 세션별 JSON 파일, LUMINA_SESSION_STORE=sqlite 이면 멀티 프로세스용 SQLite)
+        self.session_store = session_store or create_session_store(
+            os.environ.get('LUMINA_SESSION_STORE'), self.data_dir
+        )
+
+        # 실행 히스토리 저장소 (SQLite, 워커 간 공유)
+        self.history_store = history_store or HistoryStore(self.data_dir / 'history.db')
+
         # 세션 설정 (보안 강화)
-        secret_file = self.data_dir / '.secret_key'
-        if secret_file.exists():
-            with open(secret_file, 'rb') as f:
-                self.app.config['SECRET_KEY'] = f.read()
-        else:
-            secret_key = os.urandom(24)
-            self.app.config['SECRET_KEY'] = secret_key
-            with open(secret_file, 'wb') as f:
-                f.write(secret_key)
+        self.app.config['SECRET_KEY'] = self._load_or_create_secret_key()
         
         # Session settings (same-origin; cookies allowed on localhost)
         self.app.config['SESSION_TYPE'] = 'filesystem'
@@ -73,17 +116,69 @@ class LuminaWebServer:
         # 세션별 활성 프로젝트 ID
         self.active_projects: Dict[str, str] = {}
 
-        # 세션별 히스토리 매니저 저장소
+        # 세션별 히스토리 매니저 (항목은 history_store 에 기록됨)
         # 구조: {session_id: {project_id: HistoryManager}}
         self.histories: Dict[str, Dict[str, HistoryManager]] = {}
 
-        # 세션별 HTTP 클라이언트 저장소 (쿠키/세션 유지용)
-        # 구조: {session_id: {project_id: HttpClient}}
-        self.http_clients: Dict[str, Dict[str, HttpClient]] = {}
+        # 세션/프로젝트별 HTTP 클라이언트 저장소 (쿠키/세션 유지용)
+        # 키: (session_id, project_id) - 개수 제한(LRU)과 유휴 시간 기준으로 닫힘
+        self.http_clients = HttpClientRegistry(self.MAX_HTTP_CLIENTS, self.HTTP_CLIENT_IDLE_EVICT_S)
+
+        # 백그라운드 가져오기 작업 (?background=1)
+        # 멀티 프로세스 세션 저장소를 쓰면 작업 상태도 SQLite 로 공유 (어느 워커에서든 조회/취소)
+        if self.session_store.supports_multiprocess:
+            self.import_job_store = ImportJobStore(self.data_dir / 'import_jobs.db')
+        else:
+            self.import_job_store = None
+        self.import_jobs = ImportJobManager(
+            self.MAX_IMPORT_WORKERS, self.MAX_IMPORT_JOBS_PER_SESSION, self.IMPORT_JOB_RETENTION_S,
+            store=self.import_job_store
+        )
+
+        # 연결 풀 (기본: 모든 세션이 어댑터 하나를 공유, 쿠키는 HttpClient 별로 분리)
+        # LUMINA_HTTP_POOL=session 이면 HttpClient 마다 별도 연결 풀
+        if os.environ.get('LUMINA_HTTP_POOL', 'shared') == 'session':
+            self.shared_http_adapter = None
+        else:
+            self.shared_http_adapter = HttpClient.create_adapter(
+                pool_connections=self.SHARED_POOL_HOSTS, pool_maxsize=self.SHARED_POOL_MAXSIZE
+            )
 
         # 세션 메타데이터 (마지막 접근 시간)
         self.session_metadata: Dict[str, Dict] = {}
 
+        # 프로젝트 추가/삭제, 활성 프로젝트 전환 등 세션 단위로 변경된 세션 ID
+        # (프로젝트 내용 변경은 ProjectManager.is_dirty 로 추적)
+        self.dirty_sessions = set()
+
+        # 세션 파일 입출력 잠금 (세션별) - 로드/저장은 sessions_lock 밖에서 수행
+        # 잠금 순서: 입출력 잠금 -> sessions_lock (반대 순서로 잡지 않음)
+        self._io_locks: Dict[str, threading.RLock] = {}
+
+        # 메모리에 올라와 있는 세션 (LRU 순서, 마지막이 가장 최근)
+        self.resident_sessions: OrderedDict = OrderedDict()
+
+        # 메모리에서 내리지 않을 세션 (여러 세션이 공유하는 세션 등)
+        self.pinned_sessions = set()
+
+        # 요청을 처리 중인 세션 (세션 ID -> 처리 중인 요청 수) - 처리가 끝날 때까지 내리지 않음
+        self._sessions_in_use: Dict[str, int] = {}
+
+        # 세션별로 마지막으로 로드/저장한 저장소 revision 과 저장소에 있는 프로젝트 ID
+        self.session_revisions: Dict[str, Optional[int]] = {}
+        self._stored_projects: Dict[str, set] = {}
+
+        # 세션별로 삭제했지만 아직 저장소에 반영하지 않은 프로젝트 ID
+        self._removed_projects: Dict[str, set] = {}
+
+        # 프로젝트별 마지막 직렬화 결과 캐시: ProjectManager -> (version, dict)
+        self._project_snapshots = weakref.WeakKeyDictionary()
+        self._snapshots_lock = threading.Lock()
+
+        # 세션별 큰 응답 (임시 파일로 옮겨진 본문) 보관소 - 오래된 것부터 해제
+        # 구조: {session_id: OrderedDict[response_id, ResponseModel]}
+        self.large_responses: Dict[str, OrderedDict] = {}
+
         # 레거시 지원: 데스크톱 앱과의 공유를 위한 기본 프로젝트 (옵션)
         self.project_manager = None  # Will be set by desktop app if needed
         self.http_client = None
@@ -99,16 +194,78 @@ class LuminaWebServer:
         # 자동 저장/정리 타이머
         self.auto_save_timer = None
         self.cleanup_timer = None
+        self._background_lock = threading.Lock()
+        self._background_started = False
+        self._cleanup_lock_file = None
 
-        # 기존 세션 데이터 로드
-        self.load_all_sessions()
+        # 기존 세션 데이터는 첫 접근 시 로드 (ensure_session_loaded)
 
         # 라우트 설정
         self.setup_routes()
 
         # 자동 저장 및 정리 시작
+        # (WSGI 워커에서는 fork 이후 첫 요청에서 시작 - web.wsgi.create_app 참고)
+        if start_background_tasks:
+            self.start_background_tasks()
+
+    def _load_or_create_secret_key(self) -> bytes:
+        """
+        세션 쿠키 서명 키 로드 (없으면 생성)
+
+        여러 워커가 동시에 시작해도 모두 같은 키를 쓰도록,
+        임시 파일에 완전히 쓴 뒤 hard link 로 원자적으로 생성한다.
+        """
+        secret_file = self.data_dir / '.secret_key'
+        if not secret_file.exists():
+            temp_file = self.data_dir / f'.secret_key.{os.getpid()}.tmp'
+            with open(temp_file, 'wb') as f:
+                f.write(os.urandom(24))
+            try:
+                os.link(temp_file, secret_file)
+            except FileExistsError:
+                pass  # 다른 워커가 먼저 생성함
+            finally:
+                temp_file.unlink()
+
+        with open(secret_file, 'rb') as f:
+            return f.read()
+
+    def start_background_tasks(self) -> bool:
+        """
+        자동 저장/세션 정리 스레드 시작 (프로세스당 한 번)
+
+        자동 저장과 유휴 세션 내리기는 프로세스 메모리를 다루므로 워커마다 실행하고,
+        저장소의 오래된 세션 삭제는 잠금 파일을 잡은 한 프로세스에서만 실행한다.
+
+        Returns:
+            이번 호출에서 시작했는지 여부
+        """
+        with self._background_lock:
+            if self._background_started:
+                return False
+            self._background_started = True
+
         self.start_auto_save()
-        self.start_cleanup_timer()
+        if self._acquire_cleanup_lock():
+            self.start_cleanup_timer()
+        return True
+
+    def _acquire_cleanup_lock(self) -> bool:
+        """세션 정리 담당 프로세스 잠금 (잠금 파일을 프로세스 수명 동안 유지)"""
+        try:
+            import fcntl
+        except ImportError:
+            # fcntl 이 없는 환경(Windows)은 단일 프로세스 서버만 사용
+            return True
+
+        lock_file = open(self.data_dir / '.cleanup.lock', 'a')
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._cleanup_lock_file = lock_file
+        return True
 
     def get_session_project_manager(self) -> ProjectManager:
         """현재 세션의 활성 프로젝트 매니저 가져오기 (없으면 생성)"""
@@ -121,27 +278,28 @@ class LuminaWebServer:
             session['session_id'] = str(uuid.uuid4())
 
         session_id = session['session_id']
+        self.use_request_session(session_id)
 
-        # 세션 접근 시간 업데이트
-        self.update_session_access_time(session_id)
-
-        with self.sessions_lock:
-            # 세션 초기화
-            if session_id not in self.sessions:
-                self.sessions[session_id] = {}
+        # 세션 로드부터 조회까지 세션이 내려가지 않도록 한 구간에서 수행
+        with self.resident_session(session_id):
+            with self.sessions_lock:
+                # 세션 초기화 (저장소에도 없는 새 세션)
+                if session_id not in self.sessions:
+                    self.sessions[session_id] = {}
 
-            # 활성 프로젝트 ID 가져오기
-            if session_id not in self.active_projects or self.active_projects[session_id] not in self.sessions[session_id]:
-                # 기본 프로젝트 생성
-                default_project_id = str(uuid.uuid4())
-                pm = ProjectManager()
-                pm.project_name = "Default Project"
-                pm.create_sample_project()
-                self.sessions[session_id][default_project_id] = pm
-                self.active_projects[session_id] = default_project_id
+                # 활성 프로젝트 ID 가져오기
+                if session_id not in self.active_projects or self.active_projects[session_id] not in self.sessions[session_id]:
+                    # 기본 프로젝트 생성
+                    default_project_id = str(uuid.uuid4())
+                    pm = ProjectManager()
+                    pm.project_name = "Default Project"
+                    pm.create_sample_project()
+                    self.sessions[session_id][default_project_id] = pm
+                    self.active_projects[session_id] = default_project_id
+                    self.dirty_sessions.add(session_id)
 
-            active_project_id = self.active_projects[session_id]
-            return self.sessions[session_id][active_project_id]
+                active_project_id = self.active_projects[session_id]
+                return self.sessions[session_id][active_project_id]
 
     def get_session_http_client(self) -> HttpClient:
         """현재 세션의 HTTP 클라이언트 가져오기"""
@@ -154,24 +312,21 @@ class LuminaWebServer:
         if 'session_id' not in session:
             session['session_id'] = str(uuid.uuid4())
         session_id = session['session_id']
-        
-        with self.sessions_lock:
-            # 세션 초기화
-            if session_id not in self.http_clients:
-                self.http_clients[session_id] = {}
 
+        # 세션 입출력 잠금을 잡으므로 sessions_lock 밖에서 호출
+        pm = self.get_session_project_manager()
+        with self.sessions_lock:
             # 활성 프로젝트 ID 가져오기
-            pm = self.get_session_project_manager()
             # active_projects[session_id] 는 get_session_project_manager 호출 시 설정됨
             active_project_id = self.active_projects.get(session_id)
             
             # 프로젝트별 HTTP 클라이언트 (없거나 환경 매니저가 변경되었을 수 있으므로 확인/생성)
             # 노트: EnvironmentManager가 변경되면 HttpClient도 새로 만드는게 좋겠지만, 
             # 여기서는 ProjectManager 인스턴스가 유지되므로 EnvironmentManager도 유지된다고 가정.
-            if active_project_id not in self.http_clients[session_id]:
-                self.http_clients[session_id][active_project_id] = HttpClient(pm.env_manager)
-            
-            return self.http_clients[session_id][active_project_id]
+            return self.http_clients.get(
+                (session_id, active_project_id),
+                lambda: HttpClient(pm.env_manager, adapter=self.shared_http_adapter)
+            )
 
     def get_session_history_manager(self) -> HistoryManager:
         """현재 세션의 활성 프로젝트 히스토리 매니저 가져오기"""
@@ -185,147 +340,474 @@ class LuminaWebServer:
 
         session_id = session['session_id']
 
+        # 활성 프로젝트 확인 (없으면 기본 프로젝트 생성됨, sessions_lock 밖에서 호출)
+        self.get_session_project_manager()
+
         with self.sessions_lock:
             # 세션 초기화
             if session_id not in self.histories:
                 self.histories[session_id] = {}
 
-            # 활성 프로젝트 ID 가져오기 (없으면 기본 프로젝트 생성됨)
-            if session_id not in self.active_projects:
-                self.get_session_project_manager()
-
             active_project_id = self.active_projects[session_id]
 
             # 프로젝트별 히스토리 매니저 생성
             if active_project_id not in self.histories[session_id]:
-                self.histories[session_id][active_project_id] = HistoryManager()
+                self.histories[session_id][active_project_id] = HistoryManager(
+                    store=self.history_store, session_id=session_id, project_id=active_project_id
+                )
 
             return self.histories[session_id][active_project_id]
 
-    def save_session(self, session_id: str):
-        """세션 데이터를 파일로 저장"""
+    def build_execute_result(self, response: ResponseModel) -> Dict[str, Any]:
+        """
+        실행 API 응답 데이터 생성
+
+        임시 파일로 옮겨진 큰 본문은 미리보기만 담고, 전체 본문은
+        body_url 로 내려받을 수 있게 등록한다.
+        """
+        result = {
+            'id': response.id,
+            'status_code': response.status_code,
+            'status_text': response.status_text,
+            'headers': response.headers,
+            'body': response.body,
+            'body_truncated': False,
+            'elapsed_ms': response.elapsed_ms,
+            'timings': response.timings,
+            'attempts': response.attempts,
+            'size_bytes': response.size_bytes,
+            'error': response.error,
+            'content_type': response.content_type
+        }
+
+        if response.is_spilled():
+            # 전체 본문은 별도 엔드포인트로 스트리밍
+            self.register_large_response(response)
+            result['body'] = response.get_body_preview(self.RESPONSE_PREVIEW_CHARS)
+            result['body_truncated'] = True
+            result['body_url'] = f'/api/responses/{response.id}/body'
+
+        return result
+
+    def register_large_response(self, response: ResponseModel):
+        """임시 파일로 옮겨진 응답을 본문 다운로드용으로 보관 (세션별 개수 제한)"""
+        session_id = session.get('session_id', '')
+        with self.sessions_lock:
+            responses = self.large_responses.setdefault(session_id, OrderedDict())
+            responses[response.id] = response
+            while len(responses) > self.MAX_LARGE_RESPONSES_PER_SESSION:
+                _, evicted = responses.popitem(last=False)
+                # 히스토리에서 보일 미리보기만 남기고 임시 파일 삭제
+                evicted.discard_body(keep_preview_chars=1000)
+
+    def get_large_response(self, response_id: str):
+        """보관 중인 큰 응답 가져오기 (현재 세션 것만)"""
+        session_id = session.get('session_id', '')
+        with self.sessions_lock:
+            return self.large_responses.get(session_id, {}).get(response_id)
+
+    def release_large_responses(self, session_id: str):
+        """세션의 큰 응답 임시 파일 모두 삭제"""
+        with self.sessions_lock:
+            for response in self.large_responses.pop(session_id, {}).values():
+                response.discard_body(keep_preview_chars=1000)
+
+    def mark_session_dirty(self, session_id: str):
+        """세션 구조(프로젝트 목록, 활성 프로젝트)가 변경되었음을 표시"""
+        with self.sessions_lock:
+            self.dirty_sessions.add(session_id)
+
+    def save_session(self, session_id: str, force: bool = False, raise_conflict: bool = False) -> bool:
+        """
+        세션 데이터를 저장소에 저장 (변경된 경우에만)
+
+        전역 잠금은 저장할 대상을 모으는 동안만 잡고,
+        직렬화와 저장소 쓰기는 잠금 밖에서 수행한다.
+        다른 프로세스가 먼저 저장한 세션이면 덮어쓰지 않고 메모리의 세션을 버린다
+        (다음 접근 시 저장소에서 다시 로드).
+
+        Args:
+            session_id: 세션 ID
+            force: 변경 여부와 관계없이 저장
+            raise_conflict: 충돌 시 SessionConflictError 를 다시 던질지 여부
+
+        Returns:
+            저장했는지 여부
+        """
         with self.sessions_lock:
             if session_id not in self.sessions:
-                return
+                return False
+            io_lock = self._get_io_lock(session_id)
 
-            session_file = self.data_dir / f'session_{session_id}.json'
+        with io_lock:
+            with self.sessions_lock:
+                if session_id not in self.sessions:
+                    return False
+                projects = list(self.sessions[session_id].items())
+                active_project_id = self.active_projects.get(session_id)
+                last_accessed = self.session_metadata.get(session_id, {}).get('last_accessed', time.time())
+                session_dirty = session_id in self.dirty_sessions
+                self.dirty_sessions.discard(session_id)
+                known_revision = self.session_revisions.get(session_id)
+                stored_projects = self._stored_projects.get(session_id)
+                removed = set(self._removed_projects.get(session_id, ()))
+
+            if not (force or session_dirty or any(pm.is_dirty() for _, pm in projects)):
+                return False
+
+            # 변경되었거나 아직 저장소에 없는 프로젝트만 다시 씀
+            if force or stored_projects is None:
+                changed = None
+            else:
+                changed = {pid for pid, pm in projects if pm.is_dirty() or pid not in stored_projects}
 
             try:
-                # 세션 데이터 직렬화
-                session_data = {
-                    'session_id': session_id,
-                    'last_accessed': time.time(),
-                    'active_project_id': self.active_projects.get(session_id),
-                    'projects': {}
-                }
-
-                # 모든 프로젝트 저장
-                for project_id, pm in self.sessions[session_id].items():
-                    session_data['projects'][project_id] = pm.to_dict()
+                # 모든 프로젝트 직렬화 (변경되지 않은 프로젝트는 캐시 사용)
+                project_data = {}
+                versions = []
+                for project_id, pm in projects:
+                    version, data = self._get_project_snapshot(pm)
+                    project_data[project_id] = data
+                    versions.append((pm, version))
+
+                # 다른 프로세스가 그 사이에 저장했으면 저장소가 SessionConflictError
+                revision = self.session_store.save_session(
+                    session_id, active_project_id, last_accessed, project_data, changed,
+                    removed=removed, expected_revision=known_revision
+                )
 
-                # 파일로 저장
-                with open(session_file, 'w', encoding='utf-8') as f:
-                    json.dump(session_data, f, indent=2, ensure_ascii=False)
+                for pm, version in versions:
+                    pm.mark_saved(version)
+                with self.sessions_lock:
+                    self.session_revisions[session_id] = revision
+                    self._stored_projects[session_id] = set(project_data)
+                    pending = self._removed_projects.get(session_id)
+                    if pending is not None:
+                        pending.difference_update(removed)
+                        if not pending:
+                            del self._removed_projects[session_id]
+                return True
+
+            except SessionConflictError as e:
+                print(f"Discarding stale session {session_id}: {e}")
+                with self.sessions_lock:
+                    self._discard_session(session_id)
+                if raise_conflict:
+                    raise
+                return False
 
             except Exception as e:
                 print(f"Failed to save session {session_id}: {e}")
+                # 다음 자동 저장에서 다시 시도
+                self.mark_session_dirty(session_id)
+                return False
+
+    def _get_project_snapshot(self, pm: ProjectManager):
+        """프로젝트 직렬화 결과 (버전이 같으면 캐시 재사용)"""
+        with self._snapshots_lock:
+            cached = self._project_snapshots.get(pm)
+        if cached is not None and cached[0] == pm.version:
+            return cached
+
+        snapshot = pm.snapshot()
+        with self._snapshots_lock:
+            self._project_snapshots[pm] = snapshot
+        return snapshot
+
+    def _get_io_lock(self, session_id: str) -> threading.RLock:
+        """세션 파일 입출력 잠금 가져오기 (없으면 생성)"""
+        with self.sessions_lock:
+            return self._io_locks.setdefault(session_id, threading.RLock())
 
     def load_session(self, session_id: str) -> bool:
-        """세션 데이터를 파일에서 로드"""
-        session_file = self.data_dir / f'session_{session_id}.json'
-
-        if not session_file.exists():
-            return False
+        """세션 데이터를 저장소에서 로드 (이미 메모리에 있으면 그대로 사용)"""
+        with self._get_io_lock(session_id):
+            with self.sessions_lock:
+                if session_id in self.sessions:
+                    return True
 
-        try:
-            with open(session_file, 'r', encoding='utf-8') as f:
-                session_data = json.load(f)
+            try:
+                # 저장소 읽기와 프로젝트 복원은 전역 잠금 밖에서 수행
+                session_data = self.session_store.load_session(session_id)
+                if session_data is None:
+                    return False
+
+                projects = {
+                    project_id: ProjectManager.from_dict(project_data)
+                    for project_id, project_data in session_data['projects'].items()
+                }
+            except Exception as e:
+                print(f"Failed to load session {session_id}: {e}")
+                return False
 
             with self.sessions_lock:
                 # 세션 초기화
-                if session_id not in self.sessions:
-                    self.sessions[session_id] = {}
-
-                # 프로젝트 복원
-                for project_id, project_data in session_data['projects'].items():
-                    pm = ProjectManager.from_dict(project_data)
-                    self.sessions[session_id][project_id] = pm
+                self.sessions[session_id] = projects
 
                 # 활성 프로젝트 설정
                 active_id = session_data.get('active_project_id')
-                if active_id and active_id in self.sessions[session_id]:
+                if active_id and active_id in projects:
                     self.active_projects[session_id] = active_id
 
                 # 메타데이터 저장
                 self.session_metadata[session_id] = {
                     'last_accessed': session_data.get('last_accessed', time.time())
                 }
+                self.resident_sessions[session_id] = None
+                self.session_revisions[session_id] = session_data.get('revision')
+                self._stored_projects[session_id] = set(projects)
 
             return True
-        except Exception as e:
-            print(f"Failed to load session {session_id}: {e}")
-            return False
 
-    def load_all_sessions(self):
-        """모든 저장된 세션 데이터 로드"""
-        if not self.data_dir.exists():
+    def refresh_session_if_stale(self, session_id: str):
+        """
+        다른 프로세스가 세션을 저장했으면 메모리의 세션을 버리고 다시 로드
+
+        멀티 프로세스 저장소에서만 동작하며, 저장되지 않은 변경이 있으면 유지한다.
+        히스토리는 프로세스별로 유지되고 HTTP 클라이언트(쿠키)는 새로 만든다.
+        """
+        if not self.session_store.supports_multiprocess:
+            return
+
+        with self.sessions_lock:
+            if session_id not in self.sessions:
+                return
+            known_revision = self.session_revisions.get(session_id)
+
+        if known_revision is not None and self.session_store.get_revision(session_id) == known_revision:
             return
 
-        session_files = self.data_dir.glob('session_*.json')
+        with self.sessions_lock:
+            projects = self.sessions.get(session_id, {})
+            if session_id in self.dirty_sessions or any(pm.is_dirty() for pm in projects.values()):
+                return
+            self._discard_session(session_id)
+
+        self.load_session(session_id)
+
+    def _discard_session(self, session_id: str):
+        """
+        저장소와 어긋난 세션을 메모리에서 버림 (sessions_lock 을 잡은 상태에서 호출)
+
+        히스토리는 프로세스별로 유지하며, 다음 접근 시 저장소에서 다시 로드된다.
+        """
+        self.sessions.pop(session_id, None)
+        self.active_projects.pop(session_id, None)
+        self.session_revisions.pop(session_id, None)
+        self._stored_projects.pop(session_id, None)
+        self._removed_projects.pop(session_id, None)
+        self.dirty_sessions.discard(session_id)
+        self.http_clients.remove_session(session_id)
+
+    def ensure_session_loaded(self, session_id: str) -> bool:
+        """
+        세션이 메모리에 없으면 디스크에서 로드
+
+        Returns:
+            세션이 메모리에 있는지 여부 (새 세션이면 False)
+        """
+        with self.sessions_lock:
+            if session_id in self.sessions:
+                return True
+        return self.load_session(session_id)
+
+    def touch_session(self, session_id: str):
+        """세션을 (필요하면 로드하고) 최근 사용으로 표시"""
+        with self.sessions_lock:
+            resident = session_id in self.sessions
+        if resident:
+            self.refresh_session_if_stale(session_id)
+        else:
+            self.load_session(session_id)
+        with self.sessions_lock:
+            self.update_session_access_time(session_id)
+            self.resident_sessions[session_id] = None
+            self.resident_sessions.move_to_end(session_id)
+
+    def use_request_session(self, session_id: str):
+        """현재 요청이 끝날 때까지 세션을 메모리에서 내리지 않도록 표시 (요청당 한 번)"""
+        if g.get('session_in_use') is not None:
+            return
+        with self.sessions_lock:
+            self._sessions_in_use[session_id] = self._sessions_in_use.get(session_id, 0) + 1
+        g.session_in_use = session_id
+
+    def release_request_session(self):
+        """use_request_session 표시 해제 (요청 종료 시)"""
+        session_id = g.pop('session_in_use', None)
+        if session_id is None:
+            return
+        with self.sessions_lock:
+            remaining = self._sessions_in_use.get(session_id, 0) - 1
+            if remaining > 0:
+                self._sessions_in_use[session_id] = remaining
+            else:
+                self._sessions_in_use.pop(session_id, None)
+
+    def _is_evictable(self, session_id: str) -> bool:
+        """세션을 메모리에서 내릴 수 있는지 (sessions_lock 을 잡은 상태에서 호출)"""
+        return session_id not in self.pinned_sessions and session_id not in self._sessions_in_use
+
+    @contextmanager
+    def resident_session(self, session_id: str):
+        """
+        세션을 (필요하면 로드하여) 메모리에 올려 두는 구간
+
+        구간 동안 세션 입출력 잠금을 잡으므로 그 사이에 세션이 내려가거나 다시 로드되지 않는다.
+        구간 안에서 세션이 메모리에 없으면 저장소에도 없는 새 세션이다.
+
+        Raises:
+            RuntimeError: 저장소에 있는 세션을 로드하지 못한 경우 (새 세션으로 덮어쓰지 않도록)
+        """
+        with self._get_io_lock(session_id):
+            self.touch_session(session_id)
+            with self.sessions_lock:
+                resident = session_id in self.sessions
+            if not resident and self.session_store.has_session(session_id):
+                raise RuntimeError(f"Failed to load session {session_id}")
+            yield
+
+    def evict_idle_sessions(self) -> int:
+        """
+        오래 사용되지 않은 세션과 최대 개수를 넘는 세션을 디스크로 내림
+
+        변경 사항을 저장한 뒤 메모리에서 제거하며, 다음 접근 시 다시 로드된다.
+        히스토리와 HTTP 클라이언트(쿠키)는 디스크에 저장되지 않으므로 함께 사라진다.
+
+        Returns:
+            내린 세션 수
+        """
+        cutoff_time = time.time() - self.SESSION_IDLE_EVICT_S
+
+        with self.sessions_lock:
+            # 라우트에서 직접 만든 세션도 LRU 에 포함
+            for session_id in self.sessions:
+                if session_id not in self.resident_sessions:
+                    self.resident_sessions[session_id] = None
+                    self.session_metadata.setdefault(session_id, {}).setdefault('last_accessed', time.time())
+
+            candidates = [
+                session_id for session_id in self.resident_sessions
+                if self._is_evictable(session_id)
+                and self.session_metadata.get(session_id, {}).get('last_accessed', 0) < cutoff_time
+            ]
+            # 최대 개수를 넘으면 가장 오래 사용하지 않은 세션부터 추가
+            overflow = len(self.resident_sessions) - len(candidates) - self.MAX_RESIDENT_SESSIONS
+            if overflow > 0:
+                for session_id in self.resident_sessions:
+                    if overflow <= 0:
+                        break
+                    if session_id not in candidates and self._is_evictable(session_id):
+                        candidates.append(session_id)
+                        overflow -= 1
+
+        evicted = 0
+        for session_id in candidates:
+            # 저장부터 제거까지 입출력 잠금을 잡아 resident_session() 구간과 겹치지 않도록 함
+            with self._get_io_lock(session_id):
+                with self.sessions_lock:
+                    last_accessed = self.session_metadata.get(session_id, {}).get('last_accessed', 0)
+
+                self.save_session(session_id, force=not self.session_store.has_session(session_id))
+
+                with self.sessions_lock:
+                    projects = self.sessions.get(session_id, {})
+                    # 저장 중에 다시 사용되었거나 변경되었으면 유지
+                    if (not self._is_evictable(session_id)
+                            or self.session_metadata.get(session_id, {}).get('last_accessed', 0) != last_accessed
+                            or session_id in self.dirty_sessions
+                            or any(pm.is_dirty() for pm in projects.values())):
+                        continue
+                    self._drop_session(session_id)
+
+            # 마지막 접근 시간 기록 (보관 기간 판단용)
+            try:
+                self.session_store.touch(session_id, last_accessed)
+            except Exception as e:
+                print(f"Failed to record access time for session {session_id}: {e}")
+            evicted += 1
+
+        return evicted
+
+    def _drop_session(self, session_id: str):
+        """세션을 메모리에서 제거 (sessions_lock 을 잡은 상태에서 호출)"""
+        self.sessions.pop(session_id, None)
+        self.active_projects.pop(session_id, None)
+        self.histories.pop(session_id, None)
+        self.session_metadata.pop(session_id, None)
+        self.resident_sessions.pop(session_id, None)
+        self.session_revisions.pop(session_id, None)
+        self._stored_projects.pop(session_id, None)
+        self._removed_projects.pop(session_id, None)
+        self.dirty_sessions.discard(session_id)
+        self.release_large_responses(session_id)
+        self.http_clients.remove_session(session_id)
+
+    def load_all_sessions(self):
+        """
+        모든 저장된 세션 데이터 로드
+
+        서버 시작 시에는 호출하지 않으며 (세션은 첫 접근 시 로드됨),
+        모든 세션을 미리 올려야 하는 관리 작업에서만 사용한다.
+        """
         loaded_count = 0
 
-        for session_file in session_files:
-            session_id = session_file.stem.replace('session_', '')
+        for session_id, _ in self.session_store.list_sessions():
             if self.load_session(session_id):
                 loaded_count += 1
 
         if loaded_count > 0:
             print(f"✨ Loaded {loaded_count} session(s) from disk")
 
-    def save_all_sessions(self):
-        """모든 세션 데이터 저장"""
+    def save_all_sessions(self) -> int:
+        """
+        변경된 세션 데이터만 저장
+
+        Returns:
+            저장한 세션 수
+        """
         with self.sessions_lock:
-            for session_id in list(self.sessions.keys()):
-                self.save_session(session_id)
+            session_ids = list(self.sessions.keys())
+
+        return sum(1 for session_id in session_ids if self.save_session(session_id))
 
     def cleanup_old_sessions(self):
-        """30일 이상 미사용 세션 정리"""
-        cutoff_time = time.time() - (30 * 24 * 60 * 60)  # 30일
+        """30일 이상 미사용 세션 정리 (메모리에 없는 세션은 저장소의 마지막 접근 시간 기준)"""
+        cutoff_time = time.time() - self.SESSION_RETENTION_S
 
         with self.sessions_lock:
-            sessions_to_remove = []
+            sessions_to_remove = [
+                session_id for session_id in self.sessions
+                if self.session_metadata.get(session_id, {}).get('last_accessed', 0) < cutoff_time
+            ]
+            resident = set(self.sessions)
 
-            for session_id, metadata in self.session_metadata.items():
-                last_accessed = metadata.get('last_accessed', 0)
-                if last_accessed < cutoff_time:
-                    sessions_to_remove.append(session_id)
+        for session_id, last_accessed in self.session_store.list_sessions():
+            if session_id not in resident and last_accessed < cutoff_time:
+                sessions_to_remove.append(session_id)
 
+        with self.sessions_lock:
             for session_id in sessions_to_remove:
                 # 메모리에서 제거
-                if session_id in self.sessions:
-                    del self.sessions[session_id]
-                if session_id in self.active_projects:
-                    del self.active_projects[session_id]
-                if session_id in self.histories:
-                    del self.histories[session_id]
-                if session_id in self.session_metadata:
-                    del self.session_metadata[session_id]
-                if session_id in self.http_clients:
-                    # 세션 닫기
-                    for client in self.http_clients[session_id].values():
-                        try:
-                            client.close()
-                        except:
-                            pass
-                    del self.http_clients[session_id]
+                self._drop_session(session_id)
+                self._io_locks.pop(session_id, None)
 
-                # 파일 삭제
-                session_file = self.data_dir / f'session_{session_id}.json'
-                if session_file.exists():
-                    session_file.unlink()
+        # 저장소에서 삭제
+        for session_id in sessions_to_remove:
+            try:
+                self.session_store.delete_session(session_id)
+                self.history_store.clear(session_id)
+            except Exception as e:
+                print(f"Failed to delete session {session_id}: {e}")
 
-            if sessions_to_remove:
-                print(f"🧹 Cleaned up {len(sessions_to_remove)} old session(s)")
+        # 보관 기간이 지난 히스토리 삭제
+        try:
+            self.history_store.prune(time.time() - self.HISTORY_RETENTION_S)
+        except Exception as e:
+            print(f"Failed to prune history: {e}")
+
+        if sessions_to_remove:
+            print(f"🧹 Cleaned up {len(sessions_to_remove)} old session(s)")
 
     def start_auto_save(self):
         """자동 저장 타이머 시작 (30초마다)"""
@@ -333,6 +815,9 @@ class LuminaWebServer:
             while self.is_running:
                 time.sleep(30)
                 self.save_all_sessions()
+                self.evict_idle_sessions()
+                self.http_clients.evict_idle()
+                self.import_jobs.prune()
 
         self.auto_save_timer = threading.Thread(target=auto_save, daemon=True)
         self.auto_save_timer.start()
@@ -347,6 +832,196 @@ class LuminaWebServer:
         self.cleanup_timer = threading.Thread(target=cleanup, daemon=True)
         self.cleanup_timer.start()
 
+    def parse_history_filters(self, default_limit: int) -> Dict[str, Any]:
+        """
+        히스토리 조회 쿼리 파라미터 파싱
+
+        status 는 '404' 또는 '4xx', since/until 은 epoch 초 또는 ISO 8601 시각.
+
+        Returns:
+            HistoryManager.query 키워드 인자 (request_id 제외)
+
+        Raises:
+            ValueError: 잘못된 값
+        """
+        def parse_time(name: str) -> Optional[float]:
+            value = request.args.get(name)
+            if not value:
+                return None
+            try:
+                return float(value)
+            except ValueError:
+                pass
+            try:
+                return datetime.fromisoformat(value).timestamp()
+            except ValueError:
+                raise ValueError(f"Invalid '{name}': expected epoch seconds or ISO 8601 time")
+
+        status_range = None
+        status = request.args.get('status', '').strip().lower()
+        if status:
+            if len(status) == 3 and status[0].isdigit() and status[1:] == 'xx':
+                status_range = (int(status[0]) * 100, int(status[0]) * 100 + 99)
+            elif status.isdigit():
+                status_range = (int(status), int(status))
+            else:
+                raise ValueError("Invalid 'status': expected a code like 404 or a class like 4xx")
+
+        limit = request.args.get('limit', default_limit, type=int)
+        offset = request.args.get('offset', 0, type=int)
+
+        return {
+            'status_range': status_range,
+            'method': request.args.get('method') or None,
+            'since': parse_time('since'),
+            'until': parse_time('until'),
+            'limit': min(max(limit, 1), self.MAX_HISTORY_PAGE_SIZE),
+            'offset': max(offset, 0),
+        }
+
+    def run_import(self, kind: str, task: Callable[[ImportJob], Dict[str, Any]],
+                   cleanup: Optional[Callable[[], None]] = None):
+        """
+        가져오기 실행
+
+        ?background=1 이면 작업 큐에 넣고 바로 202 와 작업 정보를 반환한다
+        (GET /api/import/jobs/<job_id> 로 진행 상황 조회).
+        아니면 요청 안에서 실행하고 결과를 반환한다.
+
+        Args:
+            kind: 가져오기 종류 ('insomnia', 'postman', 'openapi')
+            task: 변환과 프로젝트 반영을 수행하고 응답 데이터를 반환하는 함수.
+                  요청 컨텍스트 밖(작업 스레드)에서도 실행되므로 필요한 입력은 미리 읽어 둬야 한다.
+            cleanup: 작업이 끝나면 (실패/취소 포함) 호출할 정리 함수 (임시 파일 삭제 등)
+        """
+        session_id = session.get('session_id')
+        if request.args.get('background') == '1':
+            def run_and_save(job: ImportJob) -> Dict[str, Any]:
+                result = task(job)
+                # 작업 스레드에는 요청 후 저장(write-through)이 없으므로 여기서 저장.
+                # 다른 워커가 먼저 세션을 저장했으면 작업을 실패로 끝냄 (가져온 내용은 반영되지 않음)
+                if self.session_store.supports_multiprocess and session_id is not None:
+                    try:
+                        self.save_session(session_id, raise_conflict=True)
+                    except SessionConflictError:
+                        raise RuntimeError('Session was modified by another worker; reload and try again')
+                return result
+
+            try:
+                job = self.import_jobs.submit(session_id, kind, run_and_save, cleanup)
+            except ImportQueueFull as e:
+                if cleanup is not None:
+                    cleanup()
+                return jsonify({'error': str(e)}), 429
+            return jsonify({'success': True, 'job': job.to_dict()}), 202
+
+        try:
+            return jsonify(task(ImportJob(session_id, kind)))
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+        finally:
+            if cleanup is not None:
+                cleanup()
+
+    def get_import_target(self, session_id: str, project_id: Optional[str]) -> ProjectManager:
+        """
+        가져오기 결과를 넣을 프로젝트
+
+        작업이 도는 동안 세션이 메모리에서 내려갔으면 다시 로드한다.
+
+        Raises:
+            ValueError: 프로젝트가 삭제된 경우
+        """
+        if self.project_manager is not None:
+            return self.project_manager
+        with self.resident_session(session_id):
+            with self.sessions_lock:
+                pm = self.sessions.get(session_id, {}).get(project_id)
+        if pm is None:
+            raise ValueError("Target project no longer exists")
+        return pm
+
+    def import_postman_upload(self, stream, progress: Optional[Callable[[int, int], None]] = None
+                              ) -> Tuple[RequestFolder, Dict[str, Any]]:
+        """
+        업로드된 Postman Collection / OpenAPI 파일 변환
+
+        JSON 객체로 시작하면 Postman Collection 으로 스트리밍 변환하고,
+        Postman 이 아니거나 YAML 이면 처음부터 다시 읽어 OpenAPI 로 변환한다.
+
+        Args:
+            stream: 업로드 파일 스트림 (seek 가능)
+            progress: 진행 콜백 (변환한 요청 수, 만든 폴더 수)
+
+        Returns:
+            (변환된 폴더, 변환 지표)
+        """
+        from utils.postman_converter import PostmanConverter
+        from utils.openapi_converter import OpenAPIConverter
+
+        metrics = {}
+        head = stream.read(64).lstrip(b'\xef\xbb\xbf \t\r\n')
+        stream.seek(0)
+        if head.startswith(b'{'):
+            imported_folder = PostmanConverter.import_from_stream(stream, metrics, progress)
+            if imported_folder is not None:
+                return imported_folder, metrics
+
+        stream.seek(0)
+        imported_folder = OpenAPIConverter.import_from_content(stream.read(), metrics, progress)
+        return imported_folder, metrics
+
+    def import_postman_data(self, data: Any, progress: Optional[Callable[[int, int], None]] = None) -> RequestFolder:
+        """
+        JSON 본문으로 받은 Postman Collection / OpenAPI 변환
+
+        Args:
+            data: 파싱된 문서 (dict) 또는 YAML/JSON 문자열
+            progress: 진행 콜백 (변환한 요청 수, 만든 폴더 수)
+
+        Raises:
+            ValueError: 데이터가 없거나 형식이 잘못된 경우
+        """
+        from utils.postman_converter import PostmanConverter
+        from utils.openapi_converter import OpenAPIConverter
+
+        if not data:
+            raise ValueError('Data required')
+
+        # 1. Dictionary 인 경우 (JSON으로 파싱된 상태)
+        if isinstance(data, dict):
+            if PostmanConverter.is_postman_collection(data):
+                return PostmanConverter.import_from_postman(data, progress)
+            # JSON 형식의 OpenAPI로 간주
+            return OpenAPIConverter._parse_openapi_data(data, progress=progress)
+
+        # 2. String 인 경우 (YAML 또는 Raw JSON 문자열)
+        if isinstance(data, str):
+            return OpenAPIConverter.import_from_content(data, progress=progress)
+
+        raise ValueError('Invalid data format')
+
+    def project_json_response(self, pm: ProjectManager, build: Callable[[], Any]):
+        """
+        프로젝트 내용으로 만든 JSON 응답 (ETag / If-None-Match 지원)
+
+        ETag 는 프로젝트 버전이므로 클라이언트가 같은 값을 보내면
+        직렬화 없이 304 를 반환한다.
+
+        Args:
+            pm: 응답 내용의 기준 프로젝트
+            build: 응답 데이터를 만드는 함수 (304 가 아닐 때만 호출)
+        """
+        etag = pm.etag()
+        if request.if_none_match.contains_weak(etag):
+            response = self.app.response_class(status=304)
+        else:
+            response = jsonify(build())
+        response.set_etag(etag, weak=True)
+        # 캐시는 하되 매번 재검증
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+
     def update_session_access_time(self, session_id: str):
         """세션 마지막 접근 시간 업데이트"""
         self.session_metadata.setdefault(session_id, {})['last_accessed'] = time.time()
@@ -354,6 +1029,29 @@ class LuminaWebServer:
     def setup_routes(self):
         """라우트 설정"""
 
+        # 요청마다 세션을 (필요하면 저장소에서) 로드하고 최근 사용으로 표시
+        @self.app.before_request
+        def load_request_session():
+            if self.project_manager is None and 'session_id' in session:
+                self.use_request_session(session['session_id'])
+                self.touch_session(session['session_id'])
+
+        @self.app.teardown_request
+        def release_request_session(exc):
+            self.release_request_session()
+
+        # 멀티 프로세스 저장소에서는 변경 요청이 끝나면 바로 저장 (다른 워커가 볼 수 있도록)
+        @self.app.after_request
+        def write_through_session(response):
+            if (self.project_manager is None and self.session_store.supports_multiprocess
+                    and request.method in ('POST', 'PUT', 'PATCH', 'DELETE') and 'session_id' in session):
+                try:
+                    self.save_session(session['session_id'], raise_conflict=True)
+                except SessionConflictError:
+                    response = jsonify({'error': 'Session was modified by another worker; reload and try again'})
+                    response.status_code = 409
+            return response
+
         # 메인 페이지
         @self.app.route('/')
         def index():
@@ -375,8 +1073,8 @@ class LuminaWebServer:
                 session['username'] = payload.get('username')
 
             pm = self.get_session_project_manager()
-            # Persist session immediately
-            self.save_session(session_id)
+            # Persist session immediately (새 세션이면 파일 생성)
+            self.save_session(session_id, force=not self.session_store.has_session(session_id))
 
             resp = jsonify({
                 'success': True,
@@ -403,20 +1101,52 @@ class LuminaWebServer:
             return render_template('api_docs.html')
 
         # API: 프로젝트 정보
+        # ?summary=1 이면 폴더 구조와 요청 ID/이름/메서드만
         @self.app.route('/api/project', methods=['GET'])
         def get_project():
             pm = self.get_session_project_manager()
-            return jsonify({
+            summary = request.args.get('summary', type=int)
+            return self.project_json_response(pm, lambda: {
                 'name': pm.project_name,
-                'folder': pm.root_folder.to_dict()
+                'folder': pm.root_folder.to_summary_dict() if summary else pm.root_folder.to_dict()
             })
 
         # API: 모든 요청 목록
+        # 파라미터 없이 호출하면 기존처럼 전체 목록(배열)을 반환하고,
+        # limit/offset/fields 중 하나라도 주면 페이지 단위로 반환
+        # 예: /api/requests?fields=id,name,method,url&limit=100&offset=200
         @self.app.route('/api/requests', methods=['GET'])
         def get_requests():
             pm = self.get_session_project_manager()
-            requests = pm.get_all_requests()
-            return jsonify([req.to_dict() for req in requests])
+
+            if not any(key in request.args for key in ('limit', 'offset', 'fields')):
+                return self.project_json_response(pm, lambda: [req.to_dict() for req in pm.get_all_requests()])
+
+            fields = None
+            if request.args.get('fields'):
+                fields = [name.strip() for name in request.args['fields'].split(',') if name.strip()]
+                unknown = sorted(set(fields) - self.REQUEST_FIELDS)
+                if unknown:
+                    return jsonify({'error': f"Unknown field(s): {', '.join(unknown)}"}), 400
+
+            limit = min(max(request.args.get('limit', 100, type=int), 1), self.MAX_REQUESTS_PAGE_SIZE)
+            offset = max(request.args.get('offset', 0, type=int), 0)
+
+            def build_page():
+                requests = pm.get_all_requests()
+                items = []
+                for req in requests[offset:offset + limit]:
+                    data = req.to_dict()
+                    items.append(data if fields is None else {name: data[name] for name in fields})
+                return {
+                    'success': True,
+                    'total': len(requests),
+                    'offset': offset,
+                    'count': len(items),
+                    'requests': items
+                }
+
+            return self.project_json_response(pm, build_page)
 
         # API: 특정 요청 조회
         @self.app.route('/api/requests/<request_id>', methods=['GET'])
@@ -438,7 +1168,7 @@ class LuminaWebServer:
             if 'method' in data:
                 new_request.method = HttpMethod(data['method'])
 
-            pm.root_folder.add_request(new_request)
+            pm.add_request(new_request)
             return jsonify(new_request.to_dict()), 201
 
         # API: 요청 수정
@@ -451,6 +1181,14 @@ class LuminaWebServer:
 
             data = request.json
 
+            # 재시도 정책은 다른 필드를 바꾸기 전에 검증
+            retry_policy = None
+            if data.get('retry_policy'):
+                try:
+                    retry_policy = RetryPolicy.from_dict(data['retry_policy'])
+                except ValueError as e:
+                    return jsonify({'error': str(e)}), 400
+
             # 업데이트
             if 'name' in data:
                 req.name = data['name']
@@ -486,7 +1224,10 @@ class LuminaWebServer:
                 req.auth_api_key_location = data['auth_api_key_location']
             if 'documentation' in data:
                 req.documentation = data['documentation']
+            if 'retry_policy' in data:
+                req.retry_policy = retry_policy
 
+            pm.mark_dirty()
             return jsonify(req.to_dict())
 
         # API: 요청 삭제
@@ -498,6 +1239,23 @@ class LuminaWebServer:
                 return jsonify({'success': True})
             return jsonify({'error': 'Request not found'}), 404
 
+        def parse_runtime_upload():
+            """실행 요청의 런타임 데이터 (multipart 로 올라온 폼 필드/파일)"""
+            if 'multipart/form-data' not in (request.content_type or ''):
+                return None, None
+
+            # 폼 데이터 (텍스트)
+            runtime_data = request.form.to_dict()
+
+            # 파일 데이터 - (filename, stream, content_type)
+            # stream은 파일 객체이므로 requests가 읽을 수 있음
+            # 저장된 body_type 이 FORM_DATA 가 아니어도 http_client 가 런타임 파일을 우선 사용
+            runtime_files = {}
+            for key, f in request.files.items():
+                runtime_files[key] = (f.filename, f.stream, f.content_type)
+
+            return runtime_data, runtime_files
+
         # API: 요청 실행
         @self.app.route('/api/requests/<request_id>/execute', methods=['POST'])
         def execute_request(request_id):
@@ -509,54 +1267,245 @@ class LuminaWebServer:
                 return jsonify({'error': 'Request not found'}), 404
 
             # 런타임 데이터 (파일 업로드 등) 확인
-            runtime_data = None
-            runtime_files = None
-            
-            content_type = request.content_type or ''
-            if 'multipart/form-data' in content_type:
-                # 폼 데이터 (텍스트)
-                runtime_data = request.form.to_dict()
-                
-                # 파일 데이터
-                runtime_files = {}
-                for key, f in request.files.items():
-                    # (filename, stream, content_type)
-                    # stream은 파일 객체이므로 requests가 읽을 수 있음
-                    runtime_files[key] = (f.filename, f.stream, f.content_type)
-                    
-                # Store it temporarily for this execution? 
-                # Actually, if we are uploading files, we probably want to override the request's BodyType to FORM_DATA
-                # But let http_client logic handle usage.
-                
-                # Ensure body_type matches if not set (UI should have saved it though)
-                if req.body_type != BodyType.FORM_DATA:
-                    # Temporary override for this execution if UI sent multipart but saved model differs?
-                    # Better to trust the saved model, but http_client logic prefers runtime_files.
-                    pass
-
-            # 요청 실행
-            response = http_client.send_request(req, runtime_data, runtime_files)
+            runtime_data, runtime_files = parse_runtime_upload()
+
+            # 요청 실행 (큰 본문은 메모리 대신 임시 파일에 저장됨)
+            response = http_client.send_request(req, runtime_data, runtime_files, stream=True,
+                                                retry_policy=pm.get_retry_policy(req.id))
 
             # 히스토리에 저장
             history_mgr.add_entry(req, response)
 
-            # 응답 변환
+            return jsonify(self.build_execute_result(response))
+
+        # API: 요청 실행 (Server-Sent Events)
+        # 이벤트: start, dns, connect, tls, sent, headers, chunk (본문 텍스트), progress, complete
+        # complete 는 /execute 와 같은 결과이며, 본문을 chunk 로 모두 보냈으면 body 대신 body_streamed=true
+        @self.app.route('/api/requests/<request_id>/execute/stream', methods=['POST'])
+        def execute_request_stream(request_id):
+            pm = self.get_session_project_manager()
+            http_client = self.get_session_http_client()
+            history_mgr = self.get_session_history_manager()
+            req = pm.find_request_by_id(request_id)
+            if not req:
+                return jsonify({'error': 'Request not found'}), 404
+
+            runtime_data, runtime_files = parse_runtime_upload()
+
+            # 실행 스레드 -> 응답 스트림 (크기 제한으로 느린 클라이언트면 다운로드도 기다림)
+            events = queue.Queue(maxsize=64)
+            cancelled = threading.Event()
+
+            def put_event(item, raise_if_cancelled=True):
+                while True:
+                    try:
+                        events.put(item, timeout=0.5)
+                        return
+                    except queue.Full:
+                        if cancelled.is_set():
+                            if raise_if_cancelled:
+                                raise ConnectionAbortedError("Client disconnected")
+                            return
+
+            def on_event(event, data):
+                if cancelled.is_set():
+                    # 클라이언트 연결이 끊기면 업스트림 요청도 중단
+                    raise ConnectionAbortedError("Client disconnected")
+                put_event((event, data))
+
+            retry_policy = pm.get_retry_policy(req.id)
+
+            def run():
+                # 어떤 경우에도 마지막에 done 을 보내 응답 스트림이 끝나도록 함
+                response = None
+                try:
+                    response = http_client.send_request(req, runtime_data, runtime_files, stream=True,
+                                                        on_event=on_event, retry_policy=retry_policy)
+                except Exception as e:
+                    if not cancelled.is_set():
+                        put_event(('error', {'error': str(e)}), raise_if_cancelled=False)
+                finally:
+                    put_event(('done', response), raise_if_cancelled=False)
+
+            def sse(event, data):
+                return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+            def generate():
+                worker = threading.Thread(target=run, daemon=True)
+                worker.start()
+
+                decoder = None
+                streamed_chars = 0
+                body_complete = True
+                last_progress_ms = 0.0
+
+                try:
+                    while True:
+                        try:
+                            event, data = events.get(timeout=self.STREAM_EVENT_POLL_S)
+                        except queue.Empty:
+                            if worker.is_alive():
+                                # 느린 업스트림 - 연결 유지용 주석 (클라이언트 연결 끊김도 여기서 감지됨)
+                                yield ": keep-alive\n\n"
+                                continue
+                            yield sse('error', {'error': 'Request worker stopped unexpectedly'})
+                            return
+                        if event == 'done':
+                            response = data
+                            break
+
+                        if event == 'headers':
+                            try:
+                                decoder = codecs.getincrementaldecoder(data['encoding'])(errors='replace')
+                            except LookupError:
+                                decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+                            yield sse(event, data)
+                        elif event == 'chunk':
+                            if body_complete:
+                                text = decoder.decode(data['data'])
+                                room = self.STREAM_BODY_CHARS - streamed_chars
+                                if len(text) > room:
+                                    text = text[:room]
+                                    body_complete = False
+                                streamed_chars += len(text)
+                                if text:
+                                    yield sse('chunk', {'text': text, 'received': data['received'],
+                                                        'elapsed_ms': data['elapsed_ms']})
+                            elif data['elapsed_ms'] - last_progress_ms >= self.STREAM_PROGRESS_INTERVAL_MS:
+                                # 이벤트로 보낼 만큼 보낸 뒤에는 받은 크기만 주기적으로 알림
+                                last_progress_ms = data['elapsed_ms']
+                                yield sse('progress', {'received': data['received'], 'elapsed_ms': data['elapsed_ms']})
+                        else:
+                            yield sse(event, data)
+
+                    # 실행 중 예외 - error 이벤트는 이미 보냄
+                    if response is None:
+                        return
+
+                    if decoder is not None and body_complete:
+                        tail = decoder.decode(b'', final=True)
+                        if tail:
+                            yield sse('chunk', {'text': tail, 'received': response.size_bytes,
+                                                'elapsed_ms': response.elapsed_ms})
+
+                    history_mgr.add_entry(req, response)
+
+                    result = self.build_execute_result(response)
+                    if decoder is not None and body_complete and not response.error:
+                        del result['body']
+                        result['body_streamed'] = True
+                    yield sse('complete', result)
+                finally:
+                    cancelled.set()
+
+            return Response(
+                stream_with_context(generate()),
+                mimetype='text/event-stream',
+                headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+            )
+
+        # API: 큰 응답 본문 다운로드 (스트리밍)
+        @self.app.route('/api/responses/<response_id>/body', methods=['GET'])
+        def get_response_body(response_id):
+            response = self.get_large_response(response_id)
+            if not response or not response.is_spilled():
+                return jsonify({'error': 'Response body not found'}), 404
+
+            headers = {'Content-Length': str(response.size_bytes)}
+            if request.args.get('download'):
+                headers['Content-Disposition'] = f'attachment; filename="response-{response.id}"'
+
+            return Response(
+                response.iter_body(),
+                mimetype=response.content_type or 'application/octet-stream',
+                headers=headers
+            )
+
+        # API: 연결 풀 상태 (현재 세션 클라이언트가 요청한 호스트별 열린/유휴 연결 수)
+        @self.app.route('/api/pool/stats', methods=['GET'])
+        def get_pool_stats():
+            http_client = self.get_session_http_client()
             return jsonify({
-                'status_code': response.status_code,
-                'status_text': response.status_text,
-                'headers': response.headers,
-                'body': response.body,
-                'elapsed_ms': response.elapsed_ms,
-                'size_bytes': response.size_bytes,
-                'error': response.error,
-                'content_type': response.content_type
+                'success': True,
+                'shared': self.shared_http_adapter is not None and http_client.adapter is self.shared_http_adapter,
+                'hosts': http_client.get_pool_stats(),
+                'clients': self.http_clients.get_metrics()
             })
 
+        # API: 요청 부하 테스트
+        @self.app.route('/api/requests/<request_id>/loadtest', methods=['POST'])
+        def loadtest_request(request_id):
+            pm = self.get_session_project_manager()
+            http_client = self.get_session_http_client()
+            req = pm.find_request_by_id(request_id)
+            if not req:
+                return jsonify({'error': 'Request not found'}), 404
+
+            data = request.json or {}
+            try:
+                rps = float(data.get('rps', 10))
+                duration_s = float(data.get('duration', 10))
+                ramp_from = data.get('ramp_from')
+                ramp_from = float(ramp_from) if ramp_from not in (None, '') else None
+                max_concurrency = int(data.get('max_concurrency', 50))
+            except (TypeError, ValueError):
+                return jsonify({'error': 'Invalid load test parameters'}), 400
+
+            if not (0 < rps <= self.MAX_LOADTEST_RPS) or not (0 < duration_s <= self.MAX_LOADTEST_DURATION_S):
+                return jsonify({
+                    'error': f'rps must be in (0, {self.MAX_LOADTEST_RPS}] and '
+                             f'duration in (0, {self.MAX_LOADTEST_DURATION_S}] seconds'
+                }), 400
+
+            result = http_client.run_load_test(
+                req, rps, duration_s,
+                ramp_from_rps=ramp_from,
+                max_concurrency=min(max(1, max_concurrency), self.MAX_LOADTEST_CONCURRENCY)
+            )
+            return jsonify(result.to_dict())
+
+        # API: 폴더(컬렉션) 전체 실행
+        @self.app.route('/api/folders/<folder_id>/run', methods=['POST'])
+        def run_folder(folder_id):
+            pm = self.get_session_project_manager()
+            http_client = self.get_session_http_client()
+            history_mgr = self.get_session_history_manager()
+            folder = pm.find_folder_by_id(folder_id)
+            if not folder:
+                return jsonify({'error': 'Folder not found'}), 404
+
+            data = request.json or {}
+            # async 모드는 이벤트 루프 하나로 처리하므로 더 많은 동시 요청 허용
+            use_async = data.get('mode') == 'async'
+            worker_cap = self.MAX_ASYNC_RUNNER_CONCURRENCY if use_async else self.MAX_RUNNER_WORKERS
+            try:
+                max_workers = int(data.get('max_workers', CollectionRunner.DEFAULT_MAX_WORKERS))
+                per_host_limit = int(data.get('per_host_limit', CollectionRunner.DEFAULT_PER_HOST_LIMIT))
+            except (TypeError, ValueError):
+                return jsonify({'error': 'Invalid run parameters'}), 400
+            if max_workers < 1 or per_host_limit < 1:
+                return jsonify({'error': 'max_workers and per_host_limit must be positive integers'}), 400
+            max_workers = min(max_workers, worker_cap)
+
+            runner = CollectionRunner(http_client, max_workers=max_workers, per_host_limit=per_host_limit,
+                                      retry_policy_for=lambda req: pm.get_retry_policy(req.id))
+            requests_to_run = pm.get_all_requests(folder)
+            report = runner.run_async(requests_to_run) if use_async else runner.run(requests_to_run)
+
+            # 히스토리에 저장
+            for result in report.results:
+                history_mgr.add_entry(result.request, result.response)
+
+            result = report.to_dict()
+            result['folder_id'] = folder.id
+            result['folder_name'] = folder.name
+            return jsonify(result)
+
         # API: 환경 목록
         @self.app.route('/api/environments', methods=['GET'])
         def get_environments():
             pm = self.get_session_project_manager()
-            return jsonify([env.to_dict() for env in pm.env_manager.environments])
+            return self.project_json_response(pm, lambda: [env.to_dict() for env in pm.env_manager.environments])
 
         # API: 활성 환경
         @self.app.route('/api/environments/active', methods=['GET'])
@@ -574,6 +1523,7 @@ class LuminaWebServer:
             env_id = data.get('environment_id')
             if env_id:
                 pm.env_manager.set_active(env_id)
+                pm.mark_dirty()
                 return jsonify({'success': True})
             return jsonify({'error': 'Invalid environment ID'}), 400
 
@@ -592,6 +1542,7 @@ class LuminaWebServer:
 
             # 기존 변수 모두 삭제하고 새로운 것으로 교체
             pm.env_manager.global_environment.variables = constants
+            pm.mark_dirty()
             return jsonify({'success': True})
 
         # API: 프로젝트 저장
@@ -601,7 +1552,8 @@ class LuminaWebServer:
             data = request.json
             file_path = data.get('file_path', 'project.json')
             try:
-                pm.save_to_file(file_path)
+                # 세션 자동 저장과는 별개인 내보내기이므로 dirty 상태는 유지
+                pm.save_to_file(file_path, mark_saved=False)
                 return jsonify({'success': True, 'file_path': file_path})
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
@@ -628,6 +1580,7 @@ class LuminaWebServer:
                         self.sessions[session_id] = {}
                     self.sessions[session_id][project_id] = pm
                     self.active_projects[session_id] = project_id
+                    self.dirty_sessions.add(session_id)
 
                 return jsonify({
                     'success': True,
@@ -639,36 +1592,48 @@ class LuminaWebServer:
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
 
-        # API: Insomnia 임포트
+        # API: Insomnia 임포트 (?background=1 이면 가져오기 작업으로 실행)
         @self.app.route('/api/import/insomnia', methods=['POST'])
         def import_insomnia():
-            pm = self.get_session_project_manager()
-            data = request.json
-            insomnia_data = data.get('data')
-            if not insomnia_data:
-                return jsonify({'error': 'Insomnia data required'}), 400
+            self.get_session_project_manager()
+            session_id = session.get('session_id')
+            project_id = self.active_projects.get(session_id)
+
+            background = request.args.get('background') == '1'
+            if background:
+                # 큰 export 의 JSON 파싱도 작업 스레드에서 하도록 본문만 읽어 둠
+                body = request.get_data()
+            else:
+                insomnia_data = (request.json or {}).get('data')
+                if not insomnia_data:
+                    return jsonify({'error': 'Insomnia data required'}), 400
+
+            def task(job: ImportJob) -> Dict[str, Any]:
+                data = json.loads(body).get('data') if background else insomnia_data
+                if not data:
+                    raise ValueError('Insomnia data required')
 
-            try:
                 from utils.insomnia_converter import InsomniaConverter
-                imported_folder, global_vars = InsomniaConverter.import_from_insomnia(insomnia_data)
+                job.set_stage('converting')
+                imported_folder, global_vars = InsomniaConverter.import_from_insomnia(data, job.progress)
 
+                job.set_stage('applying')
+                pm = self.get_import_target(session_id, project_id)
                 # 폴더 추가
-                pm.root_folder.add_folder(imported_folder)
-                
+                pm.add_folder(imported_folder)
+
                 # 전역 변수 업데이트
                 if global_vars:
                     pm.env_manager.global_environment.variables.update(global_vars)
+                    pm.mark_dirty()
 
-                # 모든 요청 개수 계산
-                all_requests = pm.get_all_requests()
-
-                return jsonify({
+                return {
                     'success': True,
-                    'imported_count': len(imported_folder.requests),
+                    'imported_count': job.operations,
                     'folder_name': imported_folder.name
-                })
-            except Exception as e:
-                return jsonify({'error': str(e)}), 500
+                }
+
+            return self.run_import('insomnia', task)
 
 
         # API: Insomnia 내보내기
@@ -686,55 +1651,61 @@ class LuminaWebServer:
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
 
-        # API: Postman/OpenAPI 임포트 (통합)
+        # API: Postman/OpenAPI 임포트 (통합, ?background=1 이면 가져오기 작업으로 실행)
         @self.app.route('/api/import/postman', methods=['POST'])
         def import_postman():
-            pm = self.get_session_project_manager()
-            req_data = request.json
-            data = req_data.get('data')
-            if not data:
-                return jsonify({'error': 'Data required'}), 400
+            self.get_session_project_manager()
+            session_id = session.get('session_id')
+            project_id = self.active_projects.get(session_id)
+            background = request.args.get('background') == '1'
+
+            # 파일 업로드 (multipart): 업로드 스트림을 그대로 파싱 (큰 파일은 임시 파일로 받음)
+            upload = request.files.get('file')
+            upload_path = body = data = None
+            if upload is not None:
+                if background:
+                    # 요청이 끝나면 업로드 스트림이 닫히므로 작업용 임시 파일로 옮겨 둠
+                    with tempfile.NamedTemporaryFile(prefix='lumina_import_', delete=False) as spool:
+                        upload.save(spool)
+                    upload_path = spool.name
+            elif background:
+                body = request.get_data()
+            else:
+                data = (request.json or {}).get('data')
+                if not data:
+                    return jsonify({'error': 'Data required'}), 400
+                if not isinstance(data, (dict, str)):
+                    return jsonify({'error': 'Invalid data format'}), 400
 
-            try:
-                imported_folder = None
-                
-                # 1. Dictionary 인 경우 (JSON으로 파싱된 상태)
-                if isinstance(data, dict):
-                    # Postman 확인
-                    is_postman = 'info' in data and ('_postman_id' in data['info'] or 'schema' in data.get('info', {}))
-                    
-                    if is_postman:
-                        from utils.postman_converter import PostmanConverter
-                        imported_folder = PostmanConverter.import_from_postman(data)
-                    else:
-                        # JSON 형식의 OpenAPI로 간주
-                        from utils.openapi_converter import OpenAPIConverter
-                        imported_folder = OpenAPIConverter._parse_openapi_data(data)
-                        
-                # 2. String 인 경우 (YAML 또는 Raw JSON 문자열)
-                elif isinstance(data, str):
-                    from utils.openapi_converter import OpenAPIConverter
-                    imported_folder = OpenAPIConverter.import_from_content(data)
-                
+            def task(job: ImportJob) -> Dict[str, Any]:
+                job.set_stage('converting')
+                metrics = None
+                if upload_path is not None:
+                    with open(upload_path, 'rb') as f:
+                        imported_folder, metrics = self.import_postman_upload(f, job.progress)
+                elif upload is not None:
+                    imported_folder, metrics = self.import_postman_upload(upload.stream, job.progress)
                 else:
-                    return jsonify({'error': 'Invalid data format'}), 400
+                    payload = json.loads(body).get('data') if body is not None else data
+                    imported_folder = self.import_postman_data(payload, job.progress)
 
-                if imported_folder:
-                    # 폴더 추가
-                    pm.root_folder.add_folder(imported_folder)
+                job.set_stage('applying')
+                pm = self.get_import_target(session_id, project_id)
+                pm.add_folder(imported_folder)
 
-                    return jsonify({
-                        'success': True,
-                        'imported_count': len(imported_folder.requests),
-                        'folder_name': imported_folder.name
-                    })
-                else:
-                     return jsonify({'error': 'Failed to parse import data'}), 400
-                     
-            except Exception as e:
-                return jsonify({'error': str(e)}), 500
+                result = {
+                    'success': True,
+                    'imported_count': job.operations,
+                    'folder_name': imported_folder.name
+                }
+                if metrics is not None:
+                    result['metrics'] = metrics
+                return result
+
+            cleanup = (lambda: os.unlink(upload_path)) if upload_path is not None else None
+            return self.run_import('postman', task, cleanup)
 
-        # API: OpenAPI 임포트
+        # API: OpenAPI 임포트 (?background=1 이면 가져오기 작업으로 실행)
         @self.app.route('/api/import/openapi', methods=['POST'])
         def import_openapi():
             # Ensure session is initialized
@@ -749,25 +1720,26 @@ class LuminaWebServer:
             if not url and not content:
                 return jsonify({'error': 'URL or content is required'}), 400
 
-            try:
+            def task(job: ImportJob) -> Dict[str, Any]:
+                source = content
                 # Fetch from URL when provided
                 if url:
+                    job.set_stage('fetching')
                     import requests
                     resp = requests.get(url, timeout=15)
                     resp.raise_for_status()
-                    content = resp.text
+                    # 디코딩 없이 바이트 그대로 파싱
+                    source = resp.content
 
                 from utils.openapi_converter import OpenAPIConverter
-                imported_folder = OpenAPIConverter.import_from_content(content)
+                job.set_stage('converting')
+                metrics = {}
+                imported_folder = OpenAPIConverter.import_from_content(source, metrics, job.progress)
                 project_name = imported_folder.name or "Imported API"
 
-                def _count_requests(folder):
-                    count = len(folder.requests)
-                    for sub in folder.folders:
-                        count += _count_requests(sub)
-                    return count
-
-                with self.sessions_lock:
+                job.set_stage('applying')
+                # 작업 중 세션이 메모리에서 내려갔을 수 있으므로 로드된 상태에서 반영
+                with self.resident_session(session_id), self.sessions_lock:
                     self.sessions.setdefault(session_id, {})
 
                     # Find existing project by title (exact match)
@@ -789,28 +1761,53 @@ class LuminaWebServer:
 
                     # Replace existing folder with the same name or append
                     replaced = False
-                    for idx, folder in enumerate(pm.root_folder.folders):
+                    for folder in pm.root_folder.folders:
                         if folder.name == imported_folder.name:
-                            pm.root_folder.folders[idx] = imported_folder
-                            replaced = True
+                            replaced = pm.replace_folder(folder.id, imported_folder)
                             break
 
                     if not replaced:
-                        pm.root_folder.add_folder(imported_folder)
+                        pm.add_folder(imported_folder)
 
                     # Make the imported project active
                     self.active_projects[session_id] = target_project_id
+                    self.dirty_sessions.add(session_id)
 
-                return jsonify({
+                return {
                     'success': True,
-                    'imported_count': _count_requests(imported_folder),
+                    'imported_count': metrics['operations'],
                     'folder_name': imported_folder.name,
                     'project_name': project_name,
                     'project_id': target_project_id,
-                    'action': action
-                })
-            except Exception as e:
-                return jsonify({'error': str(e)}), 500
+                    'action': action,
+                    'metrics': metrics
+                }
+
+            return self.run_import('openapi', task)
+
+        # API: 가져오기 작업 목록 (현재 세션)
+        @self.app.route('/api/import/jobs', methods=['GET'])
+        def list_import_jobs():
+            jobs = self.import_jobs.list_jobs(session.get('session_id'))
+            return jsonify({'jobs': [job.to_dict() for job in jobs]})
+
+        # API: 가져오기 작업 상태 (진행 상황, 결과)
+        @self.app.route('/api/import/jobs/<job_id>', methods=['GET'])
+        def get_import_job(job_id):
+            job = self.import_jobs.get(job_id, session.get('session_id'))
+            if job is None:
+                return jsonify({'error': 'Import job not found'}), 404
+            return jsonify(job.to_dict())
+
+        # API: 가져오기 작업 취소
+        @self.app.route('/api/import/jobs/<job_id>/cancel', methods=['POST'])
+        def cancel_import_job(job_id):
+            job = self.import_jobs.get(job_id, session.get('session_id'))
+            if job is None:
+                return jsonify({'error': 'Import job not found'}), 404
+            if not job.cancel():
+                return jsonify({'error': f'Import job already {job.status}', 'job': job.to_dict()}), 409
+            return jsonify({'success': True, 'job': job.to_dict()})
 
         # API: Postman 내보내기
         @self.app.route('/api/export/postman', methods=['GET'])
@@ -830,24 +1827,39 @@ class LuminaWebServer:
         # API: 히스토리 조회
         @self.app.route('/api/history/<request_id>', methods=['GET'])
         def get_history(request_id):
+            try:
+                filters = self.parse_history_filters(default_limit=20)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+
             history_mgr = self.get_session_history_manager()
-            limit = request.args.get('limit', 20, type=int)
-            history = history_mgr.get_history(request_id, limit)
+            total, history = history_mgr.query(request_id=request_id, **filters)
             return jsonify({
                 'success': True,
                 'request_id': request_id,
+                'total': total,
+                'offset': filters['offset'],
                 'count': len(history),
                 'history': history
             })
 
-        # API: 전체 히스토리 조회
+        # API: 히스토리 조회 (프로젝트 전체, 필터/페이지 단위)
+        # ?request_id=&status=404|4xx&method=GET&since=&until=&limit=50&offset=0
         @self.app.route('/api/history', methods=['GET'])
         def get_all_history():
+            try:
+                filters = self.parse_history_filters(default_limit=50)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+
             history_mgr = self.get_session_history_manager()
-            all_history = history_mgr.get_all_histories()
+            total, entries = history_mgr.query(request_id=request.args.get('request_id') or None, **filters)
             return jsonify({
                 'success': True,
-                'histories': all_history
+                'total': total,
+                'offset': filters['offset'],
+                'count': len(entries),
+                'entries': entries
             })
 
         # API: 히스토리 삭제
@@ -937,6 +1949,7 @@ class LuminaWebServer:
                 self.sessions[session_id][project_id] = pm
                 # Make the new project active immediately
                 self.active_projects[session_id] = project_id
+                self.dirty_sessions.add(session_id)
 
                 return jsonify({
                     'success': True,
@@ -967,6 +1980,7 @@ class LuminaWebServer:
 
                 pm = self.sessions[session_id][project_id]
                 pm.project_name = new_name
+                pm.mark_dirty()
 
                 return jsonify({
                     'success': True,
@@ -988,20 +2002,18 @@ class LuminaWebServer:
                 if session_id not in self.sessions or project_id not in self.sessions[session_id]:
                     return jsonify({'error': 'Project not found'}), 404
 
-                # 프로젝트 삭제
+                # 프로젝트 삭제 (저장소에서도 삭제하도록 기록)
                 del self.sessions[session_id][project_id]
+                self._removed_projects.setdefault(session_id, set()).add(project_id)
+                self.dirty_sessions.add(session_id)
 
                 # 히스토리도 삭제
                 if session_id in self.histories and project_id in self.histories[session_id]:
                     del self.histories[session_id][project_id]
+                self.history_store.clear(session_id, project_id)
 
                 # HTTP 클라이언트도 삭제
-                if session_id in self.http_clients and project_id in self.http_clients[session_id]:
-                    try:
-                        self.http_clients[session_id][project_id].close()
-                    except:
-                        pass
-                    del self.http_clients[session_id][project_id]
+                self.http_clients.remove((session_id, project_id))
 
                 # 활성 프로젝트였다면 다른 프로젝트로 전환 또는 None으로
                 if self.active_projects.get(session_id) == project_id:
@@ -1028,6 +2040,7 @@ class LuminaWebServer:
 
                 # 활성 프로젝트 전환
                 self.active_projects[session_id] = project_id
+                self.dirty_sessions.add(session_id)
                 pm = self.sessions[session_id][project_id]
 
                 return jsonify({
@@ -1039,12 +2052,14 @@ class LuminaWebServer:
                 })
 
         # API: 폴더 트리 구조 조회
+        # ?summary=1 이면 폴더 구조와 요청 ID/이름/메서드만 (웹 UI 트리용)
         @self.app.route('/api/folders/tree', methods=['GET'])
         def get_folder_tree():
             pm = self.get_session_project_manager()
-            return jsonify({
+            summary = request.args.get('summary', type=int)
+            return self.project_json_response(pm, lambda: {
                 'success': True,
-                'tree': pm.root_folder.to_dict()
+                'tree': pm.root_folder.to_summary_dict() if summary else pm.root_folder.to_dict()
             })
 
         # API: 새 폴더 생성
@@ -1057,22 +2072,25 @@ class LuminaWebServer:
 
             new_folder = RequestFolder(folder_name)
 
+            parent_folder = None
             if parent_id:
                 # 부모 폴더 찾기
                 parent_folder = pm.find_folder_by_id(parent_id)
                 if not parent_folder:
                     return jsonify({'error': 'Parent folder not found'}), 404
-                parent_folder.add_folder(new_folder)
-            else:
-                # 루트에 추가
-                pm.root_folder.add_folder(new_folder)
+
+            # parent_folder 가 None 이면 루트에 추가
+            try:
+                pm.add_folder(new_folder, parent_folder)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
 
             return jsonify({
                 'success': True,
                 'folder': new_folder.to_dict()
             }), 201
 
-        # API: 폴더 이름 수정
+        # API: 폴더 수정 (이름, 재시도 정책)
         @self.app.route('/api/folders/<folder_id>', methods=['PUT'])
         def update_folder(folder_id):
             pm = self.get_session_project_manager()
@@ -1082,8 +2100,15 @@ class LuminaWebServer:
                 return jsonify({'error': 'Folder not found'}), 404
 
             data = request.json
+            if 'retry_policy' in data:
+                try:
+                    folder.retry_policy = RetryPolicy.from_dict(data['retry_policy']) if data['retry_policy'] else None
+                except ValueError as e:
+                    return jsonify({'error': str(e)}), 400
+                pm.mark_dirty()
             if 'name' in data:
                 folder.name = data['name']
+                pm.mark_dirty()
 
             return jsonify({
                 'success': True,
@@ -1120,7 +2145,7 @@ class LuminaWebServer:
             if 'method' in data:
                 new_request.method = HttpMethod(data['method'])
 
-            folder.add_request(new_request)
+            pm.add_request(new_request, folder)
 
             return jsonify({
                 'success': True,
@@ -1142,18 +2167,15 @@ class LuminaWebServer:
             if not target_folder:
                 return jsonify({'error': 'Target folder not found'}), 404
 
-            # 요청 찾기 및 제거
+            # 요청 찾기
             req = pm.find_request_by_id(request_id)
             if not req:
                 return jsonify({'error': 'Request not found'}), 404
 
-            # 현재 폴더에서 제거
-            if not pm.remove_request_recursive(request_id):
+            # 현재 폴더에서 타겟 폴더로 이동
+            if not pm.move_request(request_id, target_folder):
                 return jsonify({'error': 'Failed to remove request from current folder'}), 500
 
-            # 타겟 폴더에 추가
-            target_folder.add_request(req)
-
             return jsonify({
                 'success': True,
                 'request': req.to_dict()
@@ -1180,16 +2202,17 @@ class LuminaWebServer:
                 return jsonify({'error': 'Parent folder not found'}), 404
 
             # 자기 자신의 하위로 이동 방지 (순환 참조)
-            if pm.is_descendant(parent_id, folder_id):
+            if parent_id == folder_id or pm.is_descendant(parent_id, folder_id):
                 return jsonify({'error': 'Cannot move folder into its own descendant'}), 400
 
-            # 현재 위치에서 제거
-            if not pm.remove_folder_recursive(folder_id):
+            # 현재 위치에서 새 위치로 이동
+            try:
+                moved = pm.move_folder(folder_id, parent_folder)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            if not moved:
                 return jsonify({'error': 'Failed to remove folder from current location'}), 500
 
-            # 새 위치에 추가
-            parent_folder.add_folder(folder)
-
             return jsonify({
                 'success': True,
                 'folder': folder.to_dict()
@@ -1275,6 +2298,7 @@ class LuminaWebServer:
                         self.sessions[session_id] = {}
                     self.sessions[session_id][project_id] = pm
                     self.active_projects[session_id] = project_id
+                    self.dirty_sessions.add(session_id)
 
                 return jsonify({
                     'success': True,
@@ -1342,7 +2366,8 @@ class LuminaWebServer:
 
     def _run_server(self):
         """서버 실행 (내부 메서드)"""
-        self.app.run(host=self.host, port=self.port, debug=False, use_reloader=False)
+        from web.wsgi import serve
+        serve(self.app, host=self.host, port=self.port)
 
     def stop(self):
         """서버 중지"""
@@ -1351,18 +2376,30 @@ class LuminaWebServer:
 
         # 모든 세션 데이터 저장
         self.save_all_sessions()
+        self.session_store.close()
+        self.history_store.close()
+        self.http_clients.close_all()
+        self.import_jobs.shutdown()
+        if self.import_job_store is not None:
+            self.import_job_store.close()
+        if self.shared_http_adapter is not None:
+            self.shared_http_adapter.close()
 
         print("Lumina Web Server stopped")
 
 
 def main():
-    """웹 서버 단독 실행"""
+    """웹 서버 단독 실행 (LUMINA_DEBUG=1 이면 Flask 개발 서버)"""
     server = LuminaWebServer(host='0.0.0.0', port=15555)
     server.is_running = True  # 자동 저장/정리 스레드 활성화
     print(f"✨ Starting Lumina Web Server...")
     print(f"Access at: http://localhost:15555")
     try:
-        server.app.run(host=server.host, port=server.port, debug=True)
+        if os.environ.get('LUMINA_DEBUG') == '1':
+            server.app.run(host=server.host, port=server.port, debug=True)
+        else:
+            from web.wsgi import serve
+            serve(server.app, host=server.host, port=server.port)
     finally:
         server.stop()
 
@@ -0,0 +1,67 @@
+"""
+Lumina WSGI 진입점
+운영 환경용 WSGI 앱 팩토리와 서버 실행 함수
+
+gunicorn 예:
+    LUMINA_SESSION_STORE=sqlite gunicorn -w 4 --threads 8 -b 0.0.0.0:15555 'web.wsgi:create_app()'
+"""
+import os
+import sys
+from typing import Optional
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from core.session_store import SessionStore
+from web.web_server import LuminaWebServer
+
+
+DEFAULT_THREADS = 8  # 프로세스당 요청 처리 스레드 수
+
+
+def create_app(session_store: Optional[SessionStore] = None) -> Flask:
+    """
+    WSGI 앱 생성
+
+    백그라운드 스레드(자동 저장/세션 정리)는 생성 시점이 아니라 각 프로세스의
+    첫 요청에서 시작하므로, prefork 서버가 앱을 만든 뒤 fork 해도 워커마다
+    한 번씩만 실행된다. 여러 워커를 쓰려면 멀티 프로세스 세션 저장소
+    (LUMINA_SESSION_STORE=sqlite) 가 필요하다.
+
+    Args:
+        session_store: 세션 저장소 (None이면 LUMINA_SESSION_STORE 설정 사용)
+
+    Returns:
+        Flask 앱 (app.extensions['lumina'] 에 LuminaWebServer 인스턴스)
+    """
+    server = LuminaWebServer(session_store=session_store, start_background_tasks=False)
+    app = server.app
+    app.extensions['lumina'] = server
+
+    @app.before_request
+    def start_background_tasks():
+        server.start_background_tasks()
+
+    return app
+
+
+def serve(app: Flask, host: str = '127.0.0.1', port: int = 15555, threads: int = DEFAULT_THREADS):
+    """
+    단일 프로세스 멀티 스레드 서버로 실행 (waitress 가 있으면 사용)
+
+    Args:
+        app: WSGI 앱
+        host: 바인드 주소
+        port: 포트
+        threads: 요청 처리 스레드 수
+    """
+    try:
+        from waitress import serve as waitress_serve
+    except ImportError:
+        # waitress 가 없으면 werkzeug 스레드 서버 (디버거/리로더 비활성화)
+        from werkzeug.serving import run_simple
+        run_simple(host, port, app, threaded=True, use_reloader=False, use_debugger=False)
+        return
+
+    waitress_serve(app, host=host, port=port, threads=threads)
@@ -35,6 +35,8 @@ def __init_with_persistence__(self, host='127.0.0.1', port=5000):
         default_session = 'default'
         with self.sessions_lock:
             self.sessions[default_session] = persisted_projects
+            # Shared by every new session, so never evict it to disk
+            self.pinned_sessions.add(default_session)
             # Set first project as active
             self.active_projects[default_session] = list(persisted_projects.keys())[0]
         print(f"✓ Loaded {len(persisted_projects)} project(s)")
@@ -61,8 +63,8 @@ def __init_with_persistence__(self, host='127.0.0.1', port=5000):
         
         session_id = flask_session['session_id']
         
-        with self.sessions_lock:
-            # Initialize session with new session if new
+        # Load a stored session first; only brand-new sessions share the defaults
+        with self.resident_session(session_id), self.sessions_lock:
             if session_id not in self.sessions:
                 self.sessions[session_id] = {}
                 
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Lumina Web Server - Production Mode
+
+Flask 개발 서버 대신 운영용 WSGI 서버로 웹 인터페이스를 실행합니다.
+
+- gunicorn 이 설치되어 있으면 멀티 프로세스(--workers) x 멀티 스레드(--threads)
+- 없으면 waitress (단일 프로세스 멀티 스레드), 둘 다 없으면 werkzeug 스레드 서버
+
+워커가 2개 이상이면 세션을 프로세스 간에 공유해야 하므로
+LUMINA_SESSION_STORE 가 지정되지 않은 경우 SQLite 저장소를 사용합니다.
+
+사용 예:
+    python web_server_production.py --workers 4 --threads 8
+    python web_server_production.py --server waitress --threads 16
+"""
+
+import argparse
+import os
+import sys
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from web.wsgi import DEFAULT_THREADS
+
+
+def parse_args(argv=None):
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="Run the Lumina web interface on a production WSGI server.")
+    parser.add_argument('--host', default='0.0.0.0', help="Bind address (default: %(default)s)")
+    parser.add_argument('--port', type=int, default=15555, help="Port (default: %(default)s)")
+    parser.add_argument('--workers', type=int, default=(os.cpu_count() or 1) * 2 + 1,
+                        help="Worker processes, gunicorn only (default: %(default)s)")
+    parser.add_argument('--threads', type=int, default=DEFAULT_THREADS,
+                        help="Threads per worker (default: %(default)s)")
+    parser.add_argument('--server', choices=['auto', 'gunicorn', 'waitress'], default='auto',
+                        help="WSGI server to use (default: %(default)s)")
+    return parser.parse_args(argv)
+
+
+def run_gunicorn(host: str, port: int, workers: int, threads: int):
+    """gunicorn 으로 실행 (각 워커가 앱을 직접 생성)"""
+    from gunicorn.app.base import BaseApplication
+
+    def save_on_worker_exit(arbiter, worker):
+        # 워커 종료 시 남은 변경 사항 저장
+        app = getattr(worker, 'wsgi', None)
+        if app is not None and 'lumina' in app.extensions:
+            app.extensions['lumina'].stop()
+
+    class LuminaApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set('bind', f'{host}:{port}')
+            self.cfg.set('workers', workers)
+            self.cfg.set('threads', threads)
+            self.cfg.set('worker_class', 'gthread')
+            # 실행/부하 테스트 요청은 오래 걸릴 수 있음
+            self.cfg.set('timeout', 600)
+            self.cfg.set('worker_exit', save_on_worker_exit)
+
+        def load(self):
+            from web.wsgi import create_app
+            return create_app()
+
+    LuminaApplication().run()
+
+
+def main(argv=None) -> int:
+    """런처 메인 함수"""
+    args = parse_args(argv)
+
+    server = args.server
+    if server == 'auto':
+        try:
+            import gunicorn  # noqa: F401
+            server = 'gunicorn'
+        except ImportError:
+            server = 'waitress'
+
+    workers = max(1, args.workers) if server == 'gunicorn' else 1
+    if workers > 1 and not os.environ.get('LUMINA_SESSION_STORE'):
+        os.environ['LUMINA_SESSION_STORE'] = 'sqlite'
+    elif workers > 1 and os.environ['LUMINA_SESSION_STORE'] == 'json':
+        print("JSON session store cannot be shared between workers; use LUMINA_SESSION_STORE=sqlite",
+              file=sys.stderr)
+        return 2
+
+    print("=" * 60)
+    print("✨ Lumina Web Server - Production Mode")
+    print("=" * 60)
+    print(f"Server:   {server} ({workers} worker(s) x {args.threads} thread(s))")
+    print(f"Sessions: {os.environ.get('LUMINA_SESSION_STORE', 'json')}")
+    print(f"Access at: http://{args.host}:{args.port}")
+    print("=" * 60)
+
+    if server == 'gunicorn':
+        run_gunicorn(args.host, args.port, workers, args.threads)
+        return 0
+
+    from web.wsgi import create_app, serve
+    app = create_app()
+    try:
+        serve(app, host=args.host, port=args.port, threads=args.threads)
+    finally:
+        app.extensions['lumina'].stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())